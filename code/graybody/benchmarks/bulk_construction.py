@@ -0,0 +1,62 @@
+"""
+Graybody.from_arrays (one vectorized range check, no per-instance validation)
+against the validated constructor called once per object.
+
+Usage:
+    python3 benchmarks/bulk_construction.py [--objects N] [--repeat R]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from graybody import Graybody, GraybodyArray
+
+
+def best_time(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--objects", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    T = rng.uniform(250.0, 330.0, args.objects)
+    eps = rng.uniform(0.0, 1.0, args.objects)
+
+    def validated():
+        return [
+            Graybody(absolute_temperature=t, emissivity=e)
+            for t, e in zip(T.tolist(), eps.tolist())
+        ]
+
+    cases = {
+        "Graybody(...) per object": validated,
+        "Graybody.from_arrays": lambda: Graybody.from_arrays(absolute_temperature=T, emissivity=eps),
+        "from_arrays(pause_gc=True)": lambda: Graybody.from_arrays(
+            pause_gc=True, absolute_temperature=T, emissivity=eps
+        ),
+        "GraybodyArray (no objects)": lambda: GraybodyArray(absolute_temperature=T, emissivity=eps),
+    }
+    baseline = None
+    print(f"{args.objects} objects, best of {args.repeat}")
+    print(f"{'constructor':<28} {'time [s]':>10} {'us/object':>10} {'speedup':>8}")
+    for name, fn in cases.items():
+        elapsed = best_time(fn, args.repeat)
+        baseline = baseline or elapsed
+        print(
+            f"{name:<28} {elapsed:10.4f} {elapsed / args.objects * 1e6:10.3f} "
+            f"{baseline / elapsed:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Thread-pool scaling of graybody.ParallelEvaluator against the serial path.
+
+Usage:
+    python3 benchmarks/parallel_scaling.py [--pixels N] [--bands B] [--chunk C]
+
+For each worker count (1, 2, 4, ... up to the core count) the best of
+--repeat runs is reported with its speedup over the serial kernel and the
+parallel efficiency (speedup / workers).
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+
+from graybody import Blackbody, GraybodyArray, ParallelEvaluator
+
+
+def best_time(fn, repeat: int) -> float:
+    fn()  # warmup (page faults on the output buffer, pool start-up)
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--pixels", type=int, default=1_000_000)
+    parser.add_argument("--bands", type=int, default=64)
+    parser.add_argument("--chunk", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    scene = GraybodyArray(
+        absolute_temperature=rng.uniform(250.0, 330.0, args.pixels),
+        emissivity=rng.uniform(0.8, 1.0, args.pixels),
+    )
+    grid = Blackbody.prepare(np.linspace(8.0, 14.0, args.bands))
+    out = np.empty(scene.shape + grid.shape)
+
+    serial = best_time(lambda: scene.radiance(grid, out=out), args.repeat)
+    print(f"cube: {args.pixels} x {args.bands} ({out.nbytes / 2**20:.0f} MiB), chunk {args.chunk}")
+    print(f"{'workers':>8} {'time [s]':>10} {'speedup':>8} {'efficiency':>10}")
+    print(f"{'serial':>8} {serial:10.4f} {1.0:8.2f} {'':>10}")
+
+    workers = 1
+    cores = os.cpu_count() or 1
+    while workers <= cores:
+        with ParallelEvaluator(workers=workers, chunk_size=args.chunk) as pool:
+            elapsed = best_time(lambda: pool.radiance(scene, grid, out=out), args.repeat)
+        speedup = serial / elapsed
+        print(f"{workers:8d} {elapsed:10.4f} {speedup:8.2f} {speedup / workers:10.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,38 @@
 from .graybody import Blackbody
 from .graybody import Graybody
+from .graybody import PreparedGrid
+from .inverse import BandTemperatureInverter
+from .inverse import brightness_temperature
+from .parallel import ParallelEvaluator
+from .population import BlackbodyArray
+from .population import GraybodyArray
+from .regime import Regime
+from .selective import EmissivityCurve
+from .selective import EmissivityLibrary
+from .selective import SelectiveEmitter
+from .sensor import SensorBand
+from .sensor import SensorModel
+from .streaming import iter_radiance_tiles
+from .streaming import write_radiance
+from .table import PlanckTable
 
-__all__ = ["Blackbody", "Graybody"]
+__all__ = [
+    "Blackbody",
+    "Graybody",
+    "PreparedGrid",
+    "BlackbodyArray",
+    "GraybodyArray",
+    "BandTemperatureInverter",
+    "brightness_temperature",
+    "PlanckTable",
+    "ParallelEvaluator",
+    "Regime",
+    "SelectiveEmitter",
+    "EmissivityCurve",
+    "EmissivityLibrary",
+    "SensorBand",
+    "SensorModel",
+    "iter_radiance_tiles",
+    "write_radiance",
+]
 
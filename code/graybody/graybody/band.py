@@ -0,0 +1,124 @@
+"""
+Closed-form band integration of the Planck function.
+
+With x = c2 / (lambda * T) the band exitance over [lambda_lo, lambda_hi]
+reduces to
+
+    M = c1 * T^4 / c2^4 * integral_{x_hi}^{x_lo} x^3 / (e^x - 1) dx
+
+which is evaluated with one of two rapidly converging series:
+
+    x >= 2:  integral_x^inf  = sum_n e^(-n x) (x^3/n + 3x^2/n^2 + 6x/n^3 + 6/n^4)
+    x <  2:  integral_0^x    = x^3/3 - x^4/8 + sum_k B_2k x^(2k+3) / ((2k+3) (2k)!)
+
+Both are truncated once every remaining term falls below a relative tolerance.
+The first wavelength moment of the band, integral lambda M_lambda d lambda,
+is c1 * T^3 / c2^3 times the same integral of x^2 / (e^x - 1), from the
+power = 2 form of both series.
+"""
+import math
+
+import numpy as np
+
+from fractions import Fraction
+from numpy.typing import ArrayLike
+
+TOTAL = math.pi**4 / 15   # integral_0^inf x^3 / (e^x - 1) dx
+_SWITCH = 2.0             # series crossover in x
+
+# integral_0^inf x^power / (e^x - 1) dx = power! zeta(power + 1)
+_TOTALS = {2: 2 * 1.2020569031595942, 3: TOTAL}
+
+
+def _even_bernoulli(count: int) -> list[Fraction]:
+    """B_2, B_4, ..., B_2count (Akiyama-Tanigawa)"""
+    size = 2 * count + 1
+    a = [Fraction(0)] * (size + 1)
+    numbers = []
+    for m in range(size + 1):
+        a[m] = Fraction(1, m + 1)
+        for j in range(m, 0, -1):
+            a[j - 1] = j * (a[j - 1] - a[j])
+        numbers.append(a[0])
+    return numbers[2::2][:count]
+
+
+# Coefficients B_2k / ((2k+p) (2k)!) of x^(2k+p) for p = power; |ratio| ~ (x/2pi)^2 <= 0.1
+_COEFFICIENTS = {
+    power: np.array([
+        float(b / ((2 * k + power) * math.factorial(2 * k)))
+        for k, b in enumerate(_even_bernoulli(24), start=1)
+    ])
+    for power in _TOTALS
+}
+
+
+def _lower(x: np.ndarray, tolerance: float, power: int = 3) -> np.ndarray:
+    """integral_0^x t^power / (e^t - 1) dt for 0 <= x < 2"""
+    x2 = x * x
+    xp = x**power
+    total = xp * (1.0 / power - x / (2.0 * (power + 1)))
+    xp *= x2                  # x^(power + 2)
+    for c in _COEFFICIENTS[power]:
+        term = c * xp
+        total += term
+        if np.all(np.abs(term) <= tolerance * total):
+            break
+        xp *= x2
+    return total
+
+
+def _upper(x: np.ndarray, tolerance: float, power: int = 3) -> np.ndarray:
+    """integral_x^inf t^power / (e^t - 1) dt for x >= 2 (x may be inf)"""
+    finite = np.isfinite(x)
+    x = np.where(finite, x, 0.0)
+    q = np.where(finite, np.exp(-x), 0.0)
+    qn = q.copy()
+    total = np.zeros_like(x)
+    n = 1
+    while True:
+        m = 1.0 / n
+        if power == 3:
+            term = qn * m * (((x + 3.0 * m) * x + 6.0 * m * m) * x + 6.0 * m * m * m)
+        else:
+            term = qn * m * ((x + 2.0 * m) * x + 2.0 * m * m)
+        total += term
+        if np.all(term <= tolerance * total):
+            return total
+        qn *= q
+        n += 1
+
+
+def planck_integral(
+    x_hi: ArrayLike, x_lo: ArrayLike, tolerance: float = 1e-12, power: int = 3
+) -> np.ndarray:
+    """integral_{x_hi}^{x_lo} t^power / (e^t - 1) dt for 0 <= x_hi <= x_lo <= inf
+
+    power is 3 for band exitance, 2 for its first wavelength moment.
+    """
+    if not 0.0 < tolerance < 1.0:
+        raise ValueError("Tolerance must be within (0, 1)")
+    if power not in _TOTALS:
+        raise ValueError(f"Power must be one of {sorted(_TOTALS)}")
+    x_hi, x_lo = np.broadcast_arrays(
+        np.asarray(x_hi, dtype=np.float64), np.asarray(x_lo, dtype=np.float64)
+    )
+    result = np.empty(x_hi.shape)
+
+    # Both limits in the exponential regime: difference of two upper tails
+    tails = x_hi >= _SWITCH
+    if np.any(tails):
+        result[tails] = (
+            _upper(x_hi[tails], tolerance, power) - _upper(x_lo[tails], tolerance, power)
+        )
+
+    # Otherwise: difference of two lower integrals
+    rest = ~tails
+    if np.any(rest):
+        lo, hi = x_lo[rest], x_hi[rest]
+        lower_lo = np.empty(lo.shape)
+        small = lo < _SWITCH
+        lower_lo[small] = _lower(lo[small], tolerance, power)
+        lower_lo[~small] = _TOTALS[power] - _upper(lo[~small], tolerance, power)
+        result[rest] = lower_lo - _lower(hi, tolerance, power)
+    return result
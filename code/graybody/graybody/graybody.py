@@ -1,9 +1,258 @@
+import gc
+
 import numpy as np
 
-from numpy.typing import ArrayLike
+from annotated_types import Ge, Gt, Le, Lt
+from numpy.typing import ArrayLike, DTypeLike
 from pydantic import BaseModel, Field, ConfigDict
 from typing import ClassVar
 
+from .band import planck_integral
+from .regime import Regime, rayleigh_jeans_limit, wien_limit
+
+_UNDERFLOW = 708.0   # x past which exp(-x) leaves the normal float64 range
+
+try:
+    from . import _planck
+except ImportError:  # built without the compiled kernel; NumPy evaluates Planck
+    _planck = None
+
+
+class PreparedGrid(BaseModel):
+    """Wavelength grid [micron] with the Planck terms c1/w^5 and c2/w precomputed"""
+    wavelength: np.ndarray
+    c1_over_w5: np.ndarray
+    c2_over_w: np.ndarray
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return self.wavelength.shape
+
+
+def _per_member(value: ArrayLike, population: tuple[int, ...], ndim: int) -> np.ndarray | None:
+    """value flattened to one entry per population member; None if it varies over the grid"""
+    shape = np.shape(value)
+    split = max(len(shape) - ndim, 0)
+    if any(n != 1 for n in shape[split:]):
+        return None
+    return np.broadcast_to(np.reshape(value, shape[:split]), population).reshape(-1)
+
+
+def _float_dtype(dtype: DTypeLike) -> np.dtype:
+    """dtype of a spectral result: float64 or float32"""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float64, np.float32):
+        raise ValueError(f"dtype must be float64 or float32, not {dtype}")
+    return dtype
+
+
+def _exitance(
+    grid: PreparedGrid,
+    temperature: ArrayLike,
+    out: np.ndarray | None,
+    scale: ArrayLike = 1.0,
+    dtype: DTypeLike = np.float64,
+    accuracy: float | None = None,
+    regime: np.ndarray | None = None,
+) -> np.ndarray:
+    """Planck kernel times `scale` evaluated entirely in `out` (allocated once if None)
+
+    The compiled _planck kernel takes the common case of one temperature and
+    scale per population member over the whole grid, in a single fused pass
+    computed in float64 whatever the output dtype; anything else (or a
+    pure-Python install) runs as in-place NumPy ufuncs in the output dtype.
+    With `accuracy`, Wien or Rayleigh-Jeans replace Planck where they are
+    within that relative error (per row or block of wavelengths compiled, per
+    element with NumPy), and `regime` receives the formula used.
+    """
+    dtype = _float_dtype(dtype)
+    shape = np.broadcast_shapes(np.shape(temperature), np.shape(scale), grid.shape)
+    if out is None:
+        out = np.empty(shape, dtype)
+    elif out.shape != shape or out.dtype != dtype:
+        raise ValueError(f"out must be a {dtype} array of shape {shape}")
+    if regime is not None and (regime.shape != shape or regime.dtype != np.int8):
+        raise ValueError(f"regime must be an int8 array of shape {shape}")
+    limits = None
+    if accuracy is not None:
+        limits = (wien_limit(accuracy), rayleigh_jeans_limit(accuracy))
+    compiled = out.flags.c_contiguous and (regime is None or regime.flags.c_contiguous)
+    if _planck is not None and compiled:
+        population = shape[:len(shape) - grid.wavelength.ndim]
+        rows = _per_member(temperature, population, grid.wavelength.ndim)
+        factor = _per_member(scale, population, grid.wavelength.ndim)
+        if rows is not None and factor is not None:
+            if limits is None:
+                _planck.exitance(grid.c1_over_w5, grid.c2_over_w, rows, factor, out)
+                if regime is not None:
+                    regime.fill(Regime.PLANCK)
+            else:
+                _planck.exitance_regimes(
+                    grid.c1_over_w5, grid.c2_over_w, rows, factor, *limits, out, regime
+                )
+            return out
+    # c1/w^5 / expm1(x) with x = c2 / (w T): no cancellation as x -> 0, exp(x)
+    # overflowing gives 0, and T = 0 maps to x = inf (no emission) silently
+    t = np.asarray(temperature, dtype=np.float64)
+    inv_t = np.divide(1.0, t, out=np.full(t.shape, np.inf), where=t > 0)
+    c1_over_w5 = grid.c1_over_w5.astype(dtype, copy=False)
+    # Each element takes the formula its own x = c2 / (w T) calls for, so values
+    # never depend on the rest of the array; arrays wholly past one limit skip
+    # the masks: c1/(c2 w^4) T for Rayleigh-Jeans, c1/w^5 e^-x for Wien
+    used = Regime.PLANCK if limits is None else _uniform_regime(grid, inv_t, dtype, *limits)
+    if used == Regime.RAYLEIGH_JEANS:
+        linear = (grid.c1_over_w5 / grid.c2_over_w).astype(dtype, copy=False)
+        np.multiply(linear, t.astype(dtype), out=out)
+        if regime is not None:
+            regime.fill(used)
+    else:
+        np.multiply(grid.c2_over_w.astype(dtype, copy=False), inv_t.astype(dtype), out=out)
+        if used == Regime.WIEN:
+            linear, wien, planck = False, True, False
+        elif limits is None:
+            linear, wien, planck = False, False, True
+        else:
+            linear = out <= limits[1]
+            wien = out >= limits[0]
+            planck = _where(~(linear | wien))
+            linear, wien = _where(linear), _where(wien)
+        if linear is not False:
+            coefficient = (grid.c1_over_w5 / grid.c2_over_w).astype(dtype, copy=False)
+            np.multiply(coefficient, t.astype(dtype), out=out, where=linear)
+        if wien is not False:
+            # e^-x leaves the normal range where expm1(x) overflows: 0 there, as in Planck
+            if grid.c2_over_w.max() * inv_t.max(initial=0.0) >= _UNDERFLOW:
+                np.copyto(out, np.inf, where=wien & (out >= _UNDERFLOW))
+            np.negative(out, out=out, where=wien)
+            np.exp(out, out=out, where=wien)
+            np.multiply(c1_over_w5, out, out=out, where=wien)
+        if planck is not False:
+            with np.errstate(over="ignore"):
+                np.expm1(out, out=out, where=planck)
+            np.divide(c1_over_w5, out, out=out, where=planck)
+        if regime is not None:
+            regime.fill(Regime.PLANCK)
+            np.copyto(regime, Regime.RAYLEIGH_JEANS, where=linear)
+            np.copyto(regime, Regime.WIEN, where=wien)
+    if np.ndim(scale) or scale != 1.0:
+        np.multiply(out, np.asarray(scale, dtype), out=out)
+    return out
+
+
+
+def _uniform_regime(
+    grid: PreparedGrid,
+    inv_t: np.ndarray,
+    dtype: np.dtype,
+    wien_limit: float,
+    rayleigh_jeans_limit: float,
+) -> Regime:
+    """Formula that every x = c2 / (w T) of the array selects, judged from the range of x alone
+
+    Planck when the range straddles a limit; the caller then chooses per element.
+    The bounds are rounded in `dtype` as the elements are, so both agree.
+    """
+    if grid.c2_over_w.size == 0 or inv_t.size == 0:
+        return Regime.PLANCK
+    c2_over_w = grid.c2_over_w.astype(dtype, copy=False)
+    inv_t = inv_t.astype(dtype, copy=False)
+    if c2_over_w.max() * inv_t.max() <= rayleigh_jeans_limit:
+        return Regime.RAYLEIGH_JEANS
+    if c2_over_w.min() * inv_t.min() >= wien_limit:
+        return Regime.WIEN
+    return Regime.PLANCK
+
+
+def _where(mask: np.ndarray) -> np.ndarray | bool:
+    """`mask` as a ufunc where=: True or False when uniform, so those run unmasked or not at all"""
+    if mask.all():
+        return True
+    return mask if mask.any() else False
+
+
+def _jacobian(
+    grid: PreparedGrid,
+    temperature: ArrayLike,
+    d_temperature: np.ndarray | None,
+    scale: ArrayLike = 1.0,
+    dtype: DTypeLike = np.float64,
+    emissivity: ArrayLike = 1.0,
+    value: np.ndarray | None = None,
+    d_emissivity: np.ndarray | None = None,
+) -> np.ndarray:
+    """d(scale * emissivity * Planck)/dT in `d_temperature` (allocated once if None)
+
+    With B = c1/w^5 / expm1(x), dB/dT = B (x / T) e^x / expm1(x), so the value
+    and both derivatives share one expm1 per element. Given `value` and
+    `d_emissivity` (both or neither), the same pass fills them with
+    scale * emissivity * B and scale * B. Dispatch is as in _exitance.
+    """
+    dtype = _float_dtype(dtype)
+    shape = np.broadcast_shapes(
+        np.shape(temperature), np.shape(scale), np.shape(emissivity), grid.shape
+    )
+    if d_temperature is None:
+        d_temperature = np.empty(shape, dtype)
+    if (value is None) != (d_emissivity is None):
+        raise ValueError("value and d_emissivity must be given together")
+    outputs = [d_temperature] if value is None else [d_temperature, value, d_emissivity]
+    if any(array.shape != shape or array.dtype != dtype for array in outputs):
+        raise ValueError(f"out must be a {dtype} array of shape {shape}")
+    if _planck is not None and all(array.flags.c_contiguous for array in outputs):
+        population = shape[:len(shape) - grid.wavelength.ndim]
+        rows = _per_member(temperature, population, grid.wavelength.ndim)
+        factor = _per_member(scale, population, grid.wavelength.ndim)
+        weight = _per_member(emissivity, population, grid.wavelength.ndim)
+        if rows is not None and factor is not None and weight is not None:
+            _planck.jacobian(
+                grid.c1_over_w5, grid.c2_over_w, rows, factor, weight,
+                d_temperature, value, d_emissivity,
+            )
+            return d_temperature
+    # d/dT = scale emissivity c1 c2 / (w^6 T^2) * g (1 + g) with g = 1 / expm1(x):
+    # the factors outside g form one outer product, 0 at T = 0 (where g is 0)
+    t = np.asarray(temperature, dtype=np.float64)
+    inv_t = np.divide(1.0, t, out=np.full(t.shape, np.inf), where=t > 0)
+    with np.errstate(over="ignore"):
+        weight = np.asarray(np.multiply(scale, emissivity) * np.where(t > 0, inv_t**2, 0.0), dtype)
+    weight[~np.isfinite(weight)] = 0.0  # T so small that 1/T^2 overflows: B is 0 there
+    c1_c2_over_w6 = (grid.c1_over_w5 * grid.c2_over_w).astype(dtype)
+    np.multiply(c1_c2_over_w6, weight, out=d_temperature)
+    work = np.empty(shape, dtype) if value is None else value
+    np.multiply(grid.c2_over_w.astype(dtype, copy=False), inv_t.astype(dtype), out=work)
+    with np.errstate(over="ignore"):
+        np.expm1(work, out=work)
+    np.divide(1.0, work, out=work)
+    if d_emissivity is not None:
+        if np.ndim(scale):
+            np.multiply(grid.c1_over_w5.astype(dtype, copy=False), work, out=d_emissivity)
+            np.multiply(d_emissivity, np.asarray(scale, dtype), out=d_emissivity)
+        else:
+            np.multiply((scale * grid.c1_over_w5).astype(dtype), work, out=d_emissivity)
+    np.multiply(d_temperature, work, out=d_temperature)
+    np.add(work, 1.0, out=work)
+    np.multiply(d_temperature, work, out=d_temperature)
+    if value is not None:
+        np.multiply(d_emissivity, np.asarray(emissivity, dtype), out=value)
+    return d_temperature
+
+
+def _jacobian_buffers(
+    shape: tuple[int, ...], out: np.ndarray | None, jacobian: np.ndarray | None, dtype: DTypeLike
+) -> tuple[np.ndarray, np.ndarray]:
+    """Value and (2,) + shape Jacobian buffers for radiance_and_jacobian(), allocated if None"""
+    dtype = _float_dtype(dtype)
+    if out is None:
+        out = np.empty(shape, dtype)
+    if jacobian is None:
+        jacobian = np.empty((2,) + shape, dtype)
+    elif jacobian.shape != (2,) + shape or jacobian.dtype != dtype:
+        raise ValueError(f"jacobian must be a {dtype} array of shape {(2,) + shape}")
+    return out, jacobian
+
+
 #<blackbody:class-begin>
 class Blackbody(BaseModel):
     absolute_temperature: float = Field(
@@ -16,19 +265,184 @@ class Blackbody(BaseModel):
     _c1: ClassVar[float] = 3.74151e08   # [W / m^2 / micron]
     _c2: ClassVar[float] = 1.43879e04   # [micron K]
 
-    def exitance(self, wavelength: ArrayLike) -> float | np.ndarray:
-        """Spectral exitance [W/m^2/um] for wavelength(s) in microns"""
-        w = np.asarray(wavelength, dtype=np.float64)
+    @classmethod
+    def from_arrays(cls, *, pause_gc: bool = False, **columns: ArrayLike) -> list["Blackbody"]:
+        """Many instances from 1-D columns (one per field), range-checked once per column
+
+        Most of the time for millions of rows goes to the cyclic garbage
+        collector scanning the new objects. pause_gc=True disables it while
+        the instances are built and then restores its previous state; the
+        collector is process-wide, so this also pauses it for other threads.
+        """
+        missing = set(cls.model_fields) - set(columns)
+        unexpected = set(columns) - set(cls.model_fields)
+        if missing or unexpected:
+            raise ValueError(
+                f"{cls.__name__}.from_arrays needs exactly the columns "
+                f"{sorted(cls.model_fields)}; missing {sorted(missing)}, "
+                f"unexpected {sorted(unexpected)}"
+            )
+        names = list(cls.model_fields)
+        for name in names:
+            if cls.model_fields[name].annotation is not float:
+                raise TypeError(f"{cls.__name__}.from_arrays supports float fields only ({name!r})")
+        arrays = np.broadcast_arrays(
+            *(np.asarray(columns[name], dtype=np.float64) for name in names)
+        )
+        for name, values in zip(names, arrays):
+            field = cls.model_fields[name]
+            if values.ndim != 1:
+                raise ValueError(f"Column {name!r} must be 1-D")
+            # The same Field constraints pydantic enforces, negated so NaN fails
+            valid = np.ones(values.shape, dtype=bool)
+            for constraint in field.metadata:
+                if isinstance(constraint, Ge):
+                    valid &= values >= constraint.ge
+                elif isinstance(constraint, Gt):
+                    valid &= values > constraint.gt
+                elif isinstance(constraint, Le):
+                    valid &= values <= constraint.le
+                elif isinstance(constraint, Lt):
+                    valid &= values < constraint.lt
+            if not np.all(valid):
+                bad = np.flatnonzero(~valid)
+                raise ValueError(
+                    f"Column {name!r}: {bad.size} value(s) violate {field.metadata} "
+                    f"(first at index {bad[0]}: {values[bad[0]]})"
+                )
+
+        # Trusted path: set the model state directly, as model_construct()
+        # does, minus its per-call defaults handling
+        new = object.__new__
+        set_attribute = object.__setattr__
+        instances = []
+        was_enabled = gc.isenabled()
+        if pause_gc:
+            gc.disable()
+        try:
+            for row in zip(*(values.tolist() for values in arrays)):
+                instance = new(cls)
+                set_attribute(instance, "__dict__", dict(zip(names, row)))
+                set_attribute(instance, "__pydantic_fields_set__", set(names))
+                set_attribute(instance, "__pydantic_extra__", None)
+                set_attribute(instance, "__pydantic_private__", None)
+                instances.append(instance)
+        finally:
+            if pause_gc and was_enabled:
+                gc.enable()
+        return instances
+
+    @classmethod
+    def prepare(cls, wavelength: ArrayLike) -> PreparedGrid:
+        """Validate wavelength(s) in microns once and cache their Planck terms"""
+        w = np.array(wavelength, dtype=np.float64)
         if np.any(w <= 0):
             raise ValueError("Wavelength(s) must be > 0 [microns]")
-        exitance = (
-            self._c1 / w**5 /
-            (np.exp(self._c2 / (w * self.absolute_temperature)) - 1.0)
+        terms = [w, np.asarray(cls._c1 / w**5), np.asarray(cls._c2 / w)]
+        for term in terms:
+            term.flags.writeable = False
+        return PreparedGrid(wavelength=terms[0], c1_over_w5=terms[1], c2_over_w=terms[2])
+
+    def exitance(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> float | np.ndarray:
+        """Spectral exitance [W/m^2/um] for wavelength(s) in microns
+
+        dtype is float64 or float32, which halves the memory traffic of large
+        cubes; out must match it. See the README for the float32 error bound.
+
+        accuracy (a relative error, e.g. 1e-4) lets the Wien and Rayleigh-Jeans
+        approximations stand in for Planck wherever they are that accurate;
+        an int8 `regime` array of the result's shape receives the Regime used
+        per element. The default, None, is full Planck everywhere.
+        """
+        return self._spectral(wavelength, out, 1.0, dtype, accuracy, regime)
+
+    def radiance(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> float | np.ndarray:
+        return self._spectral(wavelength, out, 1.0 / np.pi, dtype, accuracy, regime)
+
+    def _spectral(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: float,
+        dtype: DTypeLike,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> float | np.ndarray:
+        """Exitance times scale; subclasses fold their emissivity into the scale"""
+        if not isinstance(wavelength, PreparedGrid):
+            wavelength = self.prepare(wavelength)
+        spectral = _exitance(
+            wavelength, self.absolute_temperature, out, scale, dtype, accuracy, regime
         )
-        return exitance.item() if exitance.ndim == 0 else exitance
+        return spectral.item() if out is None and spectral.ndim == 0 else spectral
 
-    def radiance(self, wavelength: ArrayLike) -> float | np.ndarray:
-        return self.exitance(wavelength) / np.pi
+    def d_radiance_dT(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> float | np.ndarray:
+        """Derivative of radiance by absolute temperature [W/m^2/sr/um/K], in closed form"""
+        return self._derivative(wavelength, out, 1.0 / np.pi, dtype)
+
+    def _derivative(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: float,
+        dtype: DTypeLike,
+    ) -> float | np.ndarray:
+        """d(exitance)/dT times scale; subclasses fold their emissivity into the scale"""
+        if not isinstance(wavelength, PreparedGrid):
+            wavelength = self.prepare(wavelength)
+        derivative = _jacobian(wavelength, self.absolute_temperature, out, scale, dtype)
+        return derivative.item() if out is None and derivative.ndim == 0 else derivative
+
+    def band_exitance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> float:
+        """Exitance [W/m^2] integrated over [lambda_lo, lambda_hi] microns"""
+        return self._band_exitance(
+            self.absolute_temperature, lambda_lo, lambda_hi, tolerance
+        ).item()
+
+    def band_radiance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> float:
+        return self.band_exitance(lambda_lo, lambda_hi, tolerance) / np.pi
+
+    @classmethod
+    def _band_exitance(
+        cls,
+        temperature: ArrayLike,
+        lambda_lo: float,
+        lambda_hi: float,
+        tolerance: float,
+    ) -> np.ndarray:
+        """Band exitance [W/m^2] vectorized over an array of temperatures"""
+        if not 0 < lambda_lo < lambda_hi:
+            raise ValueError("Band limits must satisfy 0 < lambda_lo < lambda_hi [microns]")
+        t = np.asarray(temperature, dtype=np.float64)
+        # x = c2 / (lambda T), with T = 0 mapped to x = inf (no emission)
+        inv_t = np.divide(1.0, t, out=np.full(t.shape, np.inf), where=t > 0)
+        integral = planck_integral(
+            cls._c2 / lambda_hi * inv_t, cls._c2 / lambda_lo * inv_t, tolerance
+        )
+        return cls._c1 * (t / cls._c2)**4 * integral
 #<blackbody:class-end>
 
 #<graybody:class-begin>
@@ -37,8 +451,63 @@ class Graybody(Blackbody):
 
     model_config = ConfigDict(frozen=True)
 
-    def exitance(self, wavelength: ArrayLike) -> float | np.ndarray:
-        return self.emissivity * super().exitance(wavelength)
+    def _spectral(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: float,
+        dtype: DTypeLike,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> float | np.ndarray:
+        return super()._spectral(
+            wavelength, out, self.emissivity * scale, dtype, accuracy, regime
+        )
+
+    def _derivative(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: float,
+        dtype: DTypeLike,
+    ) -> float | np.ndarray:
+        return super()._derivative(wavelength, out, self.emissivity * scale, dtype)
+
+    def d_radiance_d_emissivity(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> float | np.ndarray:
+        """Derivative of radiance by emissivity: the blackbody radiance [W/m^2/sr/um]"""
+        return super()._spectral(wavelength, out, 1.0 / np.pi, dtype)
+
+    def radiance_and_jacobian(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        jacobian: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> tuple[float | np.ndarray, np.ndarray]:
+        """Radiance and its Jacobian by (absolute_temperature, emissivity), in one pass
+
+        jacobian has shape (2,) + radiance.shape, holding d/dT in jacobian[0]
+        and d/d emissivity in jacobian[1]; both share the exp term of the
+        radiance instead of re-evaluating Planck as finite differences would.
+        """
+        if not isinstance(wavelength, PreparedGrid):
+            wavelength = self.prepare(wavelength)
+        value, jacobian = _jacobian_buffers(wavelength.shape, out, jacobian, dtype)
+        _jacobian(
+            wavelength, self.absolute_temperature, jacobian[0, ...], 1.0 / np.pi, dtype,
+            self.emissivity, value, jacobian[1, ...],
+        )
+        return value.item() if out is None and value.ndim == 0 else value, jacobian
+
+    def band_exitance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> float:
+        return self.emissivity * super().band_exitance(lambda_lo, lambda_hi, tolerance)
 #<graybody:class-end>
 
 if __name__ == "__main__":
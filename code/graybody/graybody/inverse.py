@@ -0,0 +1,123 @@
+import numpy as np
+
+from numpy.typing import ArrayLike
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
+
+from .band import planck_integral
+from .graybody import Blackbody
+
+
+def _check_radiance(radiance: ArrayLike) -> np.ndarray:
+    radiance = np.asarray(radiance, dtype=np.float64)
+    if np.any(~(radiance >= 0)):
+        raise ValueError("Radiance must be >= 0")
+    return radiance
+
+
+def _check_emissivity(emissivity: ArrayLike) -> np.ndarray:
+    emissivity = np.asarray(emissivity, dtype=np.float64)
+    if np.any(~((emissivity > 0.0) & (emissivity <= 1.0))):
+        raise ValueError("Emissivity must be within (0, 1] to invert radiance")
+    return emissivity
+
+
+def brightness_temperature(
+    radiance: ArrayLike, wavelength: ArrayLike, emissivity: ArrayLike = 1.0
+) -> float | np.ndarray:
+    """Temperature [K] that produces the spectral radiance [W/m^2/sr/um] at wavelength(s) in microns"""
+    radiance = _check_radiance(radiance)
+    emissivity = _check_emissivity(emissivity)
+    w = np.asarray(wavelength, dtype=np.float64)
+    if np.any(w <= 0):
+        raise ValueError("Wavelength(s) must be > 0 [microns]")
+    # Analytic inverse of L = eps c1 / (pi w^5 (exp(c2 / (w T)) - 1));
+    # zero radiance maps to log1p(inf) = inf and hence T = 0
+    with np.errstate(divide="ignore"):
+        ratio = emissivity * Blackbody._c1 / (np.pi * w**5) / radiance
+    temperature = Blackbody._c2 / (w * np.log1p(ratio))
+    return temperature.item() if temperature.ndim == 0 else temperature
+
+
+class BandTemperatureInverter(BaseModel):
+    """Band-integrated radiance [W/m^2/sr] to brightness temperature [K]
+
+    log(band radiance) is tabulated against 1/T together with its exact slope
+    and inverted by cubic Hermite interpolation on those slopes (no monotonicity
+    limiter), so each pixel costs a table search plus a handful of flops.  Optional Newton iterations on the
+    closed-form band integral polish the result to machine precision.
+    """
+    lambda_lo: float = Field(gt=0, description="Lower band limit [micron]")
+    lambda_hi: float = Field(gt=0, description="Upper band limit [micron]")
+    t_min: float = Field(default=100.0, gt=0, description="Table lower temperature [K]")
+    t_max: float = Field(default=5000.0, gt=0, description="Table upper temperature [K]")
+    samples: int = Field(default=1024, ge=2)
+    tolerance: float = Field(default=1e-12, gt=0, lt=1)
+
+    model_config = ConfigDict(frozen=True)
+
+    _log_radiance: np.ndarray = PrivateAttr()
+    _inverse_temperature: np.ndarray = PrivateAttr()
+    _slope: np.ndarray = PrivateAttr()
+
+    @model_validator(mode="after")
+    def _validate_ranges(self) -> "BandTemperatureInverter":
+        if not self.lambda_lo < self.lambda_hi:
+            raise ValueError("Band limits must satisfy 0 < lambda_lo < lambda_hi [microns]")
+        if not self.t_min < self.t_max:
+            raise ValueError("Table limits must satisfy 0 < t_min < t_max [K]")
+        return self
+
+    def model_post_init(self, __context) -> None:
+        # Uniform in 1/T: log(radiance) is nearly linear there (Wien regime)
+        inverse_t = np.linspace(1.0 / self.t_max, 1.0 / self.t_min, self.samples)
+        t = 1.0 / inverse_t
+        radiance, derivative = self._radiance_and_derivative(t)
+        if np.any(~(radiance > 0)):
+            raise ValueError("Band radiance underflows over the table temperature range")
+        # Stored in increasing log(radiance), i.e. decreasing 1/T, with the
+        # slope d(1/T) / d(log radiance) = -radiance / (T^2 dL/dT) < 0
+        self._log_radiance = np.log(radiance)[::-1].copy()
+        self._inverse_temperature = inverse_t[::-1].copy()
+        self._slope = (-radiance / (t * t * derivative))[::-1].copy()
+
+    def _radiance_and_derivative(self, temperature: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Band radiance and its derivative with respect to T (T > 0)"""
+        c1, c2 = Blackbody._c1, Blackbody._c2
+        x_lo = c2 / (self.lambda_lo * temperature)
+        x_hi = c2 / (self.lambda_hi * temperature)
+        scale = c1 * (temperature / c2)**4 / np.pi
+        radiance = scale * planck_integral(x_hi, x_lo, self.tolerance)
+        # d/dT of scale * integral_{x_hi}^{x_lo}, with dx/dT = -x/T
+        with np.errstate(over="ignore"):
+            edges = x_hi**4 / np.expm1(x_hi) - x_lo**4 / np.expm1(x_lo)
+        derivative = (4.0 * radiance + scale * edges) / temperature
+        return radiance, derivative
+
+    def __call__(
+        self, band_radiance: ArrayLike, emissivity: ArrayLike = 1.0, iterations: int = 0
+    ) -> float | np.ndarray:
+        radiance = _check_radiance(band_radiance) / _check_emissivity(emissivity)
+        temperature = np.zeros(radiance.shape)
+        positive = radiance > 0
+        y = np.log(radiance[positive])
+
+        nodes = self._log_radiance
+        if np.any((y < nodes[0]) | (y > nodes[-1])):
+            raise ValueError(
+                f"Band radiance outside the table range [{self.t_min}, {self.t_max}] K"
+            )
+        k = np.clip(np.searchsorted(nodes, y, side="right") - 1, 0, nodes.size - 2)
+        h = nodes[k + 1] - nodes[k]
+        s = (y - nodes[k]) / h
+        u0, u1 = self._inverse_temperature[k], self._inverse_temperature[k + 1]
+        m0, m1 = self._slope[k] * h, self._slope[k + 1] * h
+        # Cubic Hermite basis in Horner form
+        u = u0 + s * (m0 + s * ((3.0 * (u1 - u0) - 2.0 * m0 - m1) + s * (2.0 * (u0 - u1) + m0 + m1)))
+
+        # Newton on log(radiance) as a function of 1/T, which is close to linear
+        for _ in range(iterations):
+            t = 1.0 / u
+            value, derivative = self._radiance_and_derivative(t)
+            u = u + (np.log(value) - y) * value / (derivative * t * t)
+        temperature[positive] = 1.0 / u
+        return temperature.item() if temperature.ndim == 0 else temperature
@@ -0,0 +1,203 @@
+import numpy as np
+
+from numpy.typing import ArrayLike, DTypeLike
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from .graybody import Blackbody, PreparedGrid, _exitance, _jacobian, _jacobian_buffers
+
+
+def _readonly_float_array(value: ArrayLike) -> np.ndarray:
+    array = np.array(value, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+class BlackbodyArray(BaseModel):
+    """Population of blackbodies evaluated together in one broadcast call"""
+    absolute_temperature: np.ndarray
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    @field_validator("absolute_temperature", mode="before")
+    @classmethod
+    def _validate_temperature(cls, value: ArrayLike) -> np.ndarray:
+        temperature = _readonly_float_array(value)
+        # Negated comparison so that NaN is rejected as well
+        if np.any(~(temperature >= 0)):
+            raise ValueError("Absolute temperature(s) must be >= 0 [K]")
+        return temperature
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        """Population shape (e.g. (pixels,) or (rows, cols))"""
+        return self.absolute_temperature.shape
+
+    def exitance(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Spectral exitance [W/m^2/um] with shape population.shape + wavelength.shape"""
+        return self._spectral(wavelength, out, 1.0, dtype, accuracy, regime)
+
+    def radiance(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> np.ndarray:
+        return self._spectral(wavelength, out, 1.0 / np.pi, dtype, accuracy, regime)
+
+    def _spectral(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: ArrayLike,
+        dtype: DTypeLike,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Exitance times scale (one per member, or a scalar) in a single kernel call"""
+        if not isinstance(wavelength, PreparedGrid):
+            wavelength = Blackbody.prepare(wavelength)
+        expand = (...,) + (np.newaxis,) * wavelength.wavelength.ndim
+        temperature = np.broadcast_to(self.absolute_temperature, self.shape)
+        scale = np.asarray(scale)
+        if scale.ndim:
+            scale = scale[expand]
+        return _exitance(wavelength, temperature[expand], out, scale, dtype, accuracy, regime)
+
+    def d_radiance_dT(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> np.ndarray:
+        """Derivative of radiance by absolute temperature [W/m^2/sr/um/K], per member"""
+        return self._derivative(wavelength, out, 1.0 / np.pi, dtype)
+
+    def _derivative(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: ArrayLike,
+        dtype: DTypeLike,
+    ) -> np.ndarray:
+        """d(exitance)/dT times scale (one per member, or a scalar) in a single kernel call"""
+        if not isinstance(wavelength, PreparedGrid):
+            wavelength = Blackbody.prepare(wavelength)
+        expand = (...,) + (np.newaxis,) * wavelength.wavelength.ndim
+        temperature = np.broadcast_to(self.absolute_temperature, self.shape)
+        scale = np.asarray(scale)
+        if scale.ndim:
+            scale = scale[expand]
+        return _jacobian(wavelength, temperature[expand], out, scale, dtype)
+
+    def band_exitance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> np.ndarray:
+        """Exitance [W/m^2] integrated over [lambda_lo, lambda_hi] microns, per member"""
+        temperature = np.broadcast_to(self.absolute_temperature, self.shape)
+        return Blackbody._band_exitance(temperature, lambda_lo, lambda_hi, tolerance)
+
+    def band_radiance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> np.ndarray:
+        band = self.band_exitance(lambda_lo, lambda_hi, tolerance)
+        band /= np.pi
+        return band
+
+
+class GraybodyArray(BlackbodyArray):
+    emissivity: np.ndarray
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    @field_validator("emissivity", mode="before")
+    @classmethod
+    def _validate_emissivity(cls, value: ArrayLike) -> np.ndarray:
+        emissivity = _readonly_float_array(value)
+        if np.any(~((emissivity >= 0.0) & (emissivity <= 1.0))):
+            raise ValueError("Emissivity must be within [0, 1]")
+        return emissivity
+
+    @model_validator(mode="after")
+    def _validate_shapes(self) -> "GraybodyArray":
+        try:
+            np.broadcast_shapes(self.absolute_temperature.shape, self.emissivity.shape)
+        except ValueError:
+            raise ValueError(
+                "Absolute temperature and emissivity shapes do not broadcast: "
+                f"{self.absolute_temperature.shape} vs {self.emissivity.shape}"
+            ) from None
+        return self
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return np.broadcast_shapes(self.absolute_temperature.shape, self.emissivity.shape)
+
+    def _spectral(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: ArrayLike,
+        dtype: DTypeLike,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> np.ndarray:
+        return super()._spectral(
+            wavelength, out, self.emissivity * scale, dtype, accuracy, regime
+        )
+
+    def _derivative(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: ArrayLike,
+        dtype: DTypeLike,
+    ) -> np.ndarray:
+        return super()._derivative(wavelength, out, self.emissivity * scale, dtype)
+
+    def d_radiance_d_emissivity(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> np.ndarray:
+        """Derivative of radiance by emissivity: the blackbody radiance, per member"""
+        return super()._spectral(wavelength, out, 1.0 / np.pi, dtype)
+
+    def radiance_and_jacobian(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        jacobian: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Radiance and its Jacobian by (absolute_temperature, emissivity), in one pass
+
+        jacobian has shape (2,) + radiance.shape: d/dT per element in
+        jacobian[0], d/d emissivity in jacobian[1].
+        """
+        if not isinstance(wavelength, PreparedGrid):
+            wavelength = Blackbody.prepare(wavelength)
+        value, jacobian = _jacobian_buffers(self.shape + wavelength.shape, out, jacobian, dtype)
+        expand = (...,) + (np.newaxis,) * wavelength.wavelength.ndim
+        temperature = np.broadcast_to(self.absolute_temperature, self.shape)
+        _jacobian(
+            wavelength, temperature[expand], jacobian[0, ...], 1.0 / np.pi, dtype,
+            self.emissivity[expand], value, jacobian[1, ...],
+        )
+        return value, jacobian
+
+    def band_exitance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> np.ndarray:
+        band = super().band_exitance(lambda_lo, lambda_hi, tolerance)
+        band *= self.emissivity
+        return band
@@ -0,0 +1,49 @@
+import math
+
+from enum import IntEnum
+from functools import cache
+
+
+class Regime(IntEnum):
+    """Formula used for an element of a spectral result (the values of a regime= map)"""
+    PLANCK = 0
+    WIEN = 1
+    RAYLEIGH_JEANS = 2
+
+
+def _check_accuracy(accuracy: float) -> float:
+    if not 0.0 < accuracy < 1.0:
+        raise ValueError("accuracy must be a relative error within (0, 1)")
+    return float(accuracy)
+
+
+def wien_limit(accuracy: float) -> float:
+    """Smallest x = c2 / (lambda T) at which Wien is within `accuracy` of Planck
+
+    Wien, c1 / lambda^5 exp(-x), falls short of Planck by exactly exp(-x).
+    """
+    return -math.log(_check_accuracy(accuracy))
+
+
+def _rayleigh_jeans_error(x: float) -> float:
+    """Relative error of Rayleigh-Jeans, c1 / (lambda^5 x), against Planck: expm1(x) / x - 1"""
+    if x < 1e-3:
+        # Series, as expm1(x) / x - 1 cancels for small x
+        return x * (1 / 2 + x * (1 / 6 + x * (1 / 24 + x * (1 / 120 + x / 720))))
+    return math.expm1(x) / x - 1.0
+
+
+@cache
+def rayleigh_jeans_limit(accuracy: float) -> float:
+    """Largest x = c2 / (lambda T) at which Rayleigh-Jeans is within `accuracy` of Planck"""
+    accuracy = _check_accuracy(accuracy)
+    lo, hi = 0.0, 2.0 * accuracy  # the error exceeds x / 2
+    for _ in range(200):
+        mid = 0.5 * (lo + hi)
+        if mid in (lo, hi):
+            break
+        if _rayleigh_jeans_error(mid) <= accuracy:
+            lo = mid
+        else:
+            hi = mid
+    return lo
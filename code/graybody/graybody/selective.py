@@ -0,0 +1,238 @@
+import weakref
+
+import numpy as np
+
+from collections.abc import Mapping
+from numpy.typing import ArrayLike, DTypeLike
+from pathlib import Path
+from pydantic import BaseModel, ConfigDict, PrivateAttr, field_validator, model_validator
+
+from .band import planck_integral
+from .graybody import Blackbody, PreparedGrid, _exitance
+from .population import BlackbodyArray
+
+_CACHE_SIZE = 8   # resampled grids remembered per curve / library
+_GATHER_BYTES = 1 << 20   # per-block emissivity buffer of EmissivityLibrary.exitance
+
+
+class _GridCache:
+    """Small per-grid memo keyed on PreparedGrid identity (grids hold arrays, so not hashable)"""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref, np.ndarray]] = {}
+
+    def get(self, grid: PreparedGrid, compute) -> np.ndarray:
+        entry = self._entries.get(id(grid))
+        if entry is not None and entry[0]() is grid:
+            return entry[1]
+        values = compute(grid.wavelength)
+        values.flags.writeable = False
+        if len(self._entries) >= _CACHE_SIZE:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[id(grid)] = (weakref.ref(grid), values)
+        return values
+
+
+def _as_grid(wavelength: ArrayLike | PreparedGrid) -> PreparedGrid:
+    return wavelength if isinstance(wavelength, PreparedGrid) else Blackbody.prepare(wavelength)
+
+
+class EmissivityCurve(BaseModel):
+    """Tabulated spectral emissivity, linearly interpolated (and held constant beyond its ends)"""
+    wavelength: np.ndarray   # [micron], strictly increasing
+    emissivity: np.ndarray   # within [0, 1]
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    _cache: _GridCache = PrivateAttr(default_factory=_GridCache)
+
+    @field_validator("wavelength", "emissivity", mode="before")
+    @classmethod
+    def _as_array(cls, value: ArrayLike) -> np.ndarray:
+        array = np.array(value, dtype=np.float64, ndmin=1)
+        array.flags.writeable = False
+        return array
+
+    @model_validator(mode="after")
+    def _validate_curve(self) -> "EmissivityCurve":
+        w, e = self.wavelength, self.emissivity
+        if w.ndim != 1 or w.shape != e.shape:
+            raise ValueError("Wavelength and emissivity must be 1-D arrays of equal length")
+        if np.any(w <= 0) or np.any(np.diff(w) <= 0):
+            raise ValueError("Wavelength(s) must be > 0 and strictly increasing [microns]")
+        if np.any(~((e >= 0.0) & (e <= 1.0))):
+            raise ValueError("Emissivity must be within [0, 1]")
+        return self
+
+    @classmethod
+    def from_file(cls, path: str | Path) -> "EmissivityCurve":
+        """Read a two-column (wavelength [micron], emissivity) text file"""
+        data = np.loadtxt(path, ndmin=2)
+        if data.shape[1] != 2:
+            raise ValueError(f"{path}: expected two columns, found {data.shape[1]}")
+        return cls(wavelength=data[:, 0], emissivity=data[:, 1])
+
+    def resample(self, wavelength: ArrayLike | PreparedGrid) -> np.ndarray:
+        """Emissivity on the given grid; cached (read-only) when given a PreparedGrid"""
+        if isinstance(wavelength, PreparedGrid):
+            return self._cache.get(wavelength, self._interpolate)
+        return self._interpolate(np.asarray(wavelength, dtype=np.float64))
+
+    def _interpolate(self, w: np.ndarray) -> np.ndarray:
+        return np.asarray(np.interp(w, self.wavelength, self.emissivity))
+
+
+class SelectiveEmitter(Blackbody):
+    emissivity: EmissivityCurve
+
+    model_config = ConfigDict(frozen=True)
+
+    def _spectral(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: float,
+        dtype: DTypeLike,
+        accuracy: float | None = None,
+        regime: np.ndarray | None = None,
+    ) -> float | np.ndarray:
+        grid = _as_grid(wavelength)
+        spectral = super()._spectral(grid, out, scale, dtype, accuracy, regime)
+        emissivity = self.emissivity.resample(grid)
+        if isinstance(spectral, float):
+            return emissivity.item() * spectral
+        spectral *= emissivity
+        return spectral
+
+    def _derivative(
+        self,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None,
+        scale: float,
+        dtype: DTypeLike,
+    ) -> float | np.ndarray:
+        grid = _as_grid(wavelength)
+        derivative = super()._derivative(grid, out, scale, dtype)
+        emissivity = self.emissivity.resample(grid)
+        if isinstance(derivative, float):
+            return emissivity.item() * derivative
+        derivative *= emissivity
+        return derivative
+
+    def band_exitance(
+        self, lambda_lo: float, lambda_hi: float, tolerance: float = 1e-12
+    ) -> float:
+        """Exitance [W/m^2] integrated over [lambda_lo, lambda_hi] microns
+
+        Exact for the interpolated curve: the band is split at the curve's
+        knots, and on each piece the emissivity is e_mid + slope (lambda - mid),
+        so the integral is e_mid times the piece's band exitance plus slope
+        times its first wavelength moment about mid, both closed-form series.
+        """
+        if not 0 < lambda_lo < lambda_hi:
+            raise ValueError("Band limits must satisfy 0 < lambda_lo < lambda_hi [microns]")
+        t = self.absolute_temperature
+        if t == 0.0:
+            return 0.0
+        curve = self.emissivity
+        knots = curve.wavelength[(curve.wavelength > lambda_lo) & (curve.wavelength < lambda_hi)]
+        edges = np.concatenate(([lambda_lo], knots, [lambda_hi]))
+        lo, hi = edges[:-1], edges[1:]
+        e_lo, e_hi = curve._interpolate(lo), curve._interpolate(hi)
+        mid = 0.5 * (lo + hi)
+        slope = (e_hi - e_lo) / (hi - lo)
+
+        x_lo, x_hi = self._c2 / (lo * t), self._c2 / (hi * t)
+        exitance = self._c1 * (t / self._c2)**4 * planck_integral(x_hi, x_lo, tolerance)
+        moment = self._c1 * (t / self._c2)**3 * planck_integral(x_hi, x_lo, tolerance, power=2)
+        return float(np.sum(0.5 * (e_lo + e_hi) * exitance + slope * (moment - mid * exitance)))
+
+
+class EmissivityLibrary:
+    """Named emissivity curves evaluated together as one (materials x wavelengths) matrix"""
+
+    def __init__(self, curves: Mapping[str, EmissivityCurve]) -> None:
+        if not curves:
+            raise ValueError("An emissivity library needs at least one material")
+        self._names = tuple(curves)
+        self._curves = tuple(curves.values())
+        self._cache = _GridCache()
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return self._names
+
+    def index(self, name: str) -> int:
+        try:
+            return self._names.index(name)
+        except ValueError:
+            raise KeyError(f"Unknown material {name!r}") from None
+
+    def __getitem__(self, name: str) -> EmissivityCurve:
+        return self._curves[self.index(name)]
+
+    def resample(self, wavelength: ArrayLike | PreparedGrid) -> np.ndarray:
+        """Emissivity matrix of shape (materials,) + wavelength.shape; cached when given a PreparedGrid"""
+        def interpolate(w: np.ndarray) -> np.ndarray:
+            return np.stack([curve._interpolate(w) for curve in self._curves])
+
+        if isinstance(wavelength, PreparedGrid):
+            return self._cache.get(wavelength, interpolate)
+        return interpolate(np.asarray(wavelength, dtype=np.float64))
+
+    def exitance(
+        self,
+        absolute_temperature: ArrayLike,
+        material: ArrayLike,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> np.ndarray:
+        """Spectral exitance [W/m^2/um] for pixels with a temperature and a material index each"""
+        material = np.asarray(material)
+        if not np.issubdtype(material.dtype, np.integer):
+            raise ValueError("Material must be an integer index into the library")
+        if np.any((material < 0) | (material >= len(self._names))):
+            raise ValueError(f"Material index must be within [0, {len(self._names)})")
+        grid = _as_grid(wavelength)
+        population = BlackbodyArray(absolute_temperature=absolute_temperature)
+        shape = np.broadcast_shapes(population.shape, material.shape)
+        expand = (...,) + (np.newaxis,) * grid.wavelength.ndim
+        temperature = np.broadcast_to(population.absolute_temperature, shape)
+        cube = _exitance(grid, temperature[expand], out, 1.0, dtype)
+
+        # Apply each pixel's curve without a cube-sized gather: rows of the cube
+        # are scaled a block at a time through one small buffer
+        columns = grid.wavelength.size
+        emissivity = self.resample(grid).reshape(len(self._names), columns)
+        emissivity = emissivity.astype(cube.dtype, copy=False)
+        material = np.broadcast_to(material, shape)
+        if not cube.flags.c_contiguous:
+            for index in range(len(self._names)):
+                np.multiply(
+                    cube, emissivity[index].reshape(grid.shape),
+                    out=cube, where=(material == index)[expand],
+                )
+            return cube
+        rows = cube.reshape(-1, columns)
+        material = material.reshape(-1)
+        block = max(1, _GATHER_BYTES // max(1, columns * cube.itemsize))
+        buffer = np.empty((min(block, len(rows)), columns), cube.dtype)
+        for start in range(0, len(rows), block):
+            stop = min(start + block, len(rows))
+            gathered = buffer[:stop - start]
+            np.take(emissivity, material[start:stop], axis=0, out=gathered)
+            rows[start:stop] *= gathered
+        return cube
+
+    def radiance(
+        self,
+        absolute_temperature: ArrayLike,
+        material: ArrayLike,
+        wavelength: ArrayLike | PreparedGrid,
+        out: np.ndarray | None = None,
+        dtype: DTypeLike = np.float64,
+    ) -> np.ndarray:
+        cube = self.exitance(absolute_temperature, material, wavelength, out, dtype)
+        cube /= np.pi
+        return cube
@@ -0,0 +1,133 @@
+import numpy as np
+
+from collections.abc import Sequence
+from numpy.typing import ArrayLike
+from pathlib import Path
+from pydantic import BaseModel, ConfigDict, field_validator, model_validator
+
+from .graybody import Blackbody, PreparedGrid
+from .population import BlackbodyArray
+
+
+class SensorBand(BaseModel):
+    """Relative spectral response (RSR) of one sensor channel"""
+    name: str
+    wavelength: np.ndarray   # [micron], strictly increasing
+    response: np.ndarray     # relative, >= 0
+
+    model_config = ConfigDict(frozen=True, arbitrary_types_allowed=True)
+
+    @field_validator("wavelength", "response", mode="before")
+    @classmethod
+    def _as_array(cls, value: ArrayLike) -> np.ndarray:
+        array = np.array(value, dtype=np.float64, ndmin=1)
+        array.flags.writeable = False
+        return array
+
+    @model_validator(mode="after")
+    def _validate_curve(self) -> "SensorBand":
+        w, r = self.wavelength, self.response
+        if w.ndim != 1 or w.shape != r.shape or w.size < 2:
+            raise ValueError("Wavelength and response must be 1-D arrays of equal length >= 2")
+        if np.any(w <= 0) or np.any(np.diff(w) <= 0):
+            raise ValueError("Wavelength(s) must be > 0 and strictly increasing [microns]")
+        if np.any(~(r >= 0)) or not np.any(r > 0):
+            raise ValueError("Response must be >= 0 and not identically zero")
+        return self
+
+    @classmethod
+    def from_file(cls, path: str | Path, name: str | None = None) -> "SensorBand":
+        """Read a two-column (wavelength [micron], response) text file"""
+        data = np.loadtxt(path, ndmin=2)
+        if data.shape[1] != 2:
+            raise ValueError(f"{path}: expected two columns, found {data.shape[1]}")
+        return cls(name=name or Path(path).stem, wavelength=data[:, 0], response=data[:, 1])
+
+
+class SensorModel:
+    """Effective channel radiance for many channels as one matrix product
+
+    Every RSR is resampled once onto a common wavelength grid and folded with
+    trapezoid quadrature weights into a normalized (wavelengths x channels)
+    matrix W, so that
+
+        L_channel = integral L(w) R(w) dw / integral R(w) dw = L @ W
+    """
+
+    def __init__(self, bands: Sequence[SensorBand], wavelength: ArrayLike | None = None) -> None:
+        if not bands:
+            raise ValueError("A sensor model needs at least one band")
+        if wavelength is None:
+            wavelength = np.unique(np.concatenate([band.wavelength for band in bands]))
+        grid = Blackbody.prepare(wavelength)
+        w = grid.wavelength
+        if w.ndim != 1 or w.size < 2 or np.any(np.diff(w) <= 0):
+            raise ValueError("Sensor grid must be 1-D and strictly increasing [microns]")
+
+        quadrature = np.zeros(w.size)
+        quadrature[1:] += np.diff(w) / 2.0
+        quadrature[:-1] += np.diff(w) / 2.0
+        response = np.stack([
+            np.interp(w, band.wavelength, band.response, left=0.0, right=0.0)
+            for band in bands
+        ], axis=1)
+        weights = response * quadrature[:, np.newaxis]
+        norm = weights.sum(axis=0)
+        empty = [band.name for band, n in zip(bands, norm) if not n > 0]
+        if empty:
+            raise ValueError(f"Band(s) {empty} have no response on the sensor grid")
+        weights /= norm
+        weights.flags.writeable = False
+
+        self._bands = tuple(bands)
+        self._grid = grid
+        self._weights = weights
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | Path,
+        names: Sequence[str] | None = None,
+        wavelength: ArrayLike | None = None,
+    ) -> "SensorModel":
+        """Read a text table: wavelength [micron] column then one RSR column per channel"""
+        data = np.loadtxt(path, ndmin=2)
+        channels = data.shape[1] - 1
+        names = list(names) if names is not None else [f"{Path(path).stem}_{i}" for i in range(channels)]
+        if channels < 1 or len(names) != channels:
+            raise ValueError(f"{path}: {channels} response column(s) for {len(names)} name(s)")
+        bands = [
+            SensorBand(name=name, wavelength=data[:, 0], response=data[:, i + 1])
+            for i, name in enumerate(names)
+        ]
+        return cls(bands, data[:, 0] if wavelength is None else wavelength)
+
+    @property
+    def bands(self) -> tuple[SensorBand, ...]:
+        return self._bands
+
+    @property
+    def names(self) -> list[str]:
+        return [band.name for band in self._bands]
+
+    @property
+    def grid(self) -> PreparedGrid:
+        return self._grid
+
+    @property
+    def weights(self) -> np.ndarray:
+        """Normalized quadrature weights, shape (wavelengths, channels)"""
+        return self._weights
+
+    def integrate(self, spectral: ArrayLike) -> np.ndarray:
+        """Band-average any spectral quantity whose last axis is the sensor grid"""
+        spectral = np.asarray(spectral, dtype=np.float64)
+        if spectral.shape[-1:] != self._grid.shape:
+            raise ValueError(
+                f"Last axis must match the sensor grid of {self._grid.shape[0]} wavelengths"
+            )
+        return spectral @ self._weights
+
+    def channel_radiance(self, body: Blackbody | BlackbodyArray) -> float | np.ndarray:
+        """Effective radiance [W/m^2/sr/um] per channel, shape body.shape + (channels,)"""
+        return self.integrate(body.radiance(self._grid))
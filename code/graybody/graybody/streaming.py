@@ -0,0 +1,110 @@
+import math
+
+import numpy as np
+
+from collections.abc import Iterable, Iterator
+from numpy.typing import ArrayLike, DTypeLike
+
+from .graybody import Blackbody, PreparedGrid
+from .population import GraybodyArray
+
+_TILE_BYTES = 64 * 2**20   # default budget for one radiance tile
+
+
+def _tile_rows(shape: tuple[int, ...], bands: int, tile_bytes: int, itemsize: int) -> int:
+    """Rows of axis 0 per tile so that one radiance tile fits in tile_bytes"""
+    row_bytes = math.prod(shape[1:]) * bands * itemsize
+    return max(1, tile_bytes // max(1, row_bytes))
+
+
+def _array_tiles(
+    temperature: np.ndarray, emissivity: np.ndarray, bands: int, tile_bytes: int, itemsize: int
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    if emissivity.ndim and emissivity.shape != temperature.shape:
+        raise ValueError(
+            "Emissivity must be a scalar or match the temperature shape: "
+            f"{emissivity.shape} vs {temperature.shape}"
+        )
+    step = _tile_rows(temperature.shape, bands, tile_bytes, itemsize)
+    for start in range(0, temperature.shape[0], step):
+        rows = slice(start, start + step)
+        # np.asarray reads just this tile from a memory-mapped source
+        yield (
+            np.asarray(temperature[rows]),
+            np.asarray(emissivity[rows]) if emissivity.ndim else emissivity,
+        )
+
+
+def _populations(
+    temperature: np.ndarray | Iterable[ArrayLike],
+    grid: PreparedGrid,
+    emissivity: ArrayLike | Iterable[ArrayLike],
+    tile_bytes: int,
+    dtype: DTypeLike,
+) -> Iterator[tuple[slice, GraybodyArray]]:
+    bands = max(1, grid.wavelength.size)
+    if isinstance(temperature, np.ndarray):
+        if temperature.ndim == 0:
+            raise ValueError("Temperature must have at least one dimension to tile")
+        tiles = _array_tiles(
+            temperature,
+            np.asarray(emissivity, dtype=np.float64),
+            bands,
+            tile_bytes,
+            np.dtype(dtype).itemsize,
+        )
+    elif isinstance(emissivity, Iterable) and not isinstance(emissivity, np.ndarray):
+        tiles = zip(temperature, emissivity, strict=True)
+    else:
+        tiles = ((t, emissivity) for t in temperature)
+
+    start = 0
+    for t, e in tiles:
+        population = GraybodyArray(absolute_temperature=t, emissivity=e)
+        rows = slice(start, start + (population.shape[0] if population.shape else 1))
+        start = rows.stop
+        yield rows, population
+
+
+def iter_radiance_tiles(
+    temperature: np.ndarray | Iterable[ArrayLike],
+    wavelength: ArrayLike | PreparedGrid,
+    emissivity: ArrayLike | Iterable[ArrayLike] = 1.0,
+    tile_bytes: int = _TILE_BYTES,
+    dtype: DTypeLike = np.float64,
+) -> Iterator[tuple[slice, np.ndarray]]:
+    """Yield (rows, radiance tile) pairs [W/m^2/sr/um] over axis 0 of the inputs
+
+    `temperature` is either an array (typically a np.memmap larger than RAM),
+    which is cut into tiles of about `tile_bytes` of output, or an iterable of
+    tiles supplied by the caller.  `emissivity` is a scalar, an array matching
+    `temperature`, or (for tile iterables) a matching iterable of tiles.  Each
+    tile is shaped tile.shape + wavelength.shape, of `dtype` (float64 or
+    float32, which halves the tile size); only one is alive at a time.
+    """
+    grid = wavelength if isinstance(wavelength, PreparedGrid) else Blackbody.prepare(wavelength)
+    for rows, population in _populations(temperature, grid, emissivity, tile_bytes, dtype):
+        yield rows, population.radiance(grid, dtype=dtype)
+
+
+def write_radiance(
+    temperature: np.ndarray | Iterable[ArrayLike],
+    wavelength: ArrayLike | PreparedGrid,
+    out: np.ndarray,
+    emissivity: ArrayLike | Iterable[ArrayLike] = 1.0,
+    tile_bytes: int = _TILE_BYTES,
+) -> np.ndarray:
+    """Stream radiance tiles into a caller-provided (memory-mapped) output array
+
+    Each tile is evaluated directly into its slice of `out`, in out.dtype
+    (float64 or float32), so no radiance tile is ever allocated.
+    """
+    grid = wavelength if isinstance(wavelength, PreparedGrid) else Blackbody.prepare(wavelength)
+    for rows, population in _populations(temperature, grid, emissivity, tile_bytes, out.dtype):
+        if rows.stop > out.shape[0]:
+            raise ValueError(f"Output array with {out.shape[0]} rows is too small")
+        target = out[rows] if population.shape else out[rows.start]
+        population.radiance(grid, out=target, dtype=out.dtype)
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
@@ -0,0 +1,157 @@
+import json
+import math
+
+import numpy as np
+
+from numpy.typing import ArrayLike
+from pathlib import Path
+
+from .graybody import Blackbody
+from .population import BlackbodyArray
+
+
+def _curvature(a: np.ndarray, u: float) -> np.ndarray:
+    """(d^2 M / du^2) / M for M = A / (exp(a u) - 1), u = 1/T"""
+    y = a * u
+    return a * a * (1.0 + 2.0 / np.expm1(y)) / -np.expm1(-y)
+
+
+def _error_bound(h: float, a: np.ndarray, u_min: float) -> float:
+    """Worst-case relative error of linear interpolation in u with node spacing h
+
+    Both M and its relative curvature decrease with u, so on any interval
+    |M''| / 8 h^2 is largest at the left node, while M at the right node is
+    at most exp(a h) times smaller than at the left one.
+    """
+    return float(np.max(h * h / 8.0 * _curvature(a, u_min) * np.exp(a * h)))
+
+
+class PlanckTable:
+    """Blackbody exitance tabulated over (temperature, wavelength)
+
+    Nodes are uniform in u = 1/T and queries interpolate linearly in u, so
+    evaluation is two row lookups (values and slopes) and one multiply-add
+    per output element; no exp, power or division over the output cube.
+    The node count is the smallest for which the interpolation error bound
+    stays below `tolerance` (relative) everywhere in [t_min, t_max].
+    """
+
+    def __init__(
+        self,
+        wavelength: ArrayLike,
+        t_min: float,
+        t_max: float,
+        tolerance: float = 1e-6,
+    ) -> None:
+        w = np.array(wavelength, dtype=np.float64, ndmin=1)
+        if w.ndim != 1 or np.any(w <= 0):
+            raise ValueError("Wavelength(s) must be a 1-D grid of values > 0 [microns]")
+        if not 0 < t_min < t_max:
+            raise ValueError("Table limits must satisfy 0 < t_min < t_max [K]")
+        if not 0 < tolerance < 1:
+            raise ValueError("Tolerance must be within (0, 1)")
+
+        a = Blackbody._c2 / w
+        u_min, u_max = 1.0 / t_max, 1.0 / t_min
+        span = u_max - u_min
+        h = math.sqrt(8.0 * tolerance / float(np.max(_curvature(a, u_min))))
+        count = max(2, math.ceil(span / h) + 1)
+        while _error_bound(span / (count - 1), a, u_min) > tolerance:
+            count = math.ceil(1.1 * count) + 1
+
+        u = np.linspace(u_min, u_max, count)
+        table = np.zeros((2, count, w.size))
+        table[0] = BlackbodyArray(absolute_temperature=1.0 / u).exitance(w)
+        table[1, :-1] = np.diff(table[0], axis=0)
+        self._set(table, w, t_min, t_max, tolerance)
+
+    def _set(
+        self,
+        table: np.ndarray,
+        wavelength: np.ndarray,
+        t_min: float,
+        t_max: float,
+        tolerance: float,
+    ) -> None:
+        table.flags.writeable = False
+        wavelength.flags.writeable = False
+        self._table = table
+        self._wavelength = wavelength
+        self._t_min = float(t_min)
+        self._t_max = float(t_max)
+        self._tolerance = float(tolerance)
+        self._u_min = 1.0 / self._t_max
+        self._h = (1.0 / self._t_min - self._u_min) / (table.shape[1] - 1)
+
+    @property
+    def wavelength(self) -> np.ndarray:
+        return self._wavelength
+
+    @property
+    def t_min(self) -> float:
+        return self._t_min
+
+    @property
+    def t_max(self) -> float:
+        return self._t_max
+
+    @property
+    def tolerance(self) -> float:
+        """Maximum relative interpolation error within [t_min, t_max]"""
+        return self._tolerance
+
+    @property
+    def nodes(self) -> int:
+        return self._table.shape[1]
+
+    def exitance(self, temperature: ArrayLike, emissivity: ArrayLike = 1.0) -> np.ndarray:
+        """Spectral exitance [W/m^2/um] with shape temperature.shape + wavelength.shape"""
+        t = np.asarray(temperature, dtype=np.float64)
+        if np.any(~((t >= self._t_min) & (t <= self._t_max))):
+            raise ValueError(
+                f"Temperature(s) outside the table range [{self._t_min}, {self._t_max}] K"
+            )
+        position = (1.0 / t - self._u_min) / self._h
+        k = np.minimum(position.astype(np.intp), self.nodes - 2)
+        fraction = (position - k)[..., np.newaxis]
+
+        cube = np.take(self._table[0], k, axis=0)
+        step = np.take(self._table[1], k, axis=0)
+        step *= fraction
+        cube += step
+        emissivity = np.asarray(emissivity, dtype=np.float64)
+        if emissivity.ndim or emissivity != 1.0:
+            cube *= emissivity[..., np.newaxis]
+        return cube
+
+    def radiance(self, temperature: ArrayLike, emissivity: ArrayLike = 1.0) -> np.ndarray:
+        cube = self.exitance(temperature, emissivity)
+        cube /= np.pi
+        return cube
+
+    def save(self, path: str | Path) -> None:
+        """Write values and slopes to `path` (.npy) with metadata alongside (.json)"""
+        path = Path(path).with_suffix(".npy")
+        np.save(path, np.ascontiguousarray(self._table))
+        metadata = {
+            "wavelength": self._wavelength.tolist(),
+            "t_min": self._t_min,
+            "t_max": self._t_max,
+            "tolerance": self._tolerance,
+        }
+        path.with_suffix(".json").write_text(json.dumps(metadata))
+
+    @classmethod
+    def load(cls, path: str | Path, mmap_mode: str | None = "r") -> "PlanckTable":
+        """Read a saved table; memory-mapped read-only by default so processes share it"""
+        path = Path(path).with_suffix(".npy")
+        metadata = json.loads(path.with_suffix(".json").read_text())
+        table = np.load(path, mmap_mode=mmap_mode)
+        wavelength = np.asarray(metadata["wavelength"], dtype=np.float64)
+        if table.ndim != 3 or table.shape[0] != 2 or table.shape[2] != wavelength.size:
+            raise ValueError(f"Table {path} does not match its metadata")
+        self = cls.__new__(cls)
+        self._set(
+            table, wavelength, metadata["t_min"], metadata["t_max"], metadata["tolerance"]
+        )
+        return self
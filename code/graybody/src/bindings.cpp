@@ -0,0 +1,147 @@
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+#include <pybind11/numpy.h>
+#include <pybind11/pybind11.h>
+
+#include "planck.h"
+
+namespace py = pybind11;
+
+namespace {
+
+using Vector = py::array_t<double, py::array::c_style | py::array::forcecast>;
+
+void check_sizes(const Vector& c1_over_w5, const Vector& c2_over_w, const Vector& temperature,
+                 const Vector& scale) {
+  if (c2_over_w.size() != c1_over_w5.size()) {
+    throw std::invalid_argument("c1_over_w5 and c2_over_w must have the same size");
+  }
+  if (scale.size() != temperature.size()) {
+    throw std::invalid_argument("temperature and scale must have the same size");
+  }
+}
+
+// true for float32 out, false for float64; anything else is rejected
+bool check_out(const py::array& out, std::size_t size) {
+  const bool single = out.dtype().is(py::dtype::of<float>());
+  if (!(single || out.dtype().is(py::dtype::of<double>())) || !(out.flags() & py::array::c_style) ||
+      !out.writeable() || static_cast<std::size_t>(out.size()) != size) {
+    throw std::invalid_argument(
+        "out must be a writeable C-contiguous float64 or float32 array of rows x columns");
+  }
+  return single;
+}
+
+// Fill out (rows x columns, C-contiguous float64 or float32) in place; the GIL is released meanwhile
+void exitance(Vector c1_over_w5, Vector c2_over_w, Vector temperature, Vector scale, py::array out) {
+  check_sizes(c1_over_w5, c2_over_w, temperature, scale);
+  const auto columns = static_cast<std::size_t>(c1_over_w5.size());
+  const auto rows = static_cast<std::size_t>(temperature.size());
+  const bool single = check_out(out, rows * columns);
+  void* result = out.mutable_data();
+  py::gil_scoped_release release;
+  if (single) {
+    planck(c1_over_w5.data(), c2_over_w.data(), columns, temperature.data(), scale.data(), rows,
+           static_cast<float*>(result));
+  } else {
+    planck(c1_over_w5.data(), c2_over_w.data(), columns, temperature.data(), scale.data(), rows,
+           static_cast<double*>(result));
+  }
+}
+
+// exitance() with Wien / Rayleigh-Jeans where x = c2 / (w T) is past the limits; regime is
+// None or a C-contiguous int8 array of rows x columns receiving the Regime codes
+void exitance_regimes(Vector c1_over_w5, Vector c2_over_w, Vector temperature, Vector scale,
+                      double wien_limit, double rayleigh_jeans_limit, py::array out,
+                      py::object regime) {
+  check_sizes(c1_over_w5, c2_over_w, temperature, scale);
+  const auto columns = static_cast<std::size_t>(c1_over_w5.size());
+  const auto rows = static_cast<std::size_t>(temperature.size());
+  const bool single = check_out(out, rows * columns);
+  std::int8_t* codes = nullptr;
+  if (!regime.is_none()) {
+    auto array = regime.cast<py::array>();
+    if (!array.dtype().is(py::dtype::of<std::int8_t>()) || !(array.flags() & py::array::c_style) ||
+        !array.writeable() || static_cast<std::size_t>(array.size()) != rows * columns) {
+      throw std::invalid_argument("regime must be a writeable C-contiguous int8 array of rows x columns");
+    }
+    codes = static_cast<std::int8_t*>(array.mutable_data());
+  }
+  void* result = out.mutable_data();
+  py::gil_scoped_release release;
+  std::vector<double> c1_over_c2_w4(columns);
+  for (std::size_t c = 0; c < columns; c++) {
+    c1_over_c2_w4[c] = c1_over_w5.data()[c] / c2_over_w.data()[c];
+  }
+  if (single) {
+    planck_regimes(c1_over_w5.data(), c2_over_w.data(), c1_over_c2_w4.data(), columns,
+                   temperature.data(), scale.data(), rows, wien_limit, rayleigh_jeans_limit,
+                   static_cast<float*>(result), codes);
+  } else {
+    planck_regimes(c1_over_w5.data(), c2_over_w.data(), c1_over_c2_w4.data(), columns,
+                   temperature.data(), scale.data(), rows, wien_limit, rayleigh_jeans_limit,
+                   static_cast<double*>(result), codes);
+  }
+}
+
+// d_temperature (rows x columns) of scale * emissivity * Planck, plus its value and emissivity
+// derivative when value and d_emissivity are given; all from one shared expm1 per element
+void jacobian(Vector c1_over_w5, Vector c2_over_w, Vector temperature, Vector scale,
+              Vector emissivity, py::array d_temperature, py::object value,
+              py::object d_emissivity) {
+  check_sizes(c1_over_w5, c2_over_w, temperature, scale);
+  if (emissivity.size() != temperature.size()) {
+    throw std::invalid_argument("temperature and emissivity must have the same size");
+  }
+  const auto columns = static_cast<std::size_t>(c1_over_w5.size());
+  const auto rows = static_cast<std::size_t>(temperature.size());
+  const bool single = check_out(d_temperature, rows * columns);
+  if (value.is_none() != d_emissivity.is_none()) {
+    throw std::invalid_argument("value and d_emissivity must be given together");
+  }
+  void* values = nullptr;
+  void* d_emissivities = nullptr;
+  if (!value.is_none()) {
+    auto value_array = value.cast<py::array>();
+    auto d_emissivity_array = d_emissivity.cast<py::array>();
+    if (check_out(value_array, rows * columns) != single ||
+        check_out(d_emissivity_array, rows * columns) != single) {
+      throw std::invalid_argument("value and d_emissivity must have the dtype of d_temperature");
+    }
+    values = value_array.mutable_data();
+    d_emissivities = d_emissivity_array.mutable_data();
+  }
+  void* d_temperatures = d_temperature.mutable_data();
+  py::gil_scoped_release release;
+  if (single) {
+    planck_jacobian(c1_over_w5.data(), c2_over_w.data(), columns, temperature.data(), scale.data(),
+                    emissivity.data(), rows, static_cast<float*>(values),
+                    static_cast<float*>(d_temperatures), static_cast<float*>(d_emissivities));
+  } else {
+    planck_jacobian(c1_over_w5.data(), c2_over_w.data(), columns, temperature.data(), scale.data(),
+                    emissivity.data(), rows, static_cast<double*>(values),
+                    static_cast<double*>(d_temperatures), static_cast<double*>(d_emissivities));
+  }
+}
+
+}  // namespace
+
+PYBIND11_MODULE(_planck, m) {
+  m.doc() = "Fused Planck kernels (C++/pybind11); every entry point releases the GIL while computing";
+
+  m.def("exitance", &exitance, py::arg("c1_over_w5"), py::arg("c2_over_w"),
+        py::arg("temperature"), py::arg("scale"), py::arg("out"),
+        "out[r, c] = scale[r] * c1_over_w5[c] / expm1(c2_over_w[c] / temperature[r])");
+  m.def("exitance_regimes", &exitance_regimes, py::arg("c1_over_w5"), py::arg("c2_over_w"),
+        py::arg("temperature"), py::arg("scale"), py::arg("wien_limit"),
+        py::arg("rayleigh_jeans_limit"), py::arg("out"), py::arg("regime") = py::none(),
+        "exitance() using Wien / Rayleigh-Jeans on blocks of wavelengths past the x limits");
+  m.def("jacobian", &jacobian, py::arg("c1_over_w5"), py::arg("c2_over_w"),
+        py::arg("temperature"), py::arg("scale"), py::arg("emissivity"),
+        py::arg("d_temperature"), py::arg("value") = py::none(),
+        py::arg("d_emissivity") = py::none(),
+        "d/dT of scale * emissivity * exitance(), optionally with its value and d/d emissivity");
+}
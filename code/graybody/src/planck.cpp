@@ -0,0 +1,294 @@
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <limits>
+
+#include "planck.h"
+
+// Clone the kernel per instruction set and let the loader pick one (GCC ifuncs).
+// ISA-only targets, unlike arch=..., still let the inline helpers inline.
+#if defined(__GNUC__) && !defined(__clang__) && defined(__x86_64__) && defined(__linux__)
+#define PLANCK_TARGET_CLONES __attribute__((target_clones("default", "avx2", "avx512f")))
+#else
+#define PLANCK_TARGET_CLONES
+#endif
+
+// The kernel bodies must inline into every clone to be compiled for its ISA
+#if defined(__GNUC__)
+#define PLANCK_INLINE inline __attribute__((always_inline))
+#else
+#define PLANCK_INLINE inline
+#endif
+
+namespace {
+
+constexpr double kLog2e = 1.4426950408889634;
+constexpr double kLn2Hi = 6.93147180369123816490e-01;  // ln 2 split so k * kLn2Hi is exact
+constexpr double kLn2Lo = 1.90821492927058770002e-10;
+constexpr double kShift = 6755399441055744.0;  // 1.5 * 2^52: x + kShift rounds x to an integer
+constexpr double kOverflow = 710.0;            // exp overflows to inf beyond ln(DBL_MAX) = 709.78
+constexpr double kUnderflow = 708.0;           // exp(-x) leaves the normal range near x = 708.4
+constexpr std::size_t kBlock = 32;             // wavelengths that share one regime in planck_regimes
+
+/**
+ * @brief exp(r) - 1 for |r| <= ln 2 / 2 from its degree-13 Taylor polynomial
+ */
+inline double expm1_reduced(double r) {
+  double p = 1.0 / 6227020800.0;
+  p = p * r + 1.0 / 479001600.0;
+  p = p * r + 1.0 / 39916800.0;
+  p = p * r + 1.0 / 3628800.0;
+  p = p * r + 1.0 / 362880.0;
+  p = p * r + 1.0 / 40320.0;
+  p = p * r + 1.0 / 5040.0;
+  p = p * r + 1.0 / 720.0;
+  p = p * r + 1.0 / 120.0;
+  p = p * r + 1.0 / 24.0;
+  p = p * r + 1.0 / 6.0;
+  p = p * r + 0.5;
+  p = p * r + 1.0;
+  return p * r;
+}
+
+/**
+ * @brief 2^(k + offset) for the integer k held in the low bits of shifted = k + kShift
+ */
+inline double power_of_two(double shifted, std::uint64_t offset) {
+  std::uint64_t bits;
+  std::memcpy(&bits, &shifted, sizeof bits);
+  bits = (bits + 1023 + offset) << 52;
+  double power;
+  std::memcpy(&power, &bits, sizeof power);
+  return power;
+}
+
+/**
+ * @brief expm1(x) = exp(x) - 1 for x >= 0, +inf past the double range
+ *
+ * x = k ln 2 + r with |r| <= ln 2 / 2 and q = exp(r) - 1. For k = 0 the
+ * result is q itself, so small x keeps full precision instead of cancelling
+ * in exp(x) - 1; otherwise 2^k (1 + q) - 1, with 2^(k-1) finite up to
+ * k = 1024 and the doubling of 1 + q exact. Straight-line code, unlike
+ * std::expm1, so loops calling it vectorize.
+ */
+inline double expm1_nonnegative(double x) {
+  x = x < kOverflow ? x : kOverflow;  // also maps inf (T = 0) to a finite k
+  const double shifted = x * kLog2e + kShift;
+  const double k = shifted - kShift;
+  const double q = expm1_reduced((x - k * kLn2Hi) - k * kLn2Lo);
+  const double large = ((q + 1.0) * 2.0) * power_of_two(shifted, -1) - 1.0;
+  return k == 0.0 ? q : large;
+}
+
+/**
+ * @brief exp(-x) for x >= 0, flushed to 0 where it would leave the normal range
+ */
+inline double exp_negative(double x) {
+  const double y = x < kUnderflow ? -x : -kUnderflow;  // also maps inf (T = 0) to a finite k
+  const double shifted = y * kLog2e + kShift;
+  const double k = shifted - kShift;
+  const double value = (expm1_reduced((y - k * kLn2Hi) - k * kLn2Lo) + 1.0) *
+                       power_of_two(shifted, 0);
+  return x < kUnderflow ? value : 0.0;
+}
+
+/**
+ * @brief Shared body of the planck() overloads: computes in double, stores Out
+ */
+template <typename Out>
+PLANCK_INLINE void planck_rows(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+                        const double* temperature, const double* scale, std::size_t rows,
+                        Out* out) {
+  for (std::size_t r = 0; r < rows; r++) {
+    const double inverse = 1.0 / temperature[r];  // +inf for T = 0, giving expm1 = inf and 0 out
+    const double factor = scale[r];
+    Out* row = out + r * columns;
+    for (std::size_t c = 0; c < columns; c++) {
+      row[c] = static_cast<Out>(factor * c1_over_w5[c] /
+                                expm1_nonnegative(c2_over_w[c] * inverse));
+    }
+  }
+}
+
+/**
+ * @brief Shared body of the planck_regimes() overloads
+ *
+ * A row whose whole x range lies past one limit is evaluated with that
+ * formula: Rayleigh-Jeans (one multiply, as scale T c1/(c2 w^4)) when every
+ * x is <= rayleigh_jeans_limit, Wien (no division) when every x is
+ * >= wien_limit, and full Planck when no x reaches either. Only the
+ * remaining rows are walked in blocks of kBlock wavelengths, each block
+ * choosing the same way; the tail shorter than a block is Planck. Deciding
+ * per row or block keeps every inner loop branch-free and vectorized.
+ */
+template <typename Out>
+PLANCK_INLINE void planck_regime_rows(const double* c1_over_w5, const double* c2_over_w,
+                               const double* c1_over_c2_w4, std::size_t columns,
+                               const double* temperature, const double* scale, std::size_t rows,
+                               double wien_limit, double rayleigh_jeans_limit, Out* out,
+                               std::int8_t* regime) {
+  double c2_min = 0.0;
+  double c2_max = 0.0;
+  for (std::size_t c = 0; c < columns; c++) {
+    c2_min = c == 0 || c2_over_w[c] < c2_min ? c2_over_w[c] : c2_min;
+    c2_max = c == 0 || c2_over_w[c] > c2_max ? c2_over_w[c] : c2_max;
+  }
+  for (std::size_t r = 0; r < rows; r++) {
+    const double inverse = 1.0 / temperature[r];
+    const double factor = scale[r];
+    const double linear = factor * temperature[r];
+    Out* __restrict row = out + r * columns;
+    std::int8_t used = -1;
+    if (c2_max * inverse <= rayleigh_jeans_limit) {
+      used = kRayleighJeans;
+      for (std::size_t c = 0; c < columns; c++) {
+        row[c] = static_cast<Out>(linear * c1_over_c2_w4[c]);
+      }
+    } else if (c2_min * inverse >= wien_limit) {
+      used = kWien;
+      for (std::size_t c = 0; c < columns; c++) {
+        row[c] = static_cast<Out>(factor * c1_over_w5[c] * exp_negative(c2_over_w[c] * inverse));
+      }
+    } else if (c2_min * inverse > rayleigh_jeans_limit && c2_max * inverse < wien_limit) {
+      used = kPlanck;
+      for (std::size_t c = 0; c < columns; c++) {
+        row[c] = static_cast<Out>(factor * c1_over_w5[c] / expm1_nonnegative(c2_over_w[c] * inverse));
+      }
+    }
+    if (used >= 0) {
+      if (regime != nullptr) {
+        std::memset(regime + r * columns, used, columns);
+      }
+      continue;
+    }
+    std::size_t c = 0;
+    for (; c + kBlock <= columns; c += kBlock) {
+      const double* __restrict c1 = c1_over_w5 + c;
+      const double* __restrict c2 = c2_over_w + c;
+      const double* __restrict linear_terms = c1_over_c2_w4 + c;
+      Out* __restrict block = row + c;
+      int wien = 0;
+      int rayleigh_jeans = 0;
+      for (std::size_t i = 0; i < kBlock; i++) {
+        wien += c2[i] * inverse >= wien_limit;
+        rayleigh_jeans += c2[i] * inverse <= rayleigh_jeans_limit;
+      }
+      std::int8_t used = kPlanck;
+      if (rayleigh_jeans == static_cast<int>(kBlock)) {
+        used = kRayleighJeans;
+        for (std::size_t i = 0; i < kBlock; i++) {
+          block[i] = static_cast<Out>(linear * linear_terms[i]);
+        }
+      } else if (wien == static_cast<int>(kBlock)) {
+        used = kWien;
+        for (std::size_t i = 0; i < kBlock; i++) {
+          block[i] = static_cast<Out>(factor * c1[i] * exp_negative(c2[i] * inverse));
+        }
+      } else {
+        for (std::size_t i = 0; i < kBlock; i++) {
+          block[i] = static_cast<Out>(factor * c1[i] / expm1_nonnegative(c2[i] * inverse));
+        }
+      }
+      if (regime != nullptr) {
+        std::memset(regime + r * columns + c, used, kBlock);
+      }
+    }
+    for (std::size_t i = c; i < columns; i++) {
+      row[i] = static_cast<Out>(factor * c1_over_w5[i] / expm1_nonnegative(c2_over_w[i] * inverse));
+    }
+    if (regime != nullptr) {
+      std::memset(regime + r * columns + c, kPlanck, columns - c);
+    }
+  }
+}
+
+/**
+ * @brief Shared body of the planck_jacobian() overloads; Full also writes value and d_emissivity
+ */
+template <typename Out, bool Full>
+PLANCK_INLINE void planck_jacobian_rows(const double* __restrict c1_over_w5,
+                                 const double* __restrict c2_over_w, std::size_t columns,
+                                 const double* temperature, const double* scale,
+                                 const double* emissivity, std::size_t rows, Out* value,
+                                 Out* d_temperature, Out* d_emissivity) {
+  for (std::size_t r = 0; r < rows; r++) {
+    const double inverse = 1.0 / temperature[r];
+    // 1 / T, or 0 at T = 0 so that x / T stays finite where B is already 0
+    const double slope = inverse <= std::numeric_limits<double>::max() ? inverse : 0.0;
+    const double factor = scale[r];
+    const double weight = factor * emissivity[r];
+    Out* __restrict row_value = Full ? value + r * columns : nullptr;
+    Out* __restrict row_d_temperature = d_temperature + r * columns;
+    Out* __restrict row_d_emissivity = Full ? d_emissivity + r * columns : nullptr;
+    for (std::size_t c = 0; c < columns; c++) {
+      const double x = c2_over_w[c] * inverse;
+      const double g = 1.0 / expm1_nonnegative(x);  // 0 past the double range and at T = 0
+      const double planck = c1_over_w5[c] * g;
+      const double x_over_t = (x < kOverflow ? x : kOverflow) * slope;
+      // e^x / expm1(x) = 1 + g
+      row_d_temperature[c] = static_cast<Out>(weight * planck * (1.0 + g) * x_over_t);
+      if (Full) {
+        row_value[c] = static_cast<Out>(weight * planck);
+        row_d_emissivity[c] = static_cast<Out>(factor * planck);
+      }
+    }
+  }
+}
+
+}  // namespace
+
+PLANCK_TARGET_CLONES
+void planck(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+            const double* temperature, const double* scale, std::size_t rows, double* out) {
+  planck_rows(c1_over_w5, c2_over_w, columns, temperature, scale, rows, out);
+}
+
+PLANCK_TARGET_CLONES
+void planck(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+            const double* temperature, const double* scale, std::size_t rows, float* out) {
+  planck_rows(c1_over_w5, c2_over_w, columns, temperature, scale, rows, out);
+}
+
+PLANCK_TARGET_CLONES
+void planck_regimes(const double* c1_over_w5, const double* c2_over_w, const double* c1_over_c2_w4,
+                    std::size_t columns, const double* temperature, const double* scale,
+                    std::size_t rows, double wien_limit, double rayleigh_jeans_limit, double* out,
+                    std::int8_t* regime) {
+  planck_regime_rows(c1_over_w5, c2_over_w, c1_over_c2_w4, columns, temperature, scale, rows,
+                     wien_limit, rayleigh_jeans_limit, out, regime);
+}
+
+PLANCK_TARGET_CLONES
+void planck_regimes(const double* c1_over_w5, const double* c2_over_w, const double* c1_over_c2_w4,
+                    std::size_t columns, const double* temperature, const double* scale,
+                    std::size_t rows, double wien_limit, double rayleigh_jeans_limit, float* out,
+                    std::int8_t* regime) {
+  planck_regime_rows(c1_over_w5, c2_over_w, c1_over_c2_w4, columns, temperature, scale, rows,
+                     wien_limit, rayleigh_jeans_limit, out, regime);
+}
+
+PLANCK_TARGET_CLONES
+void planck_jacobian(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+                     const double* temperature, const double* scale, const double* emissivity,
+                     std::size_t rows, double* value, double* d_temperature, double* d_emissivity) {
+  if (value != nullptr && d_emissivity != nullptr) {
+    planck_jacobian_rows<double, true>(c1_over_w5, c2_over_w, columns, temperature, scale,
+                                       emissivity, rows, value, d_temperature, d_emissivity);
+  } else {
+    planck_jacobian_rows<double, false>(c1_over_w5, c2_over_w, columns, temperature, scale,
+                                        emissivity, rows, value, d_temperature, d_emissivity);
+  }
+}
+
+PLANCK_TARGET_CLONES
+void planck_jacobian(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+                     const double* temperature, const double* scale, const double* emissivity,
+                     std::size_t rows, float* value, float* d_temperature, float* d_emissivity) {
+  if (value != nullptr && d_emissivity != nullptr) {
+    planck_jacobian_rows<float, true>(c1_over_w5, c2_over_w, columns, temperature, scale,
+                                      emissivity, rows, value, d_temperature, d_emissivity);
+  } else {
+    planck_jacobian_rows<float, false>(c1_over_w5, c2_over_w, columns, temperature, scale,
+                                       emissivity, rows, value, d_temperature, d_emissivity);
+  }
+}
@@ -0,0 +1,91 @@
+#pragma once
+
+/**
+ * @file planck.h
+ * @brief Fused Planck kernels over (rows x wavelengths) buffers (pure C++)
+ */
+
+#include <cstddef>
+#include <cstdint>
+
+/// Formula used per element by planck_regimes (the values of graybody.Regime)
+enum Regime : std::int8_t { kPlanck = 0, kWien = 1, kRayleighJeans = 2 };
+
+/**
+ * @brief out[r][c] = scale[r] * c1_over_w5[c] / expm1(c2_over_w[c] / temperature[r])
+ *
+ * One pass over out per call: the exponential, both divisions and the scale
+ * (emissivity, 1/pi) happen in registers. expm1 keeps full precision as
+ * c2 / (w T) -> 0, and values beyond the double range give 0 rather than
+ * inf / inf. The inner loop is branch-free so the compiler vectorizes it, and
+ * on x86-64 Linux it is cloned for AVX2 and AVX-512 and picked at load time.
+ * T = 0 gives 0 without raising floating-point exceptions in Python.
+ *
+ * @param c1_over_w5 c1 / w^5 per wavelength [W/m^2/um]
+ * @param c2_over_w  c2 / w per wavelength [K]
+ * @param columns    Number of wavelengths
+ * @param temperature Absolute temperature per row [K], >= 0
+ * @param scale      Factor applied per row
+ * @param rows       Number of rows
+ * @param out        rows * columns values, row-major
+ */
+void planck(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+            const double* temperature, const double* scale, std::size_t rows, double* out);
+
+/**
+ * @brief float32 output of the same kernel: computed in double, rounded once on store
+ */
+void planck(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+            const double* temperature, const double* scale, std::size_t rows, float* out);
+
+/**
+ * @brief planck() with the Wien and Rayleigh-Jeans approximations where they are accurate
+ *
+ * Wien, scale c1/w^5 exp(-x), is used where x = c2 / (w T) >= wien_limit;
+ * Rayleigh-Jeans, scale T c1_over_c2_w4, where x <= rayleigh_jeans_limit; the
+ * limits come from the caller's error tolerance. Each decision covers a
+ * block of consecutive wavelengths, all of which must qualify, and the
+ * regime used for every element is written to regime when it is not null.
+ *
+ * @param c1_over_c2_w4        c1 / (c2 w^4) per wavelength [W/m^2/um/K]
+ * @param wien_limit           Smallest x evaluated with Wien
+ * @param rayleigh_jeans_limit Largest x evaluated with Rayleigh-Jeans
+ * @param regime               rows * columns Regime codes, or nullptr
+ */
+void planck_regimes(const double* c1_over_w5, const double* c2_over_w, const double* c1_over_c2_w4,
+                    std::size_t columns, const double* temperature, const double* scale,
+                    std::size_t rows, double wien_limit, double rayleigh_jeans_limit, double* out,
+                    std::int8_t* regime);
+
+/**
+ * @brief float32 output of planck_regimes(): computed in double, rounded once on store
+ */
+void planck_regimes(const double* c1_over_w5, const double* c2_over_w, const double* c1_over_c2_w4,
+                    std::size_t columns, const double* temperature, const double* scale,
+                    std::size_t rows, double wien_limit, double rayleigh_jeans_limit, float* out,
+                    std::int8_t* regime);
+
+/**
+ * @brief Temperature derivative of the planck() kernel, optionally with its value
+ *
+ * With B = c1_over_w5 / expm1(x) and x = c2_over_w / T, writes
+ * d_temperature[r][c] = d(scale emissivity B)/dT = scale emissivity B (x / T) e^x / expm1(x),
+ * sharing the single expm1 per element. When value and d_emissivity are not
+ * null (both or neither), the same pass also writes value = scale emissivity B
+ * and d_emissivity = scale B. T = 0 and exp overflow give 0 for all three.
+ *
+ * @param emissivity    Emissivity per row (use 1 to fold it into scale instead)
+ * @param value         rows * columns values, or nullptr
+ * @param d_temperature rows * columns derivatives by T [per K]
+ * @param d_emissivity  rows * columns derivatives by emissivity, or nullptr
+ */
+void planck_jacobian(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+                     const double* temperature, const double* scale, const double* emissivity,
+                     std::size_t rows, double* value, double* d_temperature, double* d_emissivity);
+
+/**
+ * @brief float32 outputs of planck_jacobian(): computed in double, rounded once on store
+ */
+void planck_jacobian(const double* c1_over_w5, const double* c2_over_w, std::size_t columns,
+                     const double* temperature, const double* scale, const double* emissivity,
+                     std::size_t rows, float* value, float* d_temperature, float* d_emissivity);
@@ -20,6 +20,16 @@ def mod():
     return importlib.import_module(MODULE_UNDER_TEST)
 
 
+@pytest.fixture(params=["compiled", "numpy"])
+def path(request, mod, monkeypatch):
+    """Run a test through the compiled kernel (when installed) and through NumPy"""
+    if request.param == "compiled" and mod.graybody._planck is None:
+        pytest.skip("graybody was built without the compiled _planck kernel")
+    if request.param == "numpy":
+        monkeypatch.setattr(mod.graybody, "_planck", None)
+    return request.param
+
+
 @pytest.fixture()
 def Blackbody(mod):
     return mod.Blackbody
@@ -28,3 +38,48 @@ def Blackbody(mod):
 @pytest.fixture()
 def Graybody(mod):
     return mod.Graybody
+
+
+@pytest.fixture()
+def BlackbodyArray(mod):
+    return mod.BlackbodyArray
+
+
+@pytest.fixture()
+def GraybodyArray(mod):
+    return mod.GraybodyArray
+
+
+@pytest.fixture()
+def PlanckTable(mod):
+    return mod.PlanckTable
+
+
+@pytest.fixture()
+def ParallelEvaluator(mod):
+    return mod.ParallelEvaluator
+
+
+@pytest.fixture()
+def SensorBand(mod):
+    return mod.SensorBand
+
+
+@pytest.fixture()
+def SensorModel(mod):
+    return mod.SensorModel
+
+
+@pytest.fixture()
+def EmissivityCurve(mod):
+    return mod.EmissivityCurve
+
+
+@pytest.fixture()
+def SelectiveEmitter(mod):
+    return mod.SelectiveEmitter
+
+
+@pytest.fixture()
+def EmissivityLibrary(mod):
+    return mod.EmissivityLibrary
@@ -0,0 +1,93 @@
+# =========================
+# tests/test_band.py
+# =========================
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+
+def _trapezoid(b, lambda_lo, lambda_hi, samples=200001):
+    w = np.linspace(lambda_lo, lambda_hi, samples)
+    y = b.exitance(w)
+    return float(np.sum((y[1:] + y[:-1]) * np.diff(w)) / 2.0)
+
+
+@pytest.mark.parametrize(
+    "T, lambda_lo, lambda_hi",
+    [
+        (300.0, 8.0, 14.0),     # both limits in the exponential series
+        (300.0, 3.0, 5.0),
+        (3000.0, 1.0, 20.0),    # band straddles the series crossover
+        (3000.0, 100.0, 200.0), # both limits in the Bernoulli series
+    ],
+)
+def test_band_exitance_matches_dense_quadrature(Blackbody, T, lambda_lo, lambda_hi):
+    b = Blackbody(absolute_temperature=T)
+    got = b.band_exitance(lambda_lo, lambda_hi)
+    assert isinstance(got, float)
+    assert got == pytest.approx(_trapezoid(b, lambda_lo, lambda_hi), rel=1e-8)
+
+
+def test_band_exitance_over_all_wavelengths_is_stefan_boltzmann(Blackbody):
+    """Agreement is limited by the rounded _c1/_c2 constants, not the series."""
+    sigma = 5.670374419e-8
+    b = Blackbody(absolute_temperature=300.0)
+    assert b.band_exitance(1e-3, 1e7) == pytest.approx(sigma * 300.0**4, rel=2e-4)
+
+
+def test_band_radiance_is_band_exitance_over_pi(Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+    assert g.band_radiance(8.0, 14.0) == pytest.approx(
+        g.band_exitance(8.0, 14.0) / math.pi, rel=1e-15
+    )
+
+
+def test_graybody_band_exitance_scales_by_emissivity(Blackbody, Graybody):
+    b = Blackbody(absolute_temperature=300.0)
+    g = Graybody(absolute_temperature=300.0, emissivity=0.25)
+    assert g.band_exitance(8.0, 14.0) == pytest.approx(
+        0.25 * b.band_exitance(8.0, 14.0), rel=1e-15
+    )
+
+
+def test_band_exitance_is_vectorized_over_population(Blackbody, GraybodyArray):
+    T = np.array([0.0, 200.0, 300.0, 6000.0])
+    g = GraybodyArray(absolute_temperature=T, emissivity=0.5)
+
+    got = g.band_radiance(8.0, 14.0)
+    expected = [0.5 * Blackbody(absolute_temperature=t).band_radiance(8.0, 14.0) for t in T]
+
+    assert got.shape == (4,)
+    assert got[0] == 0.0
+    assert np.allclose(got, expected, rtol=1e-14, atol=0.0)
+
+
+def test_band_exitance_tolerance_controls_truncation(Blackbody):
+    b = Blackbody(absolute_temperature=1000.0)
+    exact = b.band_exitance(2.5, 50.0, tolerance=1e-15)
+    coarse = b.band_exitance(2.5, 50.0, tolerance=1e-3)
+    assert coarse == pytest.approx(exact, rel=1e-3)
+
+
+@pytest.mark.parametrize("limits", [(14.0, 8.0), (8.0, 8.0), (0.0, 8.0), (-1.0, 8.0)])
+def test_band_exitance_raises_on_invalid_limits(Blackbody, limits):
+    b = Blackbody(absolute_temperature=300.0)
+    with pytest.raises(ValueError, match=r"Band limits"):
+        b.band_exitance(*limits)
+
+
+@pytest.mark.parametrize("x_hi, x_lo", [(0.0, 0.5), (0.1, 1.9), (0.5, 3.0), (2.5, 10.0)])
+def test_first_moment_series_matches_quadrature(x_hi, x_lo):
+    from graybody.band import planck_integral
+
+    t = np.linspace(x_hi, x_lo, 200001)[1:]
+    y = t * t / np.expm1(t)
+    y0 = 0.0 if x_hi == 0.0 else x_hi * x_hi / math.expm1(x_hi)
+    expected = float(np.sum(np.diff(np.r_[x_hi, t]) * (np.r_[y0, y[:-1]] + y)) / 2.0)
+    assert planck_integral(x_hi, x_lo, power=2) == pytest.approx(expected, rel=1e-8)
+    assert planck_integral(0.0, np.inf, power=2) == pytest.approx(2 * 1.2020569031595942, rel=1e-14)
+    with pytest.raises(ValueError, match="Power"):
+        planck_integral(x_hi, x_lo, power=4)
@@ -0,0 +1,67 @@
+# =========================
+# tests/test_from_arrays.py
+# =========================
+from __future__ import annotations
+
+import gc
+
+import numpy as np
+import pytest
+
+
+def test_from_arrays_matches_validated_constructor(Graybody):
+    T = np.array([280.0, 300.0, 320.0])
+    eps = np.array([0.5, 0.75, 1.0])
+
+    bulk = Graybody.from_arrays(absolute_temperature=T, emissivity=eps)
+    validated = [Graybody(absolute_temperature=t, emissivity=e) for t, e in zip(T, eps)]
+
+    assert bulk == validated
+    assert all(type(g) is Graybody for g in bulk)
+    assert isinstance(bulk[0].absolute_temperature, float)
+    assert bulk[1].radiance(10.0) == validated[1].radiance(10.0)
+
+
+def test_from_arrays_instances_are_frozen(Blackbody):
+    b = Blackbody.from_arrays(absolute_temperature=[300.0])[0]
+    with pytest.raises(Exception):
+        b.absolute_temperature = 280.0
+    assert b.model_fields_set == {"absolute_temperature"}
+
+
+def test_from_arrays_broadcasts_scalar_columns(Graybody):
+    bulk = Graybody.from_arrays(absolute_temperature=[280.0, 300.0], emissivity=0.9)
+    assert [g.emissivity for g in bulk] == [0.9, 0.9]
+
+
+@pytest.mark.parametrize(
+    "T, eps, match",
+    [
+        ([300.0, -1.0], [0.5, 0.5], r"absolute_temperature"),
+        ([300.0, 300.0], [0.5, 1.5], r"emissivity"),
+        ([300.0, 300.0], [np.nan, 0.5], r"emissivity"),
+    ],
+)
+def test_from_arrays_enforces_field_constraints(Graybody, T, eps, match):
+    with pytest.raises(ValueError, match=match):
+        Graybody.from_arrays(absolute_temperature=T, emissivity=eps)
+
+
+def test_from_arrays_requires_exactly_the_model_fields(Graybody):
+    with pytest.raises(ValueError, match=r"missing \['emissivity'\]"):
+        Graybody.from_arrays(absolute_temperature=[300.0])
+    with pytest.raises(ValueError, match=r"unexpected \['color'\]"):
+        Graybody.from_arrays(absolute_temperature=[300.0], emissivity=[0.5], color=[1.0])
+
+
+@pytest.mark.parametrize("pause_gc", [False, True])
+@pytest.mark.parametrize("enabled", [True, False])
+def test_from_arrays_leaves_gc_state_alone(Graybody, pause_gc, enabled):
+    was_enabled = gc.isenabled()
+    (gc.enable if enabled else gc.disable)()
+    try:
+        bulk = Graybody.from_arrays(pause_gc=pause_gc, absolute_temperature=[300.0], emissivity=0.5)
+        assert gc.isenabled() is enabled
+    finally:
+        (gc.enable if was_enabled else gc.disable)()
+    assert bulk == [Graybody(absolute_temperature=300.0, emissivity=0.5)]
@@ -0,0 +1,80 @@
+# =========================
+# tests/test_inverse.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+def test_brightness_temperature_inverts_radiance(mod, BlackbodyArray):
+    T = np.array([150.0, 300.0, 1000.0, 4000.0])
+    w = np.linspace(3.0, 14.0, 5)
+    L = BlackbodyArray(absolute_temperature=T).radiance(w)
+
+    got = mod.brightness_temperature(L, w)
+
+    assert got.shape == (4, 5)
+    assert np.allclose(got, T[:, None], rtol=1e-13, atol=0.0)
+
+
+def test_brightness_temperature_with_emissivity(mod, Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+    got = mod.brightness_temperature(g.radiance(10.0), 10.0, emissivity=0.6)
+    assert isinstance(got, float)
+    assert got == pytest.approx(300.0, rel=1e-13)
+
+
+def test_brightness_temperature_of_zero_radiance_is_zero(mod):
+    assert mod.brightness_temperature(0.0, 10.0) == 0.0
+
+
+@pytest.mark.parametrize(
+    "radiance, wavelength, emissivity, match",
+    [
+        (-1.0, 10.0, 1.0, r"Radiance"),
+        (np.nan, 10.0, 1.0, r"Radiance"),
+        (1.0, 0.0, 1.0, r"Wavelength"),
+        (1.0, 10.0, 0.0, r"Emissivity"),
+    ],
+)
+def test_brightness_temperature_invalid_inputs_raise(mod, radiance, wavelength, emissivity, match):
+    with pytest.raises(ValueError, match=match):
+        mod.brightness_temperature(radiance, wavelength, emissivity=emissivity)
+
+
+@pytest.mark.parametrize("band", [(8.0, 14.0), (3.0, 5.0)])
+def test_band_inverter_recovers_temperature(mod, BlackbodyArray, band):
+    rng = np.random.default_rng(0)
+    T = rng.uniform(100.0, 5000.0, size=(50, 40))
+    L = BlackbodyArray(absolute_temperature=T).band_radiance(*band)
+
+    inverter = mod.BandTemperatureInverter(lambda_lo=band[0], lambda_hi=band[1])
+
+    assert np.allclose(inverter(L), T, rtol=1e-7, atol=0.0)
+    assert np.allclose(inverter(L, iterations=1), T, rtol=1e-13, atol=0.0)
+
+
+def test_band_inverter_scalar_and_emissivity(mod, Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.8)
+    inverter = mod.BandTemperatureInverter(lambda_lo=8.0, lambda_hi=14.0)
+
+    got = inverter(g.band_radiance(8.0, 14.0), emissivity=0.8)
+
+    assert isinstance(got, float)
+    assert got == pytest.approx(300.0, rel=1e-8)
+    assert inverter(0.0) == 0.0
+
+
+def test_band_inverter_raises_outside_table(mod, Blackbody):
+    inverter = mod.BandTemperatureInverter(lambda_lo=8.0, lambda_hi=14.0, t_max=1000.0)
+    L = Blackbody(absolute_temperature=2000.0).band_radiance(8.0, 14.0)
+    with pytest.raises(ValueError, match=r"outside the table range"):
+        inverter(L)
+
+
+def test_band_inverter_invalid_configuration_raises(mod):
+    with pytest.raises(ValueError):
+        mod.BandTemperatureInverter(lambda_lo=14.0, lambda_hi=8.0)
+    with pytest.raises(ValueError):
+        mod.BandTemperatureInverter(lambda_lo=8.0, lambda_hi=14.0, t_min=500.0, t_max=400.0)
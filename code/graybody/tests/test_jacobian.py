@@ -0,0 +1,122 @@
+# =========================
+# tests/test_jacobian.py
+# =========================
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+
+def test_matches_central_differences(path, GraybodyArray):
+    T = np.array([20.0, 300.0, 6000.0])
+    eps = np.array([0.3, 0.9, 1.0])
+    w = np.geomspace(0.3, 1e4, 25)
+    g = GraybodyArray(absolute_temperature=T, emissivity=eps)
+    h = 1e-6
+
+    radiance, jacobian = g.radiance_and_jacobian(w)
+
+    hot = GraybodyArray(absolute_temperature=T * (1 + h), emissivity=eps).radiance(w)
+    cold = GraybodyArray(absolute_temperature=T * (1 - h), emissivity=eps).radiance(w)
+    d_temperature = (hot - cold) / (2 * h * T[:, None])
+    assert jacobian.shape == (2, 3, 25)
+    assert np.allclose(radiance, g.radiance(w), rtol=1e-14, atol=0.0)
+    assert np.allclose(jacobian[0], d_temperature, rtol=1e-6, atol=1e-300)
+    assert np.allclose(jacobian[1] * eps[:, None], radiance, rtol=1e-14, atol=0.0)
+
+
+def test_single_derivatives_match_combined(path, GraybodyArray):
+    rng = np.random.default_rng(3)
+    g = GraybodyArray(
+        absolute_temperature=rng.uniform(200.0, 400.0, size=(4, 1)),
+        emissivity=rng.uniform(0.5, 1.0, size=(4, 5)),
+    )
+    w = np.linspace(8.0, 14.0, 7)
+
+    _, jacobian = g.radiance_and_jacobian(w)
+
+    assert np.allclose(g.d_radiance_dT(w), jacobian[0], rtol=1e-14, atol=0.0)
+    assert np.allclose(g.d_radiance_d_emissivity(w), jacobian[1], rtol=1e-14, atol=0.0)
+
+
+def test_scalar_model(path, Blackbody, Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.8)
+
+    radiance, jacobian = g.radiance_and_jacobian(10.0)
+
+    assert isinstance(radiance, float)
+    assert jacobian.shape == (2,)
+    assert jacobian[0] == pytest.approx(g.d_radiance_dT(10.0), rel=1e-14)
+    assert jacobian[1] == pytest.approx(Blackbody(absolute_temperature=300.0).radiance(10.0))
+    assert Blackbody(absolute_temperature=300.0).d_radiance_dT(10.0) == pytest.approx(
+        jacobian[0] / 0.8, rel=1e-14
+    )
+
+
+def test_compiled_kernel_matches_numpy(mod, GraybodyArray, monkeypatch):
+    if mod.graybody._planck is None:
+        pytest.skip("graybody was built without the compiled _planck kernel")
+    rng = np.random.default_rng(9)
+    g = GraybodyArray(
+        absolute_temperature=rng.uniform(1.0, 6000.0, size=30),
+        emissivity=rng.uniform(0.0, 1.0, size=30),
+    )
+    w = np.geomspace(0.2, 1000.0, 21)
+
+    fused = g.radiance_and_jacobian(w)
+    monkeypatch.setattr(mod.graybody, "_planck", None)
+    expected = g.radiance_and_jacobian(w)
+
+    for a, b in zip(fused, expected):
+        assert np.allclose(a, b, rtol=1e-13, atol=0.0)
+        assert np.array_equal(a == 0.0, b == 0.0)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_zero_temperature_and_overflow_are_silent(path, GraybodyArray, dtype):
+    g = GraybodyArray(absolute_temperature=[0.0, 1.0], emissivity=[0.5, 0.5])
+    w = np.array([0.1, 1.0, 10.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        radiance, jacobian = g.radiance_and_jacobian(w, dtype=dtype)
+        d_temperature = g.d_radiance_dT(w, dtype=dtype)
+    assert radiance.dtype == jacobian.dtype == d_temperature.dtype == dtype
+    assert np.array_equal(radiance, np.zeros((2, 3)))
+    assert np.array_equal(jacobian, np.zeros((2, 2, 3)))
+    assert np.array_equal(d_temperature, np.zeros((2, 3)))
+
+
+def test_float32_and_buffers(path, GraybodyArray):
+    g = GraybodyArray(absolute_temperature=[250.0, 300.0, 350.0], emissivity=0.9)
+    w = np.linspace(8.0, 14.0, 6)
+    out = np.empty((3, 6), dtype=np.float32)
+    jacobian = np.empty((2, 3, 6), dtype=np.float32)
+
+    result = g.radiance_and_jacobian(w, out=out, jacobian=jacobian, dtype=np.float32)
+
+    assert result[0] is out and result[1] is jacobian
+    assert np.allclose(jacobian, g.radiance_and_jacobian(w)[1], rtol=2e-6, atol=0.0)
+
+
+def test_selective_emitter_derivative(path, Blackbody, mod):
+    curve = mod.EmissivityCurve(wavelength=[8.0, 14.0], emissivity=[0.6, 0.9])
+    s = mod.SelectiveEmitter(absolute_temperature=300.0, emissivity=curve)
+    w = np.linspace(8.0, 14.0, 5)
+
+    expected = np.linspace(0.6, 0.9, 5) * Blackbody(absolute_temperature=300.0).d_radiance_dT(w)
+    assert np.allclose(s.d_radiance_dT(w), expected, rtol=1e-14, atol=0.0)
+
+
+def test_validation(Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.9)
+    w = np.ones(3)
+    with pytest.raises(ValueError, match="jacobian must be"):
+        g.radiance_and_jacobian(w, jacobian=np.empty((3, 2)))
+    with pytest.raises(ValueError, match="jacobian must be"):
+        g.radiance_and_jacobian(w, jacobian=np.empty((2, 3), dtype=np.float32))
+    with pytest.raises(ValueError, match="out must be"):
+        g.radiance_and_jacobian(w, out=np.empty(4))
+    with pytest.raises(ValueError, match="out must be"):
+        g.d_radiance_dT(w, out=np.empty(3, dtype=np.float32))
@@ -0,0 +1,51 @@
+# =========================
+# tests/test_parallel.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 7), (4, 7), (3, 1000)])
+def test_parallel_matches_serial_bitwise(ParallelEvaluator, GraybodyArray, workers, chunk_size):
+    rng = np.random.default_rng(3)
+    g = GraybodyArray(
+        absolute_temperature=rng.uniform(200.0, 400.0, size=(19, 5)),
+        emissivity=rng.uniform(0.5, 1.0, size=(19, 5)),
+    )
+    w = np.linspace(8.0, 14.0, 9)
+
+    with ParallelEvaluator(workers=workers, chunk_size=chunk_size) as pool:
+        assert np.array_equal(pool.exitance(g, w), g.exitance(w))
+        assert np.array_equal(pool.radiance(g, w), g.radiance(w))
+
+
+def test_parallel_broadcast_population_and_out(ParallelEvaluator, Blackbody, GraybodyArray):
+    g = GraybodyArray(absolute_temperature=300.0, emissivity=[0.2, 0.4, 0.6, 0.8])
+    grid = Blackbody.prepare(np.linspace(8.0, 14.0, 3))
+    out = np.empty((4, 3))
+
+    with ParallelEvaluator(workers=2, chunk_size=1) as pool:
+        result = pool.radiance(g, grid, out=out)
+
+    assert result is out
+    assert np.array_equal(out, g.radiance(grid))
+
+
+def test_parallel_blackbody_population(ParallelEvaluator, BlackbodyArray):
+    b = BlackbodyArray(absolute_temperature=np.linspace(250.0, 350.0, 50))
+    with ParallelEvaluator(workers=2, chunk_size=8) as pool:
+        assert np.array_equal(pool.exitance(b, 10.0), b.exitance(10.0))
+
+
+def test_parallel_rejects_invalid_configuration(ParallelEvaluator, BlackbodyArray):
+    with pytest.raises(ValueError, match=r"workers"):
+        ParallelEvaluator(workers=0)
+    with pytest.raises(ValueError, match=r"chunk_size"):
+        ParallelEvaluator(chunk_size=0)
+
+    b = BlackbodyArray(absolute_temperature=[300.0, 310.0])
+    with ParallelEvaluator(workers=1) as pool:
+        with pytest.raises(ValueError, match=r"out must be"):
+            pool.exitance(b, [8.0, 10.0], out=np.empty((2, 2))[:, :1])
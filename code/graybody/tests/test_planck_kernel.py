@@ -0,0 +1,73 @@
+# =========================
+# tests/test_planck_kernel.py
+# =========================
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture()
+def numpy_path(mod, monkeypatch):
+    """Evaluate through the NumPy ufuncs even when the compiled kernel is installed"""
+    monkeypatch.setattr(mod.graybody, "_planck", None)
+
+
+@pytest.fixture()
+def planck(mod):
+    if mod.graybody._planck is None:
+        pytest.skip("graybody was built without the compiled _planck kernel")
+    return mod.graybody._planck
+
+
+def test_compiled_kernel_matches_numpy(planck, mod, GraybodyArray, monkeypatch):
+    rng = np.random.default_rng(7)
+    g = GraybodyArray(
+        absolute_temperature=np.append(rng.uniform(1.0, 6000.0, size=40), [0.0, 5.0]),
+        emissivity=rng.uniform(0.0, 1.0, size=42),
+    )
+    w = np.geomspace(0.2, 1000.0, 33)
+
+    fused = g.radiance(w)
+    monkeypatch.setattr(mod.graybody, "_planck", None)
+    expected = g.radiance(w)
+
+    assert np.allclose(fused, expected, rtol=1e-14, atol=0.0)
+    assert np.array_equal(fused == 0.0, expected == 0.0)
+
+
+def test_compiled_kernel_zero_temperature_is_silent(planck, Blackbody):
+    b = Blackbody(absolute_temperature=0.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert np.array_equal(b.radiance(np.linspace(8.0, 14.0, 5)), np.zeros(5))
+
+
+def test_compiled_kernel_rejects_bad_out(planck):
+    ones = np.ones(3)
+    with pytest.raises(ValueError):
+        planck.exitance(ones, ones, ones[:2], ones[:2], np.empty((3, 2)).T)
+    with pytest.raises(ValueError):
+        planck.exitance(ones, ones, ones[:2], ones[:2], np.empty((2, 3), dtype=np.float16))
+    with pytest.raises(ValueError):
+        planck.exitance(ones, ones[:2], ones[:2], ones[:2], np.empty((2, 3)))
+
+
+def test_noncontiguous_out_falls_back_to_numpy(Blackbody, BlackbodyArray):
+    b = BlackbodyArray(absolute_temperature=[250.0, 300.0, 350.0])
+    w = np.linspace(8.0, 14.0, 4)
+    out = np.empty((4, 3)).T
+
+    result = b.exitance(w, out=out)
+
+    assert result is out
+    assert np.allclose(out, b.exitance(w), rtol=1e-14, atol=0.0)
+
+
+def test_numpy_path_matches_closed_form(numpy_path, Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+    w = np.linspace(8.0, 14.0, 7)
+    expected = 0.6 * Graybody._c1 / (w**5 * (np.exp(Graybody._c2 / (w * 300.0)) - 1.0)) / np.pi
+    assert np.allclose(g.radiance(w), expected, rtol=1e-14, atol=0.0)
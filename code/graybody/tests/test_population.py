@@ -0,0 +1,83 @@
+# =========================
+# tests/test_population.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+def test_blackbody_array_matches_scalar_blackbody(Blackbody, BlackbodyArray):
+    T = np.array([250.0, 300.0, 350.0])
+    w = np.linspace(8.0, 14.0, 7)
+
+    got = BlackbodyArray(absolute_temperature=T).exitance(w)
+    expected = np.array([Blackbody(absolute_temperature=t).exitance(w) for t in T])
+
+    assert got.shape == (3, 7)
+    assert np.allclose(got, expected, rtol=1e-14, atol=0.0)
+
+
+def test_graybody_array_matches_scalar_graybody(Graybody, GraybodyArray):
+    T = np.array([[280.0, 300.0], [310.0, 320.0]])
+    eps = np.array([[0.6, 0.75], [0.9, 1.0]])
+    w = np.linspace(8.0, 14.0, 5)
+
+    g = GraybodyArray(absolute_temperature=T, emissivity=eps)
+    got = g.radiance(w)
+
+    assert got.shape == (2, 2, 5)
+    for idx in np.ndindex(T.shape):
+        expected = Graybody(absolute_temperature=T[idx], emissivity=eps[idx]).radiance(w)
+        assert np.allclose(got[idx], expected, rtol=1e-14, atol=0.0)
+
+
+def test_graybody_array_broadcasts_temperature_and_emissivity(GraybodyArray):
+    g = GraybodyArray(absolute_temperature=300.0, emissivity=[0.2, 0.5, 1.0])
+    assert g.shape == (3,)
+
+    y = g.exitance([8.0, 10.0])
+    assert y.shape == (3, 2)
+    assert np.allclose(y[0] / y[2], 0.2, rtol=1e-15, atol=0.0)
+
+
+def test_scalar_wavelength_returns_population_shape(BlackbodyArray):
+    b = BlackbodyArray(absolute_temperature=[280.0, 300.0])
+    assert b.exitance(10.0).shape == (2,)
+
+
+@pytest.mark.parametrize("T", [[300.0, -1.0], [np.nan, 300.0]])
+def test_blackbody_array_invalid_temperature_raises(BlackbodyArray, T):
+    with pytest.raises(ValueError, match=r"temperature"):
+        BlackbodyArray(absolute_temperature=T)
+
+
+@pytest.mark.parametrize("eps", [[0.5, 1.1], [-0.1, 0.5], [np.nan, 0.5]])
+def test_graybody_array_invalid_emissivity_raises(GraybodyArray, eps):
+    with pytest.raises(ValueError, match=r"Emissivity"):
+        GraybodyArray(absolute_temperature=[300.0, 300.0], emissivity=eps)
+
+
+def test_graybody_array_incompatible_shapes_raise(GraybodyArray):
+    with pytest.raises(ValueError, match=r"broadcast"):
+        GraybodyArray(absolute_temperature=[300.0, 310.0], emissivity=[0.5, 0.6, 0.7])
+
+
+def test_population_arrays_are_frozen(GraybodyArray):
+    T = np.array([300.0, 310.0])
+    g = GraybodyArray(absolute_temperature=T, emissivity=0.5)
+
+    with pytest.raises(Exception):
+        g.emissivity = np.array(0.7)
+    with pytest.raises(ValueError):
+        g.absolute_temperature[0] = 0.0
+
+    # The caller's array is copied, not aliased
+    T[0] = 0.0
+    assert g.absolute_temperature[0] == 300.0
+
+
+def test_population_exitance_raises_on_nonpositive_wavelength(BlackbodyArray):
+    b = BlackbodyArray(absolute_temperature=[300.0])
+    with pytest.raises(ValueError, match=r"Wavelength\(s\) must be > 0"):
+        b.exitance([8.0, 0.0])
@@ -0,0 +1,69 @@
+# =========================
+# tests/test_precision.py
+# =========================
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+
+def test_float32_within_documented_error(path, BlackbodyArray):
+    T = np.linspace(150.0, 6000.0, 60)
+    w = np.geomspace(0.3, 1000.0, 50)
+    b = BlackbodyArray(absolute_temperature=T)
+
+    reference = b.radiance(w)
+    single = b.radiance(w, dtype=np.float32)
+
+    assert single.dtype == np.float32
+    x = 1.43879e04 / (w[None, :] * T[:, None])
+    normal = (x < 88.0) & (reference > np.finfo(np.float32).tiny)
+    bound = 6e-8 if path == "compiled" else 5e-7 * (1.0 + x[normal])
+    assert np.all(np.abs(single[normal] / reference[normal] - 1.0) <= bound)
+
+
+def test_float64_accurate_as_x_goes_to_zero(path, Blackbody):
+    # x = c2 / (w T) ~ 2e-6: exp(x) - 1 would keep only ~10 significant digits
+    b = Blackbody(absolute_temperature=6000.0)
+    w = np.array([1e3, 1e4, 1e6])
+    x = Blackbody._c2 / (w * 6000.0)
+    expected = Blackbody._c1 / (w**5 * np.expm1(x))
+    assert np.allclose(b.exitance(w), expected, rtol=1e-14, atol=0.0)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_zero_temperature_and_overflow_are_silent(path, Graybody, dtype):
+    w = np.array([0.1, 1.0, 10.0])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cold = Graybody(absolute_temperature=0.0, emissivity=0.5).radiance(w, dtype=dtype)
+        # c2 / (0.1 um * 1 K) = 1.4e5 overflows exp in both precisions
+        tiny = Graybody(absolute_temperature=1.0, emissivity=0.5).radiance(w, dtype=dtype)
+    assert np.array_equal(cold, np.zeros(3))
+    assert np.array_equal(tiny, np.zeros(3))
+
+
+def test_float32_out_and_parallel(path, ParallelEvaluator, GraybodyArray):
+    rng = np.random.default_rng(5)
+    g = GraybodyArray(
+        absolute_temperature=rng.uniform(200.0, 400.0, size=(13, 4)),
+        emissivity=rng.uniform(0.5, 1.0, size=(13, 4)),
+    )
+    w = np.linspace(8.0, 14.0, 6)
+    out = np.empty((13, 4, 6), dtype=np.float32)
+
+    result = g.radiance(w, out=out, dtype=np.float32)
+
+    assert result is out
+    with ParallelEvaluator(workers=3, chunk_size=5) as pool:
+        assert np.array_equal(pool.radiance(g, w, dtype=np.float32), out)
+
+
+def test_dtype_validation(Blackbody):
+    b = Blackbody(absolute_temperature=300.0)
+    with pytest.raises(ValueError, match="dtype must be"):
+        b.exitance(10.0, dtype=np.float16)
+    with pytest.raises(ValueError, match="out must be"):
+        b.exitance(np.ones(3), out=np.empty(3), dtype=np.float32)
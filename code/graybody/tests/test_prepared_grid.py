@@ -0,0 +1,63 @@
+# =========================
+# tests/test_prepared_grid.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+def test_prepare_caches_planck_terms(Blackbody):
+    w = np.linspace(8.0, 14.0, 7)
+    grid = Blackbody.prepare(w)
+
+    assert grid.shape == (7,)
+    assert np.allclose(grid.c1_over_w5, Blackbody._c1 / w**5, rtol=1e-15, atol=0.0)
+    assert np.allclose(grid.c2_over_w, Blackbody._c2 / w, rtol=1e-15, atol=0.0)
+    with pytest.raises(ValueError):
+        grid.c2_over_w[0] = 0.0
+
+
+def test_prepare_validates_wavelengths_once(Blackbody):
+    with pytest.raises(ValueError, match=r"Wavelength\(s\) must be > 0"):
+        Blackbody.prepare([8.0, 0.0])
+
+
+def test_prepared_grid_matches_raw_wavelengths(Graybody):
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+    w = np.linspace(8.0, 14.0, 7)
+    grid = Graybody.prepare(w)
+
+    assert np.array_equal(g.exitance(grid), g.exitance(w))
+    assert g.radiance(Graybody.prepare(10.0)) == g.radiance(10.0)
+
+
+def test_exitance_writes_into_out(Blackbody, Graybody):
+    w = np.linspace(8.0, 14.0, 7)
+    grid = Blackbody.prepare(w)
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+    out = np.empty(7)
+
+    result = g.radiance(grid, out=out)
+
+    assert result is out
+    expected = 0.6 * Blackbody(absolute_temperature=300.0).exitance(w) / np.pi
+    assert np.allclose(out, expected, rtol=1e-15, atol=0.0)
+
+
+def test_population_exitance_writes_into_out(Blackbody, GraybodyArray):
+    grid = Blackbody.prepare(np.linspace(8.0, 14.0, 7))
+    g = GraybodyArray(absolute_temperature=[280.0, 300.0, 320.0], emissivity=[0.5, 0.7, 0.9])
+    out = np.empty((3, 7))
+
+    result = g.exitance(grid, out=out)
+
+    assert result is out
+    assert np.array_equal(out, g.exitance(grid.wavelength))
+
+
+@pytest.mark.parametrize("out", [np.empty(6), np.empty(7, dtype=np.float32)])
+def test_exitance_rejects_mismatched_out(Blackbody, out):
+    b = Blackbody(absolute_temperature=300.0)
+    with pytest.raises(ValueError, match=r"out must be"):
+        b.exitance(Blackbody.prepare(np.linspace(8.0, 14.0, 7)), out=out)
@@ -0,0 +1,151 @@
+# =========================
+# tests/test_regime.py
+# =========================
+from __future__ import annotations
+
+import warnings
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("accuracy", [1e-2, 1e-4, 1e-8])
+def test_error_within_accuracy(path, BlackbodyArray, accuracy):
+    b = BlackbodyArray(absolute_temperature=np.append(np.geomspace(50.0, 6000.0, 40), 0.0))
+    w = np.geomspace(0.2, 1e5, 160)
+
+    reference = b.exitance(w)
+    approximate = b.exitance(w, accuracy=accuracy)
+
+    nonzero = reference > 0.0
+    assert np.array_equal(approximate > 0.0, nonzero)
+    assert np.all(np.abs(approximate[nonzero] / reference[nonzero] - 1.0) <= accuracy * (1 + 1e-9))
+
+
+@pytest.mark.parametrize(
+    "w, expected",
+    [
+        (np.linspace(11.0, 14.0, 64), 0),  # LWIR at 300 K: x ~ 3.3 - 4.5
+        (np.linspace(0.4, 0.7, 64), 1),  # visible at 300 K: x > 68
+        (np.geomspace(1e4, 1e6, 64), 2),  # radio at 300 K: x < 5e-3
+    ],
+)
+def test_uniform_regime_is_reported(path, mod, GraybodyArray, w, expected):
+    g = GraybodyArray(absolute_temperature=[290.0, 300.0, 310.0], emissivity=[0.9, 0.95, 1.0])
+    regime = np.full((3, 64), -1, dtype=np.int8)
+
+    result = g.radiance(w, accuracy=1e-2, regime=regime)
+
+    assert np.all(regime == mod.Regime(expected))
+    assert np.allclose(result, g.radiance(w), rtol=1e-2, atol=0.0)
+
+
+def test_compiled_kernel_mixes_regimes_per_block(mod, BlackbodyArray):
+    if mod.graybody._planck is None:
+        pytest.skip("graybody was built without the compiled _planck kernel")
+    b = BlackbodyArray(absolute_temperature=[300.0])
+    w = np.geomspace(0.4, 1e7, 256)  # x from 120 down to 5e-6
+    regime = np.empty((1, 256), dtype=np.int8)
+
+    b.exitance(w, accuracy=1e-4, regime=regime)
+
+    # Wien at the short end, Planck in between, Rayleigh-Jeans at the long end
+    assert regime[0, 0] == mod.Regime.WIEN
+    assert regime[0, 128] == mod.Regime.PLANCK
+    assert regime[0, -1] == mod.Regime.RAYLEIGH_JEANS
+    assert np.all(np.diff(regime[0][regime[0] != mod.Regime.WIEN]) >= 0)
+
+
+def test_numpy_path_chooses_per_element(mod, monkeypatch, BlackbodyArray):
+    monkeypatch.setattr(mod.graybody, "_planck", None)
+    b = BlackbodyArray(absolute_temperature=[300.0, 0.0])
+    w = np.geomspace(0.4, 1e7, 256)  # x from 120 down to 5e-6 at 300 K
+    regime = np.empty((2, 256), dtype=np.int8)
+
+    result = b.exitance(w, accuracy=1e-4, regime=regime)
+
+    x = mod.Blackbody.prepare(w).c2_over_w * (1.0 / 300.0)
+    expected = np.full(256, mod.Regime.PLANCK)
+    expected[x >= mod.regime.wien_limit(1e-4)] = mod.Regime.WIEN
+    expected[x <= mod.regime.rayleigh_jeans_limit(1e-4)] = mod.Regime.RAYLEIGH_JEANS
+    assert len(set(expected.tolist())) == 3
+    assert np.array_equal(regime[0], expected)
+    assert np.all(regime[1] == mod.Regime.WIEN) and np.all(result[1] == 0.0)
+    # Each element is the same whichever array it is evaluated in
+    single = np.array([b.exitance(w[i:i + 1], accuracy=1e-4)[0, 0] for i in range(0, 256, 17)])
+    assert np.array_equal(single, result[0, ::17])
+
+
+def test_default_is_full_planck(path, mod, Blackbody):
+    b = Blackbody(absolute_temperature=300.0)
+    w = np.geomspace(0.4, 1e5, 50)
+    regime = np.empty(50, dtype=np.int8)
+
+    assert np.array_equal(b.exitance(w, regime=regime), b.exitance(w))
+    assert np.all(regime == mod.Regime.PLANCK)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_zero_temperature_is_silent(path, Graybody, dtype):
+    w = np.geomspace(0.4, 1e5, 40)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        cold = Graybody(absolute_temperature=0.0, emissivity=0.5).radiance(
+            w, dtype=dtype, accuracy=1e-3
+        )
+    assert np.array_equal(cold, np.zeros(40))
+
+
+def test_parallel_matches_serial(path, ParallelEvaluator, GraybodyArray):
+    rng = np.random.default_rng(11)
+    g = GraybodyArray(
+        absolute_temperature=rng.uniform(200.0, 400.0, size=(13, 4)),
+        emissivity=rng.uniform(0.5, 1.0, size=(13, 4)),
+    )
+    w = np.geomspace(0.4, 1e5, 70)
+    serial_regime = np.empty((13, 4, 70), dtype=np.int8)
+    parallel_regime = np.empty_like(serial_regime)
+
+    serial = g.radiance(w, accuracy=1e-4, regime=serial_regime)
+    with ParallelEvaluator(workers=3, chunk_size=5) as pool:
+        parallel = pool.radiance(g, w, accuracy=1e-4, regime=parallel_regime)
+
+    assert np.array_equal(parallel_regime, serial_regime)
+    assert np.array_equal(parallel, serial)
+
+
+def test_parallel_chunks_do_not_change_regimes(path, mod, ParallelEvaluator, BlackbodyArray):
+    # The first chunk alone is all Wien; the whole array is not
+    b = BlackbodyArray(absolute_temperature=[5.0] * 5 + [300.0] * 8)
+    w = np.geomspace(0.4, 20.0, 40)
+    serial_regime = np.empty((13, 40), dtype=np.int8)
+    parallel_regime = np.empty_like(serial_regime)
+
+    serial = b.exitance(w, accuracy=1e-4, regime=serial_regime)
+    with ParallelEvaluator(workers=2, chunk_size=5) as pool:
+        parallel = pool.exitance(b, w, accuracy=1e-4, regime=parallel_regime)
+
+    assert np.all(serial_regime[:5] == mod.Regime.WIEN)
+    assert np.array_equal(parallel_regime, serial_regime)
+    assert np.array_equal(parallel, serial)
+
+
+def test_limits():
+    from graybody.regime import rayleigh_jeans_limit, wien_limit
+
+    assert wien_limit(1e-4) == pytest.approx(-np.log(1e-4))
+    x = rayleigh_jeans_limit(1e-4)
+    assert np.expm1(x) / x - 1.0 == pytest.approx(1e-4, rel=1e-6)
+
+
+def test_validation(Blackbody):
+    b = Blackbody(absolute_temperature=300.0)
+    w = np.ones(3)
+    with pytest.raises(ValueError, match="accuracy must be"):
+        b.exitance(w, accuracy=0.0)
+    with pytest.raises(ValueError, match="accuracy must be"):
+        b.exitance(w, accuracy=1.5)
+    with pytest.raises(ValueError, match="regime must be"):
+        b.exitance(w, regime=np.empty(3, dtype=np.int64))
+    with pytest.raises(ValueError, match="regime must be"):
+        b.exitance(w, regime=np.empty(4, dtype=np.int8))
@@ -0,0 +1,149 @@
+# =========================
+# tests/test_selective.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture()
+def quartz(EmissivityCurve):
+    return EmissivityCurve(wavelength=[8.0, 9.0, 10.0, 14.0], emissivity=[0.9, 0.6, 0.8, 0.95])
+
+
+def test_constant_curve_matches_graybody(EmissivityCurve, SelectiveEmitter, Graybody):
+    flat = EmissivityCurve(wavelength=[1.0, 20.0], emissivity=[0.6, 0.6])
+    s = SelectiveEmitter(absolute_temperature=300.0, emissivity=flat)
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+
+    w = np.linspace(8.0, 14.0, 7)
+    assert np.allclose(s.radiance(w), g.radiance(w), rtol=1e-15, atol=0.0)
+    assert isinstance(s.radiance(10.0), float)
+    assert s.radiance(10.0) == pytest.approx(g.radiance(10.0), rel=1e-15)
+
+
+def test_selective_exitance_applies_interpolated_curve(quartz, SelectiveEmitter, Blackbody):
+    s = SelectiveEmitter(absolute_temperature=300.0, emissivity=quartz)
+    b = Blackbody(absolute_temperature=300.0)
+    w = np.array([8.0, 8.5, 9.0, 12.0, 16.0])
+
+    expected = np.array([0.9, 0.75, 0.6, 0.8 + 0.15 * 0.5, 0.95]) * b.exitance(w)
+    assert np.allclose(s.exitance(w), expected, rtol=1e-14, atol=0.0)
+
+
+def test_resample_is_cached_per_prepared_grid(quartz, Blackbody):
+    grid = Blackbody.prepare(np.linspace(8.0, 14.0, 7))
+
+    first = quartz.resample(grid)
+
+    assert quartz.resample(grid) is first
+    assert quartz.resample(Blackbody.prepare(grid.wavelength)) is not first
+    assert not first.flags.writeable
+
+
+def test_library_evaluates_many_materials_together(
+    quartz, EmissivityCurve, EmissivityLibrary, SelectiveEmitter, Blackbody
+):
+    paint = EmissivityCurve(wavelength=[8.0, 14.0], emissivity=[0.95, 0.97])
+    library = EmissivityLibrary({"quartz": quartz, "paint": paint})
+    grid = Blackbody.prepare(np.linspace(8.0, 14.0, 13))
+    T = np.array([[290.0, 300.0, 310.0]])
+    material = np.array([[0, 1, library.index("quartz")]])
+
+    got = library.radiance(T, material, grid)
+
+    assert got.shape == (1, 3, 13)
+    assert library.resample(grid) is library.resample(grid)
+    for j, (t, m) in enumerate(zip(T[0], material[0])):
+        curve = library[library.names[m]]
+        expected = SelectiveEmitter(absolute_temperature=t, emissivity=curve).radiance(grid)
+        assert np.allclose(got[0, j], expected, rtol=1e-15, atol=0.0)
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_library_matches_gathered_emissivity(
+    quartz, EmissivityCurve, EmissivityLibrary, BlackbodyArray, mod, monkeypatch, dtype
+):
+    # A tiny gather buffer forces many blocks, including a short last one
+    monkeypatch.setattr(mod.selective, "_GATHER_BYTES", 7 * 13 * np.dtype(dtype).itemsize)
+    paint = EmissivityCurve(wavelength=[8.0, 14.0], emissivity=[0.95, 0.97])
+    library = EmissivityLibrary({"quartz": quartz, "paint": paint})
+    w = np.linspace(8.0, 14.0, 13)
+    rng = np.random.default_rng(4)
+    T = rng.uniform(250.0, 350.0, size=(5, 1))
+    material = rng.integers(0, 2, size=(5, 9))
+
+    expected = BlackbodyArray(absolute_temperature=np.broadcast_to(T, material.shape)).exitance(w)
+    expected *= library.resample(w)[material]
+
+    got = library.exitance(T, material, w, dtype=dtype)
+    assert got.dtype == dtype
+    assert np.allclose(got, expected, rtol=1e-6 if dtype == np.float32 else 1e-15, atol=0.0)
+
+    # Strided output arrays are filled in place as well
+    out = np.empty((5, 9, 26), dtype)[..., ::2]
+    assert library.exitance(T, material, w, out=out, dtype=dtype) is out
+    assert np.allclose(out, expected, rtol=1e-6 if dtype == np.float32 else 1e-15, atol=0.0)
+
+
+def test_library_rejects_bad_material_indices(quartz, EmissivityLibrary):
+    library = EmissivityLibrary({"quartz": quartz})
+    with pytest.raises(ValueError, match=r"Material index"):
+        library.exitance([300.0], [1], [10.0])
+    with pytest.raises(ValueError, match=r"integer"):
+        library.exitance([300.0], [0.0], [10.0])
+    with pytest.raises(KeyError):
+        library.index("basalt")
+
+
+@pytest.mark.parametrize(
+    "wavelength, emissivity",
+    [([9.0, 8.0], [0.5, 0.5]), ([8.0, 9.0], [0.5, 1.2]), ([8.0, 9.0], [0.5])],
+)
+def test_invalid_curve_raises(EmissivityCurve, wavelength, emissivity):
+    with pytest.raises(ValueError):
+        EmissivityCurve(wavelength=wavelength, emissivity=emissivity)
+
+
+def test_curve_from_file(EmissivityCurve, tmp_path):
+    np.savetxt(tmp_path / "quartz.txt", [[8.0, 0.9], [9.0, 0.6]])
+    curve = EmissivityCurve.from_file(tmp_path / "quartz.txt")
+    assert np.array_equal(curve.emissivity, [0.9, 0.6])
+
+
+def _trapezoid(s, lambda_lo, lambda_hi, samples=400001):
+    w = np.union1d(np.linspace(lambda_lo, lambda_hi, samples), s.emissivity.wavelength)
+    w = w[(w >= lambda_lo) & (w <= lambda_hi)]
+    y = s.exitance(w)
+    return float(np.sum((y[1:] + y[:-1]) * np.diff(w)) / 2.0)
+
+
+@pytest.mark.parametrize(
+    "T, lambda_lo, lambda_hi",
+    [
+        (300.0, 8.0, 14.0),    # band limits on the knots
+        (300.0, 8.25, 9.5),    # limits between knots
+        (300.0, 3.0, 30.0),    # constant emissivity beyond both ends
+        (3000.0, 9.2, 9.8),    # inside one linear piece
+    ],
+)
+def test_selective_band_exitance_matches_quadrature(
+    quartz, SelectiveEmitter, T, lambda_lo, lambda_hi
+):
+    s = SelectiveEmitter(absolute_temperature=T, emissivity=quartz)
+    got = s.band_exitance(lambda_lo, lambda_hi)
+    assert isinstance(got, float)
+    assert got == pytest.approx(_trapezoid(s, lambda_lo, lambda_hi), rel=1e-8)
+
+
+def test_selective_band_integrals_match_graybody(EmissivityCurve, SelectiveEmitter, Graybody):
+    flat = EmissivityCurve(wavelength=[1.0, 20.0], emissivity=[0.6, 0.6])
+    s = SelectiveEmitter(absolute_temperature=300.0, emissivity=flat)
+    g = Graybody(absolute_temperature=300.0, emissivity=0.6)
+
+    assert s.band_exitance(3.0, 30.0) == pytest.approx(g.band_exitance(3.0, 30.0), rel=1e-13)
+    assert s.band_radiance(8.0, 14.0) == pytest.approx(g.band_radiance(8.0, 14.0), rel=1e-13)
+    assert SelectiveEmitter(absolute_temperature=0.0, emissivity=flat).band_exitance(8.0, 14.0) == 0.0
+    with pytest.raises(ValueError, match="Band limits"):
+        s.band_exitance(14.0, 8.0)
@@ -0,0 +1,83 @@
+# =========================
+# tests/test_sensor.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+def _triangle(SensorBand, name, center, width=1.0):
+    return SensorBand(
+        name=name,
+        wavelength=[center - width, center, center + width],
+        response=[0.0, 1.0, 0.0],
+    )
+
+
+def test_weights_are_normalized_per_channel(SensorBand, SensorModel):
+    bands = [_triangle(SensorBand, f"ch{i}", c) for i, c in enumerate([9.0, 11.0, 12.5])]
+    sensor = SensorModel(bands, np.linspace(7.0, 14.0, 141))
+
+    assert sensor.weights.shape == (141, 3)
+    assert sensor.names == ["ch0", "ch1", "ch2"]
+    assert np.allclose(sensor.weights.sum(axis=0), 1.0, rtol=1e-15, atol=0.0)
+
+
+def test_channel_radiance_matches_per_channel_loop(SensorBand, SensorModel, Graybody, GraybodyArray):
+    bands = [_triangle(SensorBand, f"ch{i}", c) for i, c in enumerate([9.0, 11.0])]
+    w = np.linspace(7.0, 13.0, 241)
+    sensor = SensorModel(bands, w)
+    T = np.array([[280.0, 300.0], [320.0, 340.0]])
+    eps = np.array([[0.9, 0.8], [0.7, 0.95]])
+
+    got = sensor.channel_radiance(GraybodyArray(absolute_temperature=T, emissivity=eps))
+
+    assert got.shape == (2, 2, 2)
+    for idx in np.ndindex(T.shape):
+        L = Graybody(absolute_temperature=T[idx], emissivity=eps[idx]).radiance(w)
+        for c, band in enumerate(bands):
+            R = np.interp(w, band.wavelength, band.response, left=0.0, right=0.0)
+            expected = np.trapezoid(L * R, w) / np.trapezoid(R, w)
+            assert got[idx + (c,)] == pytest.approx(expected, rel=1e-13)
+
+
+def test_flat_spectrum_is_preserved(SensorBand, SensorModel):
+    sensor = SensorModel([_triangle(SensorBand, "a", 10.0), _triangle(SensorBand, "b", 12.0)])
+    flat = np.full((4,) + sensor.grid.shape, 3.5)
+    assert np.allclose(sensor.integrate(flat), 3.5, rtol=1e-15, atol=0.0)
+
+
+def test_scalar_body_gives_one_value_per_channel(SensorBand, SensorModel, Blackbody):
+    sensor = SensorModel([_triangle(SensorBand, "a", 10.0), _triangle(SensorBand, "b", 12.0)])
+    assert sensor.channel_radiance(Blackbody(absolute_temperature=300.0)).shape == (2,)
+
+
+def test_load_bands_and_tables_from_files(SensorBand, SensorModel, tmp_path):
+    w = np.linspace(8.0, 12.0, 9)
+    r1 = np.exp(-((w - 9.0) ** 2))
+    r2 = np.exp(-((w - 11.0) ** 2))
+    np.savetxt(tmp_path / "b1.txt", np.column_stack([w, r1]))
+    np.savetxt(tmp_path / "sensor.txt", np.column_stack([w, r1, r2]))
+
+    band = SensorBand.from_file(tmp_path / "b1.txt")
+    sensor = SensorModel.from_file(tmp_path / "sensor.txt", names=["b1", "b2"])
+
+    assert band.name == "b1"
+    assert np.allclose(band.response, r1)
+    assert sensor.names == ["b1", "b2"]
+    assert np.array_equal(SensorModel([band], w).weights[:, 0], sensor.weights[:, 0])
+
+
+@pytest.mark.parametrize(
+    "wavelength, response",
+    [([10.0, 9.0], [1.0, 1.0]), ([9.0, 10.0], [0.0, 0.0]), ([9.0, 10.0], [1.0, -1.0])],
+)
+def test_invalid_band_raises(SensorBand, wavelength, response):
+    with pytest.raises(ValueError):
+        SensorBand(name="bad", wavelength=wavelength, response=response)
+
+
+def test_band_outside_grid_raises(SensorBand, SensorModel):
+    with pytest.raises(ValueError, match=r"no response"):
+        SensorModel([_triangle(SensorBand, "swir", 2.0)], np.linspace(8.0, 14.0, 7))
@@ -0,0 +1,83 @@
+# =========================
+# tests/test_streaming.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+@pytest.fixture()
+def scene(tmp_path):
+    rng = np.random.default_rng(2)
+    T = np.lib.format.open_memmap(tmp_path / "T.npy", mode="w+", shape=(37, 11))
+    eps = np.lib.format.open_memmap(tmp_path / "eps.npy", mode="w+", shape=(37, 11))
+    T[:] = rng.uniform(250.0, 330.0, T.shape)
+    eps[:] = rng.uniform(0.8, 1.0, eps.shape)
+    return T, eps
+
+
+def test_write_radiance_into_memmap_matches_direct(mod, GraybodyArray, scene, tmp_path):
+    T, eps = scene
+    w = np.linspace(8.0, 14.0, 5)
+    out = np.lib.format.open_memmap(tmp_path / "L.npy", mode="w+", shape=(37, 11, 5))
+
+    # A budget of 3 rows per tile forces a ragged final tile
+    mod.write_radiance(T, w, out, emissivity=eps, tile_bytes=3 * 11 * 5 * 8)
+
+    expected = GraybodyArray(absolute_temperature=T, emissivity=eps).radiance(w)
+    assert np.array_equal(np.load(tmp_path / "L.npy"), expected)
+
+
+def test_iter_radiance_tiles_respects_budget(mod, scene):
+    T, _ = scene
+    w = np.linspace(8.0, 14.0, 5)
+    budget = 4 * 11 * 5 * 8
+
+    tiles = list(mod.iter_radiance_tiles(T, w, emissivity=0.9, tile_bytes=budget))
+
+    assert [rows.start for rows, _ in tiles] == list(range(0, 37, 4))
+    assert all(tile.nbytes <= budget for _, tile in tiles)
+    assert sum(tile.shape[0] for _, tile in tiles) == 37
+
+
+def test_streaming_float32(mod, GraybodyArray, scene, tmp_path):
+    T, eps = scene
+    w = np.linspace(8.0, 14.0, 5)
+    budget = 4 * 11 * 5 * 4
+    expected = GraybodyArray(absolute_temperature=T, emissivity=eps).radiance(w, dtype=np.float32)
+
+    tiles = list(
+        mod.iter_radiance_tiles(T, w, emissivity=eps, tile_bytes=budget, dtype=np.float32)
+    )
+    out = np.lib.format.open_memmap(
+        tmp_path / "L.npy", mode="w+", dtype=np.float32, shape=(37, 11, 5)
+    )
+    mod.write_radiance(T, w, out, emissivity=eps, tile_bytes=budget)
+
+    # The budget counts float32 bytes: 4 rows per tile, not 2
+    assert [rows.start for rows, _ in tiles] == list(range(0, 37, 4))
+    assert all(tile.dtype == np.float32 for _, tile in tiles)
+    assert np.array_equal(np.concatenate([tile for _, tile in tiles]), expected)
+    assert np.array_equal(np.load(tmp_path / "L.npy"), expected)
+
+
+def test_iter_radiance_tiles_from_tile_iterables(mod, GraybodyArray):
+    w = np.array([10.0, 12.0])
+    T_tiles = [np.full((2, 3), 300.0), np.full((1, 3), 310.0)]
+    eps_tiles = [np.full((2, 3), 0.5), np.full((1, 3), 0.6)]
+
+    tiles = list(mod.iter_radiance_tiles(iter(T_tiles), w, emissivity=iter(eps_tiles)))
+
+    assert [rows for rows, _ in tiles] == [slice(0, 2), slice(2, 3)]
+    expected = GraybodyArray(absolute_temperature=T_tiles[1], emissivity=0.6).radiance(w)
+    assert np.array_equal(tiles[1][1], expected)
+
+
+def test_streaming_rejects_mismatched_inputs(mod, scene):
+    T, _ = scene
+    w = np.array([10.0])
+    with pytest.raises(ValueError, match=r"Emissivity"):
+        list(mod.iter_radiance_tiles(T, w, emissivity=np.ones((37, 10))))
+    with pytest.raises(ValueError, match=r"too small"):
+        mod.write_radiance(T, w, np.empty((36, 11, 1)))
@@ -0,0 +1,75 @@
+# =========================
+# tests/test_table.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+
+@pytest.mark.parametrize("tolerance", [1e-3, 1e-6])
+def test_table_meets_its_error_bound(PlanckTable, BlackbodyArray, tolerance):
+    w = np.linspace(3.0, 14.0, 23)
+    table = PlanckTable(w, t_min=150.0, t_max=1500.0, tolerance=tolerance)
+
+    T = np.random.default_rng(1).uniform(150.0, 1500.0, size=5000)
+    expected = BlackbodyArray(absolute_temperature=T).exitance(w)
+    got = table.exitance(T)
+
+    assert got.shape == (5000, 23)
+    assert np.max(np.abs(got / expected - 1.0)) <= tolerance
+
+
+def test_tighter_tolerance_means_more_nodes(PlanckTable):
+    w = np.linspace(8.0, 14.0, 7)
+    coarse = PlanckTable(w, 200.0, 400.0, tolerance=1e-3)
+    fine = PlanckTable(w, 200.0, 400.0, tolerance=1e-6)
+    assert fine.nodes > coarse.nodes
+
+
+def test_table_matches_exact_values_at_range_ends(PlanckTable, Blackbody):
+    w = np.linspace(8.0, 14.0, 7)
+    table = PlanckTable(w, 200.0, 400.0)
+    for T in (200.0, 400.0):
+        expected = Blackbody(absolute_temperature=T).exitance(w)
+        assert np.allclose(table.exitance(T), expected, rtol=1e-14, atol=0.0)
+
+
+def test_table_radiance_with_emissivity(PlanckTable, GraybodyArray):
+    w = np.linspace(8.0, 14.0, 7)
+    T = np.array([250.0, 300.0])
+    eps = np.array([0.5, 0.9])
+    table = PlanckTable(w, 200.0, 400.0, tolerance=1e-8)
+
+    expected = GraybodyArray(absolute_temperature=T, emissivity=eps).radiance(w)
+    assert np.allclose(table.radiance(T, eps), expected, rtol=1e-8, atol=0.0)
+
+
+def test_table_rejects_temperatures_outside_range(PlanckTable):
+    table = PlanckTable([10.0], 200.0, 400.0)
+    with pytest.raises(ValueError, match=r"outside the table range"):
+        table.exitance([300.0, 401.0])
+
+
+@pytest.mark.parametrize(
+    "args",
+    [([10.0, 0.0], 200.0, 400.0), ([10.0], 400.0, 200.0), ([10.0], 0.0, 200.0)],
+)
+def test_table_invalid_configuration_raises(PlanckTable, args):
+    with pytest.raises(ValueError):
+        PlanckTable(*args)
+
+
+def test_table_save_and_memory_mapped_load(PlanckTable, tmp_path):
+    w = np.linspace(8.0, 14.0, 7)
+    table = PlanckTable(w, 200.0, 400.0, tolerance=1e-5)
+    table.save(tmp_path / "lwir")
+
+    loaded = PlanckTable.load(tmp_path / "lwir")
+
+    assert isinstance(loaded._table, np.memmap)
+    assert loaded.nodes == table.nodes
+    assert loaded.tolerance == table.tolerance
+    assert np.array_equal(loaded.wavelength, w)
+    T = np.array([210.0, 305.5, 399.0])
+    assert np.array_equal(loaded.exitance(T), table.exitance(T))
@@ -0,0 +1,82 @@
+"""
+Compare two result files written by kernels.py --json.
+
+Usage:
+    python3 benchmarks/compare.py baseline.json new.json [--tolerance 0.1]
+
+Cases are matched on (kernel, N, threads). A case regresses when its median
+grew by more than --tolerance and by more than the larger of the two
+interquartile ranges (so run-to-run noise alone does not trip it). The exit
+status is 1 when any case regressed. Files recorded with different backends,
+machines or core counts are not compared at all (exit status 2).
+"""
+import argparse
+import json
+import sys
+
+from pathlib import Path
+
+
+# Metadata that must agree for timings to be comparable
+MATCHING_META = ("backend", "machine", "cpu_count")
+
+
+def compare(baseline: dict, new: dict, tolerance: float) -> list[dict]:
+    """Print the matched cases side by side; return those that regressed
+
+    Raises ValueError when the two runs differ in any MATCHING_META field.
+    """
+    differ = [
+        f"{field} {baseline['meta'].get(field)!r} vs {new['meta'].get(field)!r}"
+        for field in MATCHING_META
+        if baseline["meta"].get(field) != new["meta"].get(field)
+    ]
+    if differ:
+        raise ValueError(f"runs are not comparable: {', '.join(differ)}")
+    old = {(r["kernel"], r["n"], r["threads"]): r for r in baseline["results"]}
+    print(f"\nbaseline {baseline['meta']['commit']} -> {new['meta']['commit']}")
+    print(
+        f"{'kernel':<18} {'N':>8} {'threads':>7} {'old [s]':>10} {'new [s]':>10} "
+        f"{'ratio':>6} {'':>10}"
+    )
+    regressions = []
+    for result in new["results"]:
+        key = (result["kernel"], result["n"], result["threads"])
+        if key not in old:
+            continue
+        before, after = old[key]["median"], result["median"]
+        ratio = after / before
+        noise = max(old[key]["iqr"], result["iqr"])
+        verdict = ""
+        if ratio > 1 + tolerance and after - before > noise:
+            verdict = "REGRESSION"
+            regressions.append(result)
+        elif ratio < 1 - tolerance and before - after > noise:
+            verdict = "faster"
+        print(
+            f"{key[0]:<18} {key[1]:>8.0e} {key[2]:>7d} {before:10.3e} {after:10.3e} "
+            f"{ratio:6.2f} {verdict:>10}"
+        )
+    print(f"{len(regressions)} regression(s) beyond {tolerance:.0%}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("new", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+
+    baseline = json.loads(args.baseline.read_text())
+    new = json.loads(args.new.read_text())
+    try:
+        regressions = compare(baseline, new, args.tolerance)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(2)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
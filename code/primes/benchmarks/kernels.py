@@ -0,0 +1,281 @@
+"""
+Scaling benchmark of every primes kernel for N = 10^2 ... 10^8.
+
+Usage:
+    python3 benchmarks/kernels.py [--kernels K ...] [--min-exp 2] [--max-exp 8]
+                                  [--threads 1 4] [--repeat R] [--json out.json]
+                                  [--compare baseline.json] [--tolerance 0.1]
+                                  [--backend cpp|numpy]
+
+Each (kernel, N, threads) case is warmed up, then timed --repeat times; a
+sample loops the call until it lasts at least --min-time so that small N are
+not lost in timer resolution. The median and interquartile range per call are
+reported, with the local scaling exponent d log t / d log N between
+neighbouring N. Peak memory is the growth of the peak resident set size while
+one call runs, measured in a fresh process per case (--no-memory skips it).
+
+--json writes the results with the commit, interpreter and core count they were
+measured on; --compare checks this run against such a file (see compare.py)
+and exits with status 1 on a regression.
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import math
+import multiprocessing
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+import primes
+
+try:
+    import resource
+except ImportError:  # not on Windows: peak memory is not reported
+    resource = None
+
+RANGE_OFFSET = 10**12  # primes_in_range sieves [10^12, 10^12 + N)
+SEED = 0
+
+
+def _random_values(n: int, bits: int) -> np.ndarray:
+    return np.random.default_rng(SEED).integers(0, 2**bits, n, dtype=np.uint64)
+
+
+def _random_indices(n: int) -> np.ndarray:
+    return np.random.default_rng(SEED).integers(1, n + 1, n, dtype=np.uint64)
+
+
+# name -> (inputs for N, call(inputs, threads), largest N by default, takes threads=)
+KERNELS = {
+    "nth_prime": (lambda n: n, lambda n, t: primes.nth_prime(n, threads=t), 10**8, True),
+    "nth_prime_array": (
+        _random_indices, lambda a, t: primes.nth_prime(a, threads=t), 10**6, True,
+    ),
+    "prime_count": (lambda n: n, lambda n, t: primes.prime_count(n, threads=t), 10**8, True),
+    "primes_up_to": (lambda n: n, lambda n, t: primes.primes_up_to(n, threads=t), 10**8, True),
+    "primes_in_range": (
+        lambda n: (RANGE_OFFSET, RANGE_OFFSET + n),
+        lambda r, t: primes.primes_in_range(*r, threads=t),
+        10**8,
+        True,
+    ),
+    "iter_prime_chunks": (
+        lambda n: n,
+        lambda n, t: sum(chunk.size for chunk in primes.iter_prime_chunks(0, n)),
+        10**8,
+        False,
+    ),
+    "is_prime_array": (
+        lambda n: _random_values(n, 64), lambda a, t: primes.is_prime(a, threads=t), 10**7, True,
+    ),
+    "next_prime_array": (
+        lambda n: _random_values(n, 63), lambda a, t: primes.next_prime(a, threads=t), 10**6, True,
+    ),
+    "prev_prime_array": (
+        lambda n: _random_values(n, 63) + np.uint64(3),
+        lambda a, t: primes.prev_prime(a, threads=t),
+        10**6,
+        True,
+    ),
+    "factorize_array": (
+        lambda n: _random_values(n, 63) + np.uint64(1),
+        lambda a, t: primes.factorize(a, threads=t),
+        10**5,
+        True,
+    ),
+}
+
+
+def sample_times(fn, repeat: int, warmup: int, min_time: float) -> tuple[list[float], int]:
+    """Seconds per call for each of `repeat` samples, and the calls per sample"""
+    for _ in range(warmup):
+        fn()
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t0
+        if elapsed >= min_time:
+            break
+        number *= 10
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - t0) / number)
+    return times, number
+
+
+def _max_rss() -> int:
+    """Peak resident set size of this process in bytes"""
+    try:
+        # unlike ru_maxrss, VmHWM is not inherited from the parent across fork + exec
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == "darwin" else usage * 1024  # bytes on macOS, KiB elsewhere
+
+
+def _peak_child(backend: str, kernel: str, n: int, threads: int) -> int:
+    primes.set_backend(backend)
+    setup, call, _, _ = KERNELS[kernel]
+    inputs = setup(n)
+    gc.collect()
+    before = _max_rss()
+    call(inputs, threads)
+    return _max_rss() - before
+
+
+def peak_memory(kernel: str, n: int, threads: int) -> int | None:
+    """Growth of the peak RSS during one call, in bytes, measured in a fresh process"""
+    if resource is None:
+        return None
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(_peak_child, (primes.get_backend(), kernel, n, threads))
+
+
+def resolve_threads(threads: int) -> int:
+    return threads if threads > 0 else os.cpu_count() or 1
+
+
+def metadata(args: argparse.Namespace) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+        dirty = bool(subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=Path(__file__).parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    return {
+        "commit": commit,
+        "dirty": dirty,
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "backend": primes.get_backend(),
+        "repeat": args.repeat,
+        "warmup": args.warmup,
+        "min_time": args.min_time,
+    }
+
+
+def run(args: argparse.Namespace) -> list[dict]:
+    results = []
+    for kernel in args.kernels:
+        setup, call, largest, threaded = KERNELS[kernel]
+        thread_counts = sorted({resolve_threads(t) for t in args.threads}) if threaded else [1]
+        for threads in thread_counts:
+            print(f"\n{kernel} (threads={threads})")
+            print(
+                f"{'N':>10} {'median [s]':>12} {'IQR [s]':>10} {'calls':>6} "
+                f"{'slope':>6} {'peak [MiB]':>10}"
+            )
+            previous = None
+            for exponent in range(args.min_exp, args.max_exp + 1):
+                n = 10**exponent
+                if n > (args.max_n or largest):
+                    break
+                inputs = setup(n)
+                times, number = sample_times(
+                    lambda: call(inputs, threads), args.repeat, args.warmup, args.min_time
+                )
+                del inputs
+                q1, median, q3 = statistics.quantiles(times, n=4, method="inclusive")
+                peak = None if args.no_memory else peak_memory(kernel, n, threads)
+                slope = ""
+                if previous is not None:
+                    slope = f"{math.log(median / previous[1]) / math.log(n / previous[0]):6.2f}"
+                previous = (n, median)
+                results.append({
+                    "kernel": kernel,
+                    "n": n,
+                    "threads": threads,
+                    "calls": number,
+                    "median": median,
+                    "iqr": q3 - q1,
+                    "min": min(times),
+                    "times": times,
+                    "peak_bytes": peak,
+                })
+                memory = "" if peak is None else f"{peak / 2**20:10.1f}"
+                print(
+                    f"{n:>10.0e} {median:12.3e} {q3 - q1:10.2e} {number:6d} {slope:>6} {memory:>10}"
+                )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--kernels", nargs="+", choices=list(KERNELS), default=list(KERNELS))
+    parser.add_argument("--min-exp", type=int, default=2)
+    parser.add_argument("--max-exp", type=int, default=8)
+    parser.add_argument(
+        "--max-n", type=int, default=None,
+        help="largest N for every kernel (default: per kernel, 10^5 to 10^8)",
+    )
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=[1, 0], help="thread counts (0: all cores)"
+    )
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--min-time", type=float, default=0.01, help="seconds per sample")
+    parser.add_argument("--no-memory", action="store_true")
+    parser.add_argument(
+        "--backend", choices=primes.available_backends(), help="default: $PRIMES_BACKEND or the first that imports"
+    )
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    parser.add_argument("--compare", type=Path, help="baseline results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10)
+    args = parser.parse_args()
+    if args.repeat < 2:
+        parser.error("--repeat must be >= 2 for an interquartile range")
+
+    if args.backend:
+        primes.set_backend(args.backend)
+    meta = metadata(args)
+    print(
+        f"commit {meta['commit']}, Python {meta['python']}, {meta['cpu_count']} core(s), "
+        f"{meta['backend']} backend"
+    )
+    report = {"meta": meta, "results": run(args)}
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=1))
+    if args.compare:
+        from compare import compare
+
+        baseline = json.loads(args.compare.read_text())
+        try:
+            regressions = compare(baseline, report, args.tolerance)
+        except ValueError as error:
+            print(error, file=sys.stderr)
+            sys.exit(2)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,27 @@
-from ._primes import is_prime, nth_prime
-__all__ = ["is_prime", "nth_prime"]
+from .backend import available_backends, get_backend, set_backend
+from .cache import PrimeCache, default_cache, set_default_cache
+from .stream import iter_prime_chunks, iter_primes
+
+# Binds factorize, is_prime, next_prime, nth_prime, prev_prime, prime_count,
+# primes_in_range and primes_up_to from $PRIMES_BACKEND, or from the first
+# backend that imports (the compiled extension, then NumPy)
+set_backend()
+
+__all__ = [
+    "PrimeCache",
+    "available_backends",
+    "default_cache",
+    "factorize",
+    "get_backend",
+    "is_prime",
+    "iter_prime_chunks",
+    "iter_primes",
+    "next_prime",
+    "nth_prime",
+    "prev_prime",
+    "prime_count",
+    "primes_in_range",
+    "primes_up_to",
+    "set_backend",
+    "set_default_cache",
+]
@@ -0,0 +1,577 @@
+"""NumPy implementation of the _primes API, used when the compiled extension is unavailable
+
+Every function takes and returns the same types as its C++ counterpart.
+threads= is accepted for compatibility and ignored; the heavy lifting happens
+inside NumPy's vectorized loops rather than in Python.
+"""
+from __future__ import annotations
+
+import functools
+import math
+import threading
+
+import numpy as np
+
+from collections.abc import Iterator
+from numpy.typing import ArrayLike
+
+_SEGMENT = 1 << 23         # odd values per sieve segment (a 2^24-wide range, 8 MiB of flags)
+_STREAM_SPAN = 1 << 19     # values per PrimeGenerator chunk: one 32 KiB C++ segment,
+_STREAM_SPAN_LARGE = 1 << 22  # or one 256 KiB segment once the sieving primes pass 2^19
+_TABLE_LIMIT = 1 << 26     # array queries below this may be answered from one sieved table
+_TRIAL_LIMIT = 4096        # factorize trial-divides by every prime below this
+_PRIMES_BELOW_64 = 0x28208A20A08A28AC  # bit n set when n is prime
+_LARGEST_PRIME = 18446744073709551557  # largest prime below 2^64
+_BASES_32 = (2, 7, 61)
+_BASES_64 = (2, 325, 9375, 28178, 450775, 9780504, 1795265022)
+_LOW32 = np.uint64(0xFFFFFFFF)
+_VECTOR_MIN = 1024         # fewer 64-bit Miller-Rabin candidates than this are tested one by one
+_WALK_BLOCK = 16           # candidates tested per element and round by next_prime / prev_prime
+
+_BASE_LIMIT = 1 << 27      # sieving primes below this are cached; larger ones are streamed
+
+_base = np.array([3, 5, 7], dtype=np.uint64)  # odd primes up to _base_limit, grown on demand
+_base_limit = 8
+
+
+def _simple_sieve(limit: int) -> np.ndarray:
+    """Odd primes p <= limit (unsegmented; only used for sieving primes)"""
+    flags = np.ones((limit + 1) // 2, dtype=bool)  # flags[i] is 2i + 1
+    flags[0] = False
+    for i in range(1, (math.isqrt(limit) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            flags[p * p // 2::p] = False
+    return (2 * np.flatnonzero(flags) + 1).astype(np.uint64)
+
+
+def _sieving_primes(limit: int) -> Iterator[np.ndarray]:
+    """Odd primes p <= limit in increasing chunks
+
+    Those below _BASE_LIMIT come from a cache grown geometrically across calls;
+    beyond it (ranges above 2^54) they are re-sieved one window at a time, so
+    memory stays bounded even though all pi(2^32) of them may be needed.
+    """
+    global _base, _base_limit
+    cached = min(limit, _BASE_LIMIT - 1)
+    if cached > _base_limit:
+        _base_limit = min(max(cached, 2 * _base_limit), _BASE_LIMIT - 1)
+        _base = _simple_sieve(_base_limit)
+    yield _base[:np.searchsorted(_base, cached, side="right")]
+    for lo in range(_BASE_LIMIT, limit + 1, _BASE_LIMIT):
+        yield _sieve(lo, min(lo + _BASE_LIMIT, limit + 1))
+
+
+def _cross_off(flags: np.ndarray, start: int, primes: np.ndarray) -> None:
+    """Clear the odd multiples m >= p * p of each prime in flags[i] = start + 2i"""
+    count = flags.size
+    # index of the first odd multiple of each p, no lower than p * p; a multiple past
+    # 2^64 wraps around to a huge offset, which falls outside the segment like any other
+    first = np.uint64(start) + (primes - np.uint64(start) % primes) % primes
+    first = np.maximum(primes * primes, first)
+    first += (first & 1 ^ 1) * primes
+    offset = (first - np.uint64(start)) // 2
+    dense = np.searchsorted(primes, count)
+    for p, i in zip(primes[:dense].tolist(), offset[:dense].tolist()):
+        flags[i::p] = False
+    sparse = offset[dense:]  # p >= count: at most one multiple in the segment
+    flags[sparse[sparse < count]] = False
+
+
+def _sieve(lo: int, hi: int) -> np.ndarray:
+    """Primes in [lo, hi), one odd-only segment at a time"""
+    parts = [np.array([2], dtype=np.uint64)] if lo <= 2 < hi else []
+    start = max(lo, 3) | 1
+    while start < hi:
+        count = min(_SEGMENT, (hi - start + 1) // 2)
+        end = start + 2 * count  # odd values start, start + 2, ..., end - 2
+        flags = np.ones(count, dtype=bool)
+        for primes in _sieving_primes(math.isqrt(end - 2)):
+            _cross_off(flags, start, primes)
+        parts.append(np.uint64(start) + 2 * np.flatnonzero(flags).astype(np.uint64))
+        start = end
+    return np.concatenate(parts) if parts else np.empty(0, dtype=np.uint64)
+
+
+def _table(n: int) -> np.ndarray:
+    """Boolean primality table for 0 <= value < n"""
+    table = np.zeros(n, dtype=bool)
+    table[_sieve(0, n)] = True
+    return table
+
+
+@functools.cache
+def _small_table() -> np.ndarray:
+    """Primality of every value below 2^16"""
+    return _table(1 << 16)
+
+
+@functools.cache
+def _trial_primes() -> list[int]:
+    """Primes below _TRIAL_LIMIT"""
+    return _sieve(0, _TRIAL_LIMIT).tolist()
+
+
+def _use_table(top: int, size: int) -> bool:
+    """Whether sieving up to top beats testing size values one at a time"""
+    return top < _TABLE_LIMIT and top < 256 * size
+
+
+def _as_unsigned(values: ArrayLike, message: str, minimum: int = 0) -> np.ndarray:
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise TypeError("values must be an integer array")
+    if values.size and values.min() < minimum:
+        raise ValueError(message)
+    return values.astype(np.uint64, copy=False)
+
+
+def primes_in_range(lo: int, hi: int, threads: int = 1) -> np.ndarray:
+    """Return all primes p with lo <= p < hi as a uint64 array"""
+    if hi <= lo:
+        return np.empty(0, dtype=np.uint64)
+    return _sieve(lo, hi)
+
+
+def primes_up_to(n: int, threads: int = 1) -> np.ndarray:
+    """Return all primes p <= n as a uint64 array"""
+    return primes_in_range(0, n + 1)
+
+
+def prime_count(x: int, threads: int = 1) -> int:
+    """Return pi(x), the number of primes <= x
+
+    Lucy Hedgehog's O(x^(3/4)) recurrence, one vectorized update per prime
+    below sqrt(x): small[v] holds pi(v) and large[i] holds pi(x // i).
+    """
+    if x < 2:
+        return 0
+    if x < _TABLE_LIMIT:
+        return int(_sieve(0, x + 1).size)
+    r = math.isqrt(x)
+    v = np.arange(r + 1, dtype=np.uint64)
+    small = np.maximum(v, 1) - 1
+    large = np.zeros(r + 1, dtype=np.uint64)
+    large[1:] = np.uint64(x) // v[1:] - 1
+    for p in _sieve(0, r + 1).tolist():
+        below = small[p - 1]
+        k = min(r, x // (p * p))
+        j = min(k, r // p)  # large[i * p] exists for i <= j, small[x // (i * p)] beyond
+        update = np.empty(k, dtype=np.uint64)
+        update[:j] = large[p:j * p + 1:p]
+        update[j:] = small[np.uint64(x) // (v[j + 1:k + 1] * np.uint64(p))]
+        large[1:k + 1] -= update - below
+        small[p * p:] -= small[v[p * p:] // np.uint64(p)] - below
+    return int(large[1])
+
+
+def _estimate(N: int) -> int:
+    """Cipolla's estimate of p_N (N >= 6)"""
+    log = math.log(N)
+    loglog = math.log(log)
+    return int(N * (log + loglog - 1 + (loglog - 2) / log))
+
+
+def _upper_bound(N: int) -> int:
+    """Rosser's bound p_N < N (ln N + ln ln N) for N >= 6"""
+    log = math.log(N)
+    return int(N * (log + math.log(log))) + 1
+
+
+def _nth_prime(N: int) -> int:
+    if N < 1:
+        raise ValueError("N must be >= 1")
+    if N < 6:
+        return (2, 3, 5, 7, 11)[N - 1]
+    bound = _upper_bound(N)
+    if bound < _TABLE_LIMIT:
+        return int(_sieve(0, bound)[N - 1])
+    x = _estimate(N)
+    count = prime_count(x)
+    window = max(1 << 20, x >> 16)
+    if count >= N:  # p_N <= x: step back
+        hi = x + 1
+        while True:
+            primes = _sieve(max(hi - window, 0), hi)
+            if count - primes.size < N:
+                return int(primes[N - (count - primes.size) - 1])
+            count -= primes.size
+            hi -= window
+    lo = x + 1
+    while True:
+        primes = _sieve(lo, lo + window)
+        if count + primes.size >= N:
+            return int(primes[N - count - 1])
+        count += primes.size
+        lo += window
+
+
+def _nth_prime_sorted(targets: np.ndarray) -> np.ndarray:
+    """p_N for strictly increasing N, sieving forward once and counting ahead over gaps"""
+    out = np.empty(targets.size, dtype=np.uint64)
+    i = lo = count = 0  # count = pi(lo - 1)
+    while i < targets.size:
+        N = int(targets[i])
+        if N >= 6:
+            estimate = _estimate(N)
+            if estimate - lo > max(2 * _SEGMENT, estimate**0.75 / 10):
+                counted = prime_count(estimate)
+                if counted >= N:
+                    out[i] = _nth_prime(N)
+                    i += 1
+                    continue
+                lo, count = estimate + 1, counted
+        window = max(2 * _SEGMENT, lo >> 16)
+        primes = _sieve(lo, lo + window)
+        j = int(np.searchsorted(targets, count + primes.size, side="right"))
+        out[i:j] = primes[targets[i:j] - np.uint64(count + 1)]
+        i = j
+        count += primes.size
+        lo += window
+    return out
+
+
+def nth_prime(N: int | ArrayLike, threads: int = 1) -> int | np.ndarray:
+    """Return the Nth prime (1 -> 2), element-wise for an index array"""
+    if np.ndim(N) == 0:
+        return _nth_prime(int(N))
+    N = _as_unsigned(N, "N must be >= 1", minimum=1)
+    if N.size == 0:
+        return np.empty(N.shape, dtype=np.uint64)
+    top = int(N.max())
+    if top < 6 or _upper_bound(top) < _TABLE_LIMIT:
+        return _sieve(0, max(_upper_bound(max(top, 6)), 12))[N - np.uint64(1)]
+    targets, inverse = np.unique(N, return_inverse=True)
+    return _nth_prime_sorted(targets)[inverse].reshape(N.shape)
+
+
+def _is_prime(value: int) -> bool:
+    if value < 64:
+        return value >= 0 and bool(_PRIMES_BELOW_64 >> value & 1)
+    for p in (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61):
+        if value % p == 0:
+            return False
+    if value < 64 * 64:
+        return True
+    d, s = value - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _BASES_32 if value < 2**32 else _BASES_64:
+        x = pow(a, d, value)
+        if x in (0, 1, value - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % value
+            if x == value - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _odd_part(n: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """d, s with n - 1 = d 2^s and d odd"""
+    d = n - np.uint64(1)
+    s = np.zeros(n.size, dtype=np.uint64)
+    even = d & 1 == 0
+    while even.any():
+        d[even] >>= np.uint64(1)
+        s[even] += np.uint64(1)
+        even = d & 1 == 0
+    return d, s
+
+
+def _miller_rabin_32(n: np.ndarray) -> np.ndarray:
+    """Deterministic Miller-Rabin for odd 64 < n < 2^32, so every product fits in uint64"""
+    d, s = _odd_part(n)
+    alive = np.arange(n.size)  # still probably prime
+    for a in _BASES_32:
+        m, e, rounds = n[alive], d[alive], s[alive]
+        x = np.ones(m.size, dtype=np.uint64)
+        base = np.uint64(a) % m
+        while e.any():
+            odd = e & 1 == 1
+            x[odd] = x[odd] * base[odd] % m[odd]
+            base = base * base % m
+            e >>= np.uint64(1)
+        passed = (x == 1) | (x == m - np.uint64(1))
+        for r in range(1, int(rounds.max(initial=0))):
+            x = x * x % m
+            passed |= (x == m - np.uint64(1)) & (np.uint64(r) < rounds)
+        alive = alive[passed]
+    result = np.zeros(n.size, dtype=bool)
+    result[alive] = True
+    return result
+
+
+def _mulhi(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """High 64 bits of each 128-bit product a * b, assembled from 32-bit limbs"""
+    a_lo, a_hi = a & _LOW32, a >> np.uint64(32)
+    b_lo, b_hi = b & _LOW32, b >> np.uint64(32)
+    hi_lo = a_hi * b_lo
+    cross = (a_lo * b_lo >> np.uint64(32)) + (hi_lo & _LOW32) + a_lo * b_hi
+    return a_hi * b_hi + (hi_lo >> np.uint64(32)) + (cross >> np.uint64(32))
+
+
+def _montgomery_mul(a: np.ndarray, b: np.ndarray, n: np.ndarray, inverse: np.ndarray) -> np.ndarray:
+    """a b 2^-64 mod n for odd n, given inverse = n^-1 mod 2^64"""
+    hi = _mulhi(a, b)
+    u = _mulhi(a * b * inverse, n)  # a b - m n is divisible by 2^64 exactly
+    return np.where(hi < u, hi - u + n, hi - u)
+
+
+def _miller_rabin_64(n: np.ndarray) -> np.ndarray:
+    """Deterministic Miller-Rabin for odd n >= 2^32, vectorized in Montgomery form"""
+    d, s = _odd_part(n)
+    inverse = n.copy()  # Newton's iteration doubles the correct low bits: 3 -> 96
+    for _ in range(5):
+        inverse *= np.uint64(2) - n * inverse
+    one = (np.uint64(0) - n) % n  # 2^64 mod n, i.e. 1 in Montgomery form
+    alive = np.arange(n.size)
+    for a in _BASES_64:
+        m, e, rounds, inv, x = n[alive], d[alive], s[alive], inverse[alive], one[alive]
+        minus_one = m - x
+        base, addend, k = np.zeros(m.size, dtype=np.uint64), x, a  # base = a 2^64 mod m
+        while k:
+            if k & 1:
+                base = np.where(base >= m - addend, base - (m - addend), base + addend)
+            addend = np.where(addend >= m - addend, addend - (m - addend), addend + addend)
+            k >>= 1
+        while e.any():
+            x = np.where(e & 1 == 1, _montgomery_mul(x, base, m, inv), x)
+            base = _montgomery_mul(base, base, m, inv)
+            e >>= np.uint64(1)
+        passed = (x == m - minus_one) | (x == minus_one)
+        for r in range(1, int(rounds.max(initial=0))):
+            x = _montgomery_mul(x, x, m, inv)
+            passed |= (x == minus_one) & (np.uint64(r) < rounds)
+        alive = alive[passed]
+    result = np.zeros(n.size, dtype=bool)
+    result[alive] = True
+    return result
+
+
+def _is_prime_flat(values: np.ndarray) -> np.ndarray:
+    """Primality of a 1-D uint64 array: trial division, then Miller-Rabin on the survivors"""
+    if values.size == 0:
+        return np.zeros(0, dtype=bool)
+    if _use_table(int(values.max()), values.size):
+        return _table(int(values.max()) + 1)[values]
+    result = np.zeros(values.size, dtype=bool)
+    small = values < 256 * 256
+    result[small] = _small_table()[values[small]]
+    pending = np.flatnonzero(~small)
+    for p in _trial_primes()[:54]:  # below 256
+        pending = pending[values[pending] % np.uint64(p) != 0]
+    n = values[pending]
+    mid = n < 2**32
+    result[pending[mid]] = _miller_rabin_32(n[mid])
+    big = ~mid
+    if np.count_nonzero(big) < _VECTOR_MIN:  # too few to amortize 64-bit Montgomery setup
+        result[pending[big]] = [_is_prime(value) for value in n[big].tolist()]
+    else:
+        result[pending[big]] = _miller_rabin_64(n[big])
+    return result
+
+
+def is_prime(value: int | ArrayLike, threads: int = 1) -> bool | np.ndarray:
+    """Deterministic primality test, element-wise (bool array) for an integer array"""
+    if np.ndim(value) == 0:
+        return _is_prime(int(value))
+    values = np.asarray(value)
+    if values.dtype.kind not in "iu":
+        raise TypeError("values must be an integer array")
+    negative = values < 0
+    flat = np.where(negative, 0, values).astype(np.uint64).ravel()
+    return _is_prime_flat(flat).reshape(values.shape)
+
+
+def _walk(candidate: np.ndarray, up: bool) -> np.ndarray:
+    """First prime among the odd values from each candidate upward (or downward)"""
+    result = np.empty(candidate.size, dtype=np.uint64)
+    rows = np.arange(candidate.size)
+    offsets = 2 * np.arange(_WALK_BLOCK, dtype=np.uint64)
+    while rows.size:
+        # near 2^64 a block wraps around, but only after the prime it holds
+        block = candidate[:, np.newaxis] + offsets if up else candidate[:, np.newaxis] - offsets
+        found = _is_prime_flat(block.ravel()).reshape(block.shape)
+        hit = found.any(axis=1)
+        result[rows[hit]] = block[hit, found[hit].argmax(axis=1)]
+        rows = rows[~hit]
+        candidate = block[~hit, -1] + np.uint64(2) if up else block[~hit, -1] - np.uint64(2)
+    return result
+
+
+def next_prime(value: int | ArrayLike, threads: int = 1) -> int | np.ndarray:
+    """Return the smallest prime > value, element-wise for an integer array"""
+    if np.ndim(value) == 0:
+        value = int(value)
+        if value >= _LARGEST_PRIME:
+            raise OverflowError("no 64-bit prime after value")
+        if value < 2:
+            return 2
+        candidate = (value + 1) | 1
+        while not _is_prime(candidate):
+            candidate += 2
+        return candidate
+    values = _as_unsigned(value, "values must be >= 0")
+    if values.size and int(values.max()) >= _LARGEST_PRIME:
+        raise OverflowError("no 64-bit prime after value")
+    flat = values.ravel()
+    if flat.size == 0 or _use_table(int(flat.max()), flat.size):
+        table = _sieve(0, (int(flat.max()) if flat.size else 0) + 1024)
+        return table[np.searchsorted(table, flat, side="right")].reshape(values.shape)
+    result = np.full(flat.size, 2, dtype=np.uint64)
+    pending = np.flatnonzero(flat >= 2)
+    result[pending] = _walk((flat[pending] + np.uint64(1)) | np.uint64(1), up=True)
+    return result.reshape(values.shape)
+
+
+def prev_prime(value: int | ArrayLike, threads: int = 1) -> int | np.ndarray:
+    """Return the largest prime < value, element-wise for an integer array"""
+    if np.ndim(value) == 0:
+        value = int(value)
+        if value < 3:
+            raise ValueError("no prime below value")
+        if value == 3:
+            return 2
+        candidate = (value - 2) | 1
+        while not _is_prime(candidate):
+            candidate -= 2
+        return candidate
+    values = _as_unsigned(value, "values must be >= 0")
+    flat = values.ravel()
+    if flat.size and int(flat.min()) < 3:
+        raise ValueError("no prime below value")
+    if flat.size == 0 or _use_table(int(flat.max()), flat.size):
+        table = _sieve(0, int(flat.max()) if flat.size else 0)
+        return table[np.searchsorted(table, flat) - 1].reshape(values.shape)
+    result = np.full(flat.size, 2, dtype=np.uint64)
+    pending = np.flatnonzero(flat > 3)
+    result[pending] = _walk((flat[pending] - np.uint64(2)) | np.uint64(1), up=False)
+    return result.reshape(values.shape)
+
+
+def _brent(n: int) -> int:
+    """A nontrivial factor of the odd composite n (Pollard-Rho, Brent's cycle detection)"""
+    for c in range(1, n):
+        y, r, q, g = 2, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(128, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += 128
+            r *= 2
+        if g == n:  # the batch overshot: retrace one step at a time
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = math.gcd(abs(x - saved), n)
+        if g != n:
+            return g
+    raise ArithmeticError(f"no factor found for {n}")
+
+
+def _split(n: int) -> list[int]:
+    """Prime factors of n > 1, which has no factor below _TRIAL_LIMIT"""
+    if n < _TRIAL_LIMIT * _TRIAL_LIMIT or _is_prime(n):
+        return [n]
+    d = _brent(n)
+    return _split(d) + _split(n // d)
+
+
+def _factorize(value: int) -> list[int]:
+    if value < 1:
+        raise ValueError("factorize requires value >= 1")
+    factors = []
+    for p in _trial_primes():
+        if p * p > value:
+            break
+        while value % p == 0:
+            factors.append(p)
+            value //= p
+    else:
+        if value > 1:
+            factors.extend(_split(value))
+        return sorted(factors)
+    if value > 1:
+        factors.append(value)
+    return factors
+
+
+def factorize(value: int | ArrayLike, threads: int = 1) -> list[int] | np.ndarray:
+    """Prime factors in increasing order with multiplicity
+
+    An integer array of shape S gives a uint64 array of shape S + (k,), where k
+    is the largest number of factors of any element; shorter rows are zero padded.
+    """
+    if np.ndim(value) == 0:
+        return _factorize(int(value))
+    values = _as_unsigned(value, "factorize requires value >= 1", minimum=1)
+    if values.size and int(values.min()) == 0:
+        raise ValueError("factorize requires value >= 1")
+    rest = values.ravel().copy()
+    rows, factors = [], []
+    pending = np.arange(rest.size)
+    for p in _trial_primes():
+        if pending.size == 0:
+            break
+        divisible = pending[rest[pending] % np.uint64(p) == 0]
+        while divisible.size:
+            rows.append(divisible)
+            factors.append(np.full(divisible.size, p, dtype=np.uint64))
+            rest[divisible] //= np.uint64(p)
+            divisible = divisible[rest[divisible] % np.uint64(p) == 0]
+        pending = pending[rest[pending] >= np.uint64(p * p)]  # below p^2 it is 1 or prime
+    prime = np.flatnonzero(rest > 1)
+    if pending.size:
+        composite = pending[~_is_prime_flat(rest[pending])]
+        prime = np.setdiff1d(prime, composite, assume_unique=True)
+        for i in composite.tolist():
+            split = _split(int(rest[i]))
+            rows.append(np.full(len(split), i))
+            factors.append(np.array(split, dtype=np.uint64))
+    rows.append(prime)
+    factors.append(rest[prime])
+
+    rows = np.concatenate(rows)
+    factors = np.concatenate(factors)
+    order = np.lexsort((factors, rows))
+    rows, factors = rows[order], factors[order]
+    counts = np.bincount(rows, minlength=rest.size)
+    width = int(counts.max()) if counts.size else 0
+    column = np.arange(rows.size) - np.repeat(np.cumsum(counts) - counts, counts)
+    out = np.zeros((rest.size, width), dtype=np.uint64)
+    out[rows, column] = factors
+    return out.reshape(values.shape + (width,))
+
+
+class PrimeGenerator:
+    """Incremental stream of primes in [start, stop), one sieve segment per array"""
+
+    def __init__(self, start: int = 0, stop: int | None = None) -> None:
+        self._lo = start
+        self._stop = 2**64 - 1 if stop is None else stop
+        self._lock = threading.Lock()  # NumPy drops the GIL mid-segment; next() must not interleave
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        return self
+
+    def __next__(self) -> np.ndarray:
+        with self._lock:
+            while self._lo < self._stop:
+                span = _STREAM_SPAN if self._lo < 1 << 38 else _STREAM_SPAN_LARGE
+                hi = min(self._stop, self._lo + span)
+                primes = _sieve(self._lo, hi)
+                self._lo = hi
+                if primes.size:
+                    return primes
+        raise StopIteration
@@ -0,0 +1,100 @@
+"""Choose the module that implements the prime kernels
+
+Two backends ship with the package: "cpp", the compiled _primes extension,
+and "numpy", a pure NumPy implementation of the same API. The first one that
+imports is used, so a platform without the compiled extension still gets a
+working package. Set PRIMES_BACKEND=numpy (or cpp) before importing primes to
+force one, or switch at run time with set_backend().
+"""
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+
+from types import ModuleType
+
+ENV_VAR = "PRIMES_BACKEND"
+KERNELS = (
+    "factorize",
+    "is_prime",
+    "next_prime",
+    "nth_prime",
+    "prev_prime",
+    "prime_count",
+    "primes_in_range",
+    "primes_up_to",
+)
+
+_registry: dict[str, str] = {  # name -> module, in order of preference
+    "cpp": "primes._primes",
+    "numpy": "primes._numpy",
+}
+_active: tuple[str, ModuleType] | None = None
+
+
+def register_backend(name: str, module: str) -> None:
+    """Make a module implementing the _primes API selectable by name (preferred last)"""
+    _registry[name] = module
+
+
+def _load(name: str) -> ModuleType:
+    if name not in _registry:
+        raise ValueError(f"Unknown primes backend {name!r}; choose from {sorted(_registry)}")
+    return importlib.import_module(_registry[name])
+
+
+def available_backends() -> list[str]:
+    """Names of the registered backends that import on this platform, preferred first"""
+    available = []
+    for name in _registry:
+        try:
+            _load(name)
+        except ImportError:
+            continue
+        available.append(name)
+    return available
+
+
+def set_backend(name: str | None = None) -> str:
+    """Select a backend by name, bind its kernels on the primes package and return the name
+
+    None picks $PRIMES_BACKEND when it is set, else the first registered
+    backend that imports. A backend asked for by name must import: its
+    ImportError is raised rather than silently falling back.
+
+    Kernels are rebound as package attributes, so calls through primes.<name>
+    cost nothing extra; names bound earlier with `from primes import ...`
+    keep the backend that was active when they were imported.
+    """
+    global _active
+    name = name or os.environ.get(ENV_VAR) or None
+    if name is not None:
+        _active = (name, _load(name))
+    else:
+        for candidate in _registry:
+            try:
+                _active = (candidate, _load(candidate))
+            except ImportError:
+                continue
+            break
+        else:
+            raise ImportError(f"No primes backend imports; tried {list(_registry)}")
+    package = sys.modules[__package__]
+    for kernel in KERNELS:
+        setattr(package, kernel, getattr(_active[1], kernel))
+    return _active[0]
+
+
+def get_backend() -> str:
+    """Name of the backend in use"""
+    if _active is None:
+        set_backend()
+    return _active[0]
+
+
+def current() -> ModuleType:
+    """The module in use; cache and stream look kernels up on it at call time"""
+    if _active is None:
+        set_backend()
+    return _active[1]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+
+import numpy as np
+
+from collections import OrderedDict
+from pathlib import Path
+
+from . import backend
+from .stream import iter_prime_chunks
+
+_BLOCK = 1 << 24  # values per cached block
+
+
+class PrimeCache:
+    """Memo of sieved primes shared by every query in a process
+
+    Primes are cached in blocks of `block` values, each sieved on first use
+    and evicted least-recently-used once the owned arrays exceed `max_bytes`.
+    A block reached through nth_prime or prime_count also remembers how many
+    primes lie below it, so later queries that land in it are a binary search.
+
+    A table written by save() can be reopened with load() as a read-only
+    memory map: worker processes then share one copy of it through the page
+    cache, and every query below its limit is answered from it directly.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 2**20, block: int = _BLOCK) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be >= 0")
+        if block < 1:
+            raise ValueError("block must be >= 1")
+        self._max_bytes = max_bytes
+        self._block = block
+        self._lock = threading.RLock()
+        self._blocks: OrderedDict[int, np.ndarray] = OrderedDict()
+        self._first: dict[int, int] = {}      # block -> number of primes below it, when known
+        self._starts: list[tuple[int, int]] = []  # sorted (first, block) for nth_prime lookups
+        self._bytes = 0
+        self._table = np.empty(0, dtype=np.uint64)  # mapped primes below self._limit
+        self._limit = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def block(self) -> int:
+        return self._block
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by cached blocks (a mapped table is not counted)"""
+        return self._bytes
+
+    @property
+    def limit(self) -> int:
+        """Every prime below this value is in the mapped table"""
+        return self._limit
+
+    def nth_prime(self, N: int) -> int:
+        """Return the Nth prime (1 -> 2)"""
+        if N < 1:
+            raise ValueError("N must be >= 1")
+        if N <= self._table.size:
+            return int(self._table[N - 1])
+        with self._lock:
+            i = bisect.bisect_right(self._starts, (N - 1, float("inf"))) - 1
+            if i >= 0:
+                first, index = self._starts[i]
+                primes = self._blocks[index]
+                if N - first <= primes.size:
+                    self._blocks.move_to_end(index)
+                    return int(primes[N - first - 1])
+
+            prime = backend.current().nth_prime(N)
+            index = prime // self._block
+            primes = self._get(index)
+            self._remember_first(index, N - 1 - int(np.searchsorted(primes, prime)))
+            return prime
+
+    def prime_count(self, x: int) -> int:
+        """Return pi(x), the number of primes <= x"""
+        if x < 2:
+            return 0
+        if x < self._limit:
+            return int(np.searchsorted(self._table, x, side="right"))
+        with self._lock:
+            index = x // self._block
+            primes = self._get(index)
+            if index not in self._first:
+                start = index * self._block
+                below = backend.current().prime_count(start - 1) if start else 0
+                self._remember_first(index, below)
+            return self._first[index] + int(np.searchsorted(primes, x, side="right"))
+
+    def primes_in_range(self, lo: int, hi: int) -> np.ndarray:
+        """Return the primes in [lo, hi); a read-only view when the mapped table covers it"""
+        if hi <= lo:
+            return np.empty(0, dtype=np.uint64)
+        if hi <= self._limit:
+            i, j = np.searchsorted(self._table, [lo, hi])
+            return self._table[i:j]
+        with self._lock:
+            parts = []
+            for index in range(lo // self._block, (hi - 1) // self._block + 1):
+                primes = self._get(index)
+                i, j = np.searchsorted(primes, [lo, hi])
+                parts.append(primes[i:j])
+            return np.concatenate(parts)
+
+    def is_prime(self, value: int) -> bool:
+        """Binary search when the value is cached, Miller-Rabin otherwise"""
+        if value < 2:
+            return False
+        if value < self._limit:
+            i = np.searchsorted(self._table, value)
+            return i < self._table.size and int(self._table[i]) == value
+        with self._lock:
+            primes = self._blocks.get(value // self._block)
+        if primes is None:
+            return backend.current().is_prime(value)
+        i = np.searchsorted(primes, value)
+        return i < primes.size and int(primes[i]) == value
+
+    def clear(self) -> None:
+        """Drop every cached block (a mapped table stays)"""
+        with self._lock:
+            self._blocks.clear()
+            self._first.clear()
+            self._starts.clear()
+            self._bytes = 0
+
+    def save(self, path: str | Path, limit: int) -> None:
+        """Write every prime below limit to path (.npy) and its limit to a .json sidecar
+
+        The table is filled one sieve segment at a time through a memory map,
+        so writing it takes no more memory than iterating over it.
+        """
+        path = Path(path).with_suffix(".npy")
+        count = backend.current().prime_count(limit - 1) if limit > 0 else 0
+        table = np.lib.format.open_memmap(path, mode="w+", dtype=np.uint64, shape=(count,))
+        filled = 0
+        for chunk in iter_prime_chunks(0, limit):
+            table[filled:filled + chunk.size] = chunk
+            filled += chunk.size
+        table.flush()
+        del table
+        path.with_suffix(".json").write_text(json.dumps({"limit": limit, "count": count}))
+
+    @classmethod
+    def load(
+        cls,
+        path: str | Path,
+        mmap_mode: str | None = "r",
+        max_bytes: int = 256 * 2**20,
+        block: int = _BLOCK,
+    ) -> "PrimeCache":
+        """Open a table written by save(); memory mapped read-only by default"""
+        path = Path(path).with_suffix(".npy")
+        meta = json.loads(path.with_suffix(".json").read_text())
+        table = np.load(path, mmap_mode=mmap_mode)
+        if table.dtype != np.uint64 or table.shape != (meta["count"],):
+            raise ValueError(f"{path}: expected {meta['count']} uint64 primes")
+        if mmap_mode is None:
+            table.flags.writeable = False
+        cache = cls(max_bytes=max_bytes, block=block)
+        cache._table = table
+        cache._limit = meta["limit"]
+        return cache
+
+    def _get(self, index: int) -> np.ndarray:
+        """Primes of one block, sieved on a miss; evicts the least recently used blocks"""
+        primes = self._blocks.get(index)
+        if primes is not None:
+            self._blocks.move_to_end(index)
+            return primes
+        lo = index * self._block
+        primes = backend.current().primes_in_range(lo, lo + self._block)
+        primes.flags.writeable = False
+        self._blocks[index] = primes
+        self._bytes += primes.nbytes
+        while self._bytes > self._max_bytes and len(self._blocks) > 1:
+            evicted, old = self._blocks.popitem(last=False)
+            self._bytes -= old.nbytes
+            first = self._first.pop(evicted, None)
+            if first is not None:
+                self._starts.remove((first, evicted))
+        return primes
+
+    def _remember_first(self, index: int, first: int) -> None:
+        if index in self._blocks and index not in self._first:
+            self._first[index] = first
+            bisect.insort(self._starts, (first, index))
+
+
+_default: PrimeCache | None = None
+
+
+def default_cache() -> PrimeCache:
+    """The process-wide PrimeCache, created with default settings on first use"""
+    global _default
+    if _default is None:
+        _default = PrimeCache()
+    return _default
+
+
+def set_default_cache(cache: PrimeCache) -> None:
+    """Install a cache (e.g. one opened with PrimeCache.load) as the process-wide one"""
+    global _default
+    _default = cache
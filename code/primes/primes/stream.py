@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import numpy as np
+
+from . import backend
+
+
+def iter_prime_chunks(start: int = 0, stop: int | None = None) -> Iterator[np.ndarray]:
+    """Yield the primes in [start, stop) as uint64 NumPy arrays, one sieve segment per array
+
+    Memory stays at one segment plus the sieving primes up to sqrt of the
+    current position, however far iteration goes. One iterator may be shared
+    across threads, since next() calls are serialized and each chunk goes to
+    exactly one caller; one iterator per thread avoids waiting on that lock.
+    """
+    return backend.current().PrimeGenerator(start, stop)
+
+
+def iter_primes(start: int = 0, stop: int | None = None) -> Iterator[int]:
+    """Yield the primes in [start, stop) one by one (unbounded when stop is None)"""
+    for chunk in backend.current().PrimeGenerator(start, stop):
+        yield from chunk.tolist()
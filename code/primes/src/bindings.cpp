@@ -1,15 +1,230 @@
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <optional>
+#include <stdexcept>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 
 #include "primes.h"
+#include "sieve.h"
 
 namespace py = pybind11;
 
+namespace {
+
+// Hand the vector's buffer to NumPy without copying; the capsule frees it
+py::array_t<std::uint64_t> as_array(std::vector<std::uint64_t>&& values) {
+  auto* owner = new std::vector<std::uint64_t>(std::move(values));
+  py::capsule free_when_done(owner, [](void* p) {
+    delete static_cast<std::vector<std::uint64_t>*>(p);
+  });
+  return py::array_t<std::uint64_t>(owner->size(), owner->data(), free_when_done);
+}
+
+// Element-wise is_prime over an integer array of any shape
+template <typename T>
+py::array_t<bool> is_prime_array(py::array_t<T, py::array::c_style> values, unsigned threads) {
+  py::array_t<bool> out(std::vector<py::ssize_t>(values.shape(), values.shape() + values.ndim()));
+  const T* data = values.data();
+  bool* result = out.mutable_data();
+  const auto count = static_cast<std::size_t>(values.size());
+  {
+    py::gil_scoped_release release;
+    is_prime(data, count, result, threads);
+  }
+  return out;
+}
+
+// Batch nth_prime over an index array of any shape
+template <typename T>
+py::array_t<std::uint64_t> nth_prime_array(py::array_t<T, py::array::c_style> N, unsigned threads) {
+  py::array_t<std::uint64_t> out(std::vector<py::ssize_t>(N.shape(), N.shape() + N.ndim()));
+  const T* indices = N.data();
+  std::uint64_t* result = out.mutable_data();
+  const auto count = static_cast<std::size_t>(N.size());
+  {
+    py::gil_scoped_release release;
+    if (std::is_signed_v<T> && std::any_of(indices, indices + count, [](T n) { return n < 1; })) {
+      throw std::invalid_argument("N must be >= 1");
+    }
+    nth_prime(reinterpret_cast<const std::uint64_t*>(indices), count, result, threads);
+  }
+  return out;
+}
+
+// Element-wise next_prime / prev_prime over an integer array of any shape
+template <typename T>
+py::array_t<std::uint64_t> nearest_prime_array(
+    py::array_t<T, py::array::c_style> values, unsigned threads,
+    void (*nearest)(const std::uint64_t*, std::size_t, std::uint64_t*, unsigned)) {
+  py::array_t<std::uint64_t> out(std::vector<py::ssize_t>(values.shape(), values.shape() + values.ndim()));
+  const T* data = values.data();
+  std::uint64_t* result = out.mutable_data();
+  const auto count = static_cast<std::size_t>(values.size());
+  {
+    py::gil_scoped_release release;
+    if (std::is_signed_v<T> && std::any_of(data, data + count, [](T v) { return v < 0; })) {
+      throw std::invalid_argument("values must be >= 0");
+    }
+    nearest(reinterpret_cast<const std::uint64_t*>(data), count, result, threads);
+  }
+  return out;
+}
+
+// Factor an integer array of any shape into values.shape + (width,), zero padded
+template <typename T>
+py::array_t<std::uint64_t> factorize_array(py::array_t<T, py::array::c_style> values, unsigned threads) {
+  const T* data = values.data();
+  const auto count = static_cast<std::size_t>(values.size());
+  std::vector<std::uint64_t> factors;
+  std::vector<std::size_t> offsets;
+  std::size_t width = 0;
+  {
+    py::gil_scoped_release release;
+    if (std::is_signed_v<T> && std::any_of(data, data + count, [](T v) { return v < 1; })) {
+      throw std::invalid_argument("factorize requires value >= 1");
+    }
+    factorize(reinterpret_cast<const std::uint64_t*>(data), count, factors, offsets, threads);
+    for (std::size_t i = 0; i < count; i++) width = std::max(width, offsets[i + 1] - offsets[i]);
+  }
+
+  std::vector<py::ssize_t> shape(values.shape(), values.shape() + values.ndim());
+  shape.push_back(static_cast<py::ssize_t>(width));
+  py::array_t<std::uint64_t> out(shape);
+  std::uint64_t* result = out.mutable_data();
+  {
+    py::gil_scoped_release release;
+    std::fill(result, result + count * width, 0);
+    for (std::size_t i = 0; i < count; i++) {
+      std::copy(factors.begin() + offsets[i], factors.begin() + offsets[i + 1], result + i * width);
+    }
+  }
+  return out;
+}
+
+// PrimeGenerator plus the mutex that serializes next() on it: __next__ runs
+// without the GIL, so two threads sharing one iterator must not both advance it
+struct LockedPrimeGenerator {
+  PrimeGenerator generator;
+  std::mutex lock;
+
+  LockedPrimeGenerator(std::uint64_t start, std::uint64_t stop) : generator(start, stop) {}
+};
+
+}  // namespace
+
 PYBIND11_MODULE(_primes, m) {
-  m.doc() = "Prime utilities (C++/pybind11)";
+  m.doc() = "Prime utilities (C++/pybind11); every entry point releases the GIL while computing";
 
-  m.def("is_prime", &is_prime, py::arg("value"),
+  m.def("is_prime", py::overload_cast<std::uint64_t>(&is_prime), py::arg("value"),
+        py::call_guard<py::gil_scoped_release>(),
         "Return True if value is prime, else False.");
+  m.def("is_prime", [](std::int64_t value) { return value >= 0 && is_prime(value); },
+        py::arg("value"), py::call_guard<py::gil_scoped_release>());
+  m.def("is_prime", &is_prime_array<std::uint64_t>, py::arg("values"), py::arg("threads") = 1,
+        "Element-wise is_prime over a uint64 array; returns a bool array of the same shape.");
+  m.def("is_prime", &is_prime_array<std::int64_t>, py::arg("values"), py::arg("threads") = 1,
+        "Element-wise is_prime over an int64 array; negative values are not prime.");
 
-  m.def("nth_prime", &nth_prime, py::arg("N"),
+  m.def("nth_prime", py::overload_cast<std::uint64_t, unsigned>(&nth_prime),
+        py::arg("N"), py::arg("threads") = 1, py::call_guard<py::gil_scoped_release>(),
         "Return the Nth prime (1 -> 2). Raises ValueError if N < 1.");
+  m.def("nth_prime", &nth_prime_array<std::uint64_t>, py::arg("N"), py::arg("threads") = 1,
+        "Return p_N for every index of a uint64 array in one sieve pass (same shape).");
+  m.def("nth_prime", &nth_prime_array<std::int64_t>, py::arg("N"), py::arg("threads") = 1,
+        "Return p_N for every index of an int64 array in one sieve pass (same shape).");
+
+  py::class_<LockedPrimeGenerator>(m, "PrimeGenerator",
+                                   "Iterator over the primes in [start, stop) as uint64 NumPy chunks.")
+      .def(py::init([](std::uint64_t start, std::optional<std::uint64_t> stop) {
+             return std::make_unique<LockedPrimeGenerator>(start, stop.value_or(UINT64_MAX));
+           }),
+           py::arg("start") = 0, py::arg("stop") = py::none())
+      .def("__iter__", [](LockedPrimeGenerator& self) -> LockedPrimeGenerator& { return self; },
+           py::return_value_policy::reference_internal)
+      .def("__next__", [](LockedPrimeGenerator& self) {
+        std::vector<std::uint64_t> primes;
+        bool more;
+        {
+          // Drop the GIL before waiting on the lock, so a thread holding the
+          // lock can always take the GIL back
+          py::gil_scoped_release release;
+          std::lock_guard<std::mutex> guard(self.lock);
+          more = self.generator.next_chunk(primes);
+        }
+        if (!more) throw py::stop_iteration();
+        return as_array(std::move(primes));
+      });
+
+  m.def("factorize", py::overload_cast<std::uint64_t>(&factorize), py::arg("value"),
+        py::call_guard<py::gil_scoped_release>(),
+        "Return the prime factors of value (>= 1) with multiplicity, in increasing order.");
+  m.def("factorize", &factorize_array<std::uint64_t>, py::arg("values"), py::arg("threads") = 1,
+        "Factor a uint64 array into shape values.shape + (k,), rows zero padded to the longest.");
+  m.def("factorize", &factorize_array<std::int64_t>, py::arg("values"), py::arg("threads") = 1,
+        "Factor an int64 array into shape values.shape + (k,), rows zero padded to the longest.");
+
+  m.def("next_prime", py::overload_cast<std::uint64_t>(&next_prime), py::arg("value"),
+        py::call_guard<py::gil_scoped_release>(),
+        "Return the smallest prime > value.");
+  m.def("next_prime",
+        [](py::array_t<std::uint64_t, py::array::c_style> values, unsigned threads) {
+          return nearest_prime_array(values, threads, &next_prime);
+        },
+        py::arg("values"), py::arg("threads") = 1);
+  m.def("next_prime",
+        [](py::array_t<std::int64_t, py::array::c_style> values, unsigned threads) {
+          return nearest_prime_array(values, threads, &next_prime);
+        },
+        py::arg("values"), py::arg("threads") = 1);
+
+  m.def("prev_prime", py::overload_cast<std::uint64_t>(&prev_prime), py::arg("value"),
+        py::call_guard<py::gil_scoped_release>(),
+        "Return the largest prime < value. Raises ValueError if value <= 2.");
+  m.def("prev_prime",
+        [](py::array_t<std::uint64_t, py::array::c_style> values, unsigned threads) {
+          return nearest_prime_array(values, threads, &prev_prime);
+        },
+        py::arg("values"), py::arg("threads") = 1);
+  m.def("prev_prime",
+        [](py::array_t<std::int64_t, py::array::c_style> values, unsigned threads) {
+          return nearest_prime_array(values, threads, &prev_prime);
+        },
+        py::arg("values"), py::arg("threads") = 1);
+
+  m.def("prime_count", &prime_count, py::arg("x"), py::arg("threads") = 1,
+        py::call_guard<py::gil_scoped_release>(),
+        "Return pi(x), the number of primes <= x.");
+
+  m.def("primes_up_to",
+        [](std::uint64_t n, unsigned threads) {
+          std::vector<std::uint64_t> primes;
+          {
+            py::gil_scoped_release release;
+            primes = primes_up_to(n, threads);
+          }
+          return as_array(std::move(primes));
+        },
+        py::arg("n"), py::arg("threads") = 1,
+        "Return all primes <= n as a uint64 NumPy array.");
+
+  m.def("primes_in_range",
+        [](std::uint64_t lo, std::uint64_t hi, unsigned threads) {
+          std::vector<std::uint64_t> primes;
+          {
+            py::gil_scoped_release release;
+            primes = primes_in_range(lo, hi, threads);
+          }
+          return as_array(std::move(primes));
+        },
+        py::arg("lo"), py::arg("hi"), py::arg("threads") = 1,
+        "Return all primes in [lo, hi) as a uint64 NumPy array (empty if hi <= lo).");
 }
@@ -0,0 +1,51 @@
+#pragma once
+
+/**
+ * @file parallel.h
+ * @brief Minimal std::thread fan-out shared by the compute entry points
+ */
+
+#include <algorithm>
+#include <cstddef>
+#include <exception>
+#include <thread>
+#include <vector>
+
+/**
+ * @brief Resolve a requested thread count; 0 means one per hardware thread
+ */
+inline unsigned resolve_threads(unsigned threads) {
+  if (threads == 0) threads = std::thread::hardware_concurrency();
+  return std::max(threads, 1u);
+}
+
+/**
+ * @brief Call fn(task) for every task in [0, tasks) on up to `threads` threads
+ *
+ * The calling thread takes part; the first exception thrown by any task is
+ * rethrown once all threads have joined.
+ */
+template <typename Fn>
+void parallel_for(std::size_t tasks, unsigned threads, Fn&& fn) {
+  const std::size_t workers = std::min<std::size_t>(resolve_threads(threads), tasks);
+  if (workers <= 1) {
+    for (std::size_t task = 0; task < tasks; task++) fn(task);
+    return;
+  }
+
+  std::vector<std::exception_ptr> errors(workers);
+  auto run = [&](std::size_t worker) {
+    try {
+      for (std::size_t task = worker; task < tasks; task += workers) fn(task);
+    } catch (...) {
+      errors[worker] = std::current_exception();
+    }
+  };
+  std::vector<std::thread> pool;
+  for (std::size_t worker = 1; worker < workers; worker++) pool.emplace_back(run, worker);
+  run(0);
+  for (std::thread& thread : pool) thread.join();
+  for (const std::exception_ptr& error : errors) {
+    if (error) std::rethrow_exception(error);
+  }
+}
@@ -0,0 +1,137 @@
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
+#include "parallel.h"
+#include "primes.h"
+#include "sieve.h"
+
+namespace {
+
+// Roughs updated by one thread at a time; shorter lists stay on the calling thread
+constexpr std::size_t kRoughChunk = 1 << 14;
+
+// P2 terms summed by one thread at a time; the terms shrink with l, and
+// parallel_for deals the chunks out round-robin so the threads stay balanced
+constexpr std::size_t kTermChunk = 64;
+
+}  // namespace
+
+// Legendre-Meissel count in O(x^(3/4) / log x) time and O(sqrt(x)) memory.
+// Odd values only: index i stands for 2i + 1. Sieving by the odd primes
+// p <= x^(1/4) leaves phi(x / r, a) for every unsieved r <= sqrt(x); the
+// numbers in (x^(1/4), x] left unsieved are primes or products of two such
+// primes, and the second loop removes the latter (Meissel's P2 term). Both
+// the per-prime update of the roughs and the P2 sum split over threads.
+std::uint64_t prime_count(std::uint64_t x, unsigned threads) {
+  if (x < 3) return x < 2 ? 0 : 1;
+  const std::uint64_t root = isqrt(x);
+
+  // Doubles divide faster and are exact while x < 2^53
+  const bool exact_double = x < (std::uint64_t{1} << 53);
+  auto divide = [exact_double](std::uint64_t n, std::uint64_t d) -> std::uint64_t {
+    return exact_double ? static_cast<std::uint64_t>(static_cast<double>(n) / d) : n / d;
+  };
+  auto half = [](std::uint64_t n) -> std::size_t { return (n - 1) / 2; };
+
+  std::size_t roughs = (root + 1) / 2;
+  std::vector<std::uint32_t> small(roughs);  // small[i]: unsieved odd values in [3, 2i + 1]
+  std::vector<std::uint32_t> rough(roughs);  // unsieved odd values <= root, increasing
+  std::vector<std::int64_t> large(roughs);   // large[k]: unsieved odd values in [3, x / rough[k]]
+  for (std::size_t i = 0; i < roughs; i++) {
+    small[i] = static_cast<std::uint32_t>(i);
+    rough[i] = static_cast<std::uint32_t>(2 * i + 1);
+    large[i] = static_cast<std::int64_t>((x / (2 * i + 1) - 1) / 2);
+  }
+  // With threads, chunks compact into a second buffer; one thread compacts in place,
+  // which is safe because an update only reads entries ahead of the one it writes
+  const bool parallel = resolve_threads(threads) > 1 && roughs > kRoughChunk;
+  std::vector<std::int64_t> updated(parallel ? roughs : 0);
+  std::vector<bool> sieved(root + 1);
+
+  std::int64_t sieving = 0;  // odd primes sieved so far
+  for (std::uint64_t p = 3; p <= root; p += 2) {
+    if (sieved[p]) continue;
+    const std::uint64_t p2 = p * p;
+    if (p2 > x / p2) break;
+    for (std::uint64_t m = p; m <= root; m += 2 * p) sieved[m] = true;
+
+    // large[k] -= (unsieved values in [3, x / (r p)]) - sieving, dropping r = multiples of p;
+    // each chunk of k compacts its survivors, then the chunks are moved together in order
+    const std::size_t chunks = (roughs + kRoughChunk - 1) / kRoughChunk;
+    std::vector<std::size_t> kept(chunks);
+    const std::uint32_t* small_counts = small.data();
+    const std::int64_t* large_counts = large.data();
+    std::int64_t* large_kept = parallel ? updated.data() : large.data();
+    std::uint32_t* rough_kept = rough.data();
+    const std::size_t size = roughs;
+    const std::int64_t a = sieving;
+    parallel_for(chunks, parallel ? threads : 1, [=, &sieved, &kept](std::size_t chunk) {
+      const std::size_t begin = chunk * kRoughChunk;
+      const std::size_t end = std::min(size, begin + kRoughChunk);
+      std::size_t j = begin;
+      for (std::size_t k = begin; k < end; k++) {
+        const std::uint64_t r = rough_kept[k];
+        if (sieved[r]) continue;
+        const std::uint64_t d = r * p;
+        const std::int64_t below = d <= root
+            ? large_counts[small_counts[d / 2] - a]
+            : small_counts[half(divide(x, d))];
+        large_kept[j] = large_counts[k] - below + a;
+        rough_kept[j++] = static_cast<std::uint32_t>(r);
+      }
+      kept[chunk] = j - begin;
+    });
+    roughs = 0;
+    for (std::size_t chunk = 0; chunk < chunks; chunk++) {
+      const std::size_t begin = chunk * kRoughChunk;
+      std::copy(large_kept + begin, large_kept + begin + kept[chunk], large.data() + roughs);
+      std::copy(rough_kept + begin, rough_kept + begin + kept[chunk], rough_kept + roughs);
+      roughs += kept[chunk];
+    }
+
+    // small[i] for 2i + 1 >= p^2 loses the multiples q p with p <= q <= (2i + 1) / p
+    std::size_t i = half(root);
+    for (std::uint64_t q = (root / p - 1) | 1; q >= p; q -= 2) {
+      const std::uint32_t removed = small[q / 2] - static_cast<std::uint32_t>(sieving);
+      for (const std::size_t end = q * p / 2; i >= end; i--) small[i] -= removed;
+    }
+    sieving++;
+  }
+
+  // phi(x, a) from the surviving roughs, then subtract the two-prime products
+  const auto n = static_cast<std::int64_t>(roughs);
+  std::int64_t count = large[0] + (n + 2 * (sieving - 1)) * (n - 1) / 2;
+  for (std::size_t k = 1; k < roughs; k++) count -= large[k];
+
+  // P2 has a term for each rough q = rough[l] with another rough in (q, sqrt(x / q)]
+  auto largest = [small_counts = small.data(), rough_kept = rough.data(), x, sieving,
+                  half](std::size_t l) -> std::int64_t {
+    const std::uint64_t q = rough_kept[l];
+    return small_counts[half(x / q / q)] - sieving;
+  };
+  std::size_t terms = 1;
+  while (terms < roughs && largest(terms) >= static_cast<std::int64_t>(terms) + 1) terms++;
+
+  const std::size_t chunks = (terms - 1 + kTermChunk - 1) / kTermChunk;
+  std::vector<std::int64_t> partial(chunks, 0);
+  parallel_for(chunks, threads, [=, &partial, small_counts = small.data(),
+                                 rough_kept = rough.data()](std::size_t chunk) {
+    const std::size_t begin = 1 + chunk * kTermChunk;
+    const std::size_t end = std::min(terms, begin + kTermChunk);
+    std::int64_t sum = 0;
+    for (std::size_t l = begin; l < end; l++) {
+      const std::uint64_t m = x / rough_kept[l];
+      const std::int64_t e = largest(l);
+      std::int64_t total = 0;
+      for (std::int64_t k = static_cast<std::int64_t>(l) + 1; k <= e; k++) {
+        total += small_counts[half(divide(m, rough_kept[k]))];
+      }
+      sum += total - (e - static_cast<std::int64_t>(l)) * (sieving + static_cast<std::int64_t>(l) - 1);
+    }
+    partial[chunk] = sum;
+  });
+  for (const std::int64_t sum : partial) count += sum;
+  return static_cast<std::uint64_t>(count + 1);  // + 1 for the prime 2
+}
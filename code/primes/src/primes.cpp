@@ -1,32 +1,428 @@
+#include <algorithm>
 #include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <numeric>
+#include <optional>
 #include <stdexcept>
+#include <vector>
 
+#include "parallel.h"
 #include "primes.h"
+#include "sieve.h"
 
-bool is_prime(int value) {
-  if (value < 2) return false;
-  if (value == 2) return true;
-  if (value % 2 == 0) return false;
+namespace {
 
-  int limit = static_cast<int>(std::sqrt(value));
-  for (int divisor = 3; divisor <= limit; divisor += 2) {
-    if (value % divisor == 0) return false;
+// From this N on, nth_prime jumps ahead with prime_count instead of sieving from 0
+constexpr std::uint64_t kPrimeCountThreshold = std::uint64_t{1} << 20;
+
+// Sieve windows around the estimate: x / 65536, but never less than 2^20 values
+constexpr std::uint64_t kMinWindow = std::uint64_t{1} << 20;
+constexpr std::uint64_t kWindowFraction = 65536;
+
+// prime_count(x) costs about as much as sieving x^(3/4) / 10 values; batch
+// nth_prime sieves on to the next index unless the gap is larger than that
+constexpr double kSeekExponent = 0.75;
+constexpr double kSeekRatio = 10.0;
+
+// Bit v is set for the primes v < 64
+constexpr std::uint64_t kPrimesBelow64 = 0x28208a20a08a28ac;
+
+// Values passing trial division by the primes below 64 are prime under 64^2
+constexpr std::uint64_t kTrialPrimes[] = {
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61};
+constexpr std::uint64_t kTrialLimit = 64 * 64;
+
+// Array elements handed to a thread at a time
+constexpr std::size_t kChunk = 1 << 16;
+
+// factorize: trial division by the primes below 2^12, then Pollard-Rho
+constexpr std::uint64_t kTrialFactorLimit = 1 << 12;
+constexpr std::uint64_t kBrentBatch = 128;
+
+// Rosser's theorem: p_N < N (ln N + ln ln N) for N >= 6
+std::uint64_t nth_prime_upper_bound(std::uint64_t N) {
+  if (N < 6) return 13;
+  const double n = static_cast<double>(N);
+  return static_cast<std::uint64_t>(n * (std::log(n) + std::log(std::log(n)))) + 1;
+}
+
+// Cipolla's asymptotic expansion of p_N: ~2e-4 relative at N = 2^20, ~1e-5 beyond 10^7
+std::uint64_t nth_prime_estimate(std::uint64_t N) {
+  const double n = static_cast<double>(N);
+  const double ln = std::log(n);
+  const double lnln = std::log(ln);
+  return static_cast<std::uint64_t>(
+      n * (ln + lnln - 1.0 + (lnln - 2.0) / ln - (lnln * lnln - 6.0 * lnln + 11.0) / (2.0 * ln * ln)));
+}
+
+std::uint64_t sieve_window(std::uint64_t x) {
+  return std::max(kMinWindow, x / kWindowFraction);
+}
+
+// Return x near p_N with count = pi(x) < N, from prime_count at Cipolla's estimate
+std::uint64_t seek_below(std::uint64_t N, std::uint64_t& count, unsigned threads) {
+  std::uint64_t x = nth_prime_estimate(N);
+  count = prime_count(x, threads);
+  const std::uint64_t window = sieve_window(x);
+  while (count >= N) {
+    const std::uint64_t lo = x - std::min(x, window);
+    count -= count_primes(lo + 1, x + 1, threads);
+    x = lo;
+  }
+  return x;
+}
+
+// Sieve [lo, hi) segment by segment; returns p_N, or 0 after adding the primes found to count
+std::uint64_t walk_to_nth(std::uint64_t lo, std::uint64_t hi, std::uint64_t N, std::uint64_t& count) {
+  SegmentedSieve sieve(lo, hi);
+  while (sieve.next_segment()) {
+    const std::uint64_t found = sieve.count();
+    if (count + found < N) {
+      count += found;
+      continue;
+    }
+    std::vector<std::uint64_t> primes;
+    sieve.append(primes);
+    return primes[N - count - 1];
+  }
+  return 0;
+}
+
+std::uint64_t mulmod(std::uint64_t a, std::uint64_t b, std::uint64_t m) {
+#if defined(__SIZEOF_INT128__)
+  return static_cast<std::uint64_t>(static_cast<unsigned __int128>(a) * b % m);
+#else
+  std::uint64_t result = 0;
+  for (a %= m; b; b >>= 1) {
+    if (b & 1) result = result >= m - a ? result - (m - a) : result + a;
+    a = a >= m - a ? a - (m - a) : a + a;
+  }
+  return result;
+#endif
+}
+
+std::uint64_t powmod(std::uint64_t base, std::uint64_t exponent, std::uint64_t m) {
+  std::uint64_t result = 1;
+  for (base %= m; exponent; exponent >>= 1) {
+    if (exponent & 1) result = mulmod(result, base, m);
+    base = mulmod(base, base, m);
+  }
+  return result;
+}
+
+// One Miller-Rabin round for odd n with n - 1 = d 2^s
+bool strong_probable_prime(std::uint64_t n, std::uint64_t base, std::uint64_t d, int s) {
+  base %= n;
+  if (base == 0) return true;
+  std::uint64_t x = powmod(base, d, n);
+  if (x == 1 || x == n - 1) return true;
+  for (int r = 1; r < s; r++) {
+    x = mulmod(x, x, n);
+    if (x == n - 1) return true;
+  }
+  return false;
+}
+
+std::uint64_t addmod(std::uint64_t a, std::uint64_t b, std::uint64_t m) {
+  return a >= m - b ? a - (m - b) : a + b;
+}
+
+// Primes below kTrialFactorLimit, sieved once, for trial division in factorize
+const std::vector<std::uint64_t>& trial_factors() {
+  static const std::vector<std::uint64_t> primes = primes_in_range(0, kTrialFactorLimit);
+  return primes;
+}
+
+// Montgomery product a b / 2^64 mod n for odd n, with inverse = n^-1 mod 2^64.
+// Pollard-Rho only needs some pseudorandom map and gcds, and 2^64 is a unit
+// mod n, so the iteration stays in Montgomery form throughout.
+std::uint64_t montgomery_mul(std::uint64_t a, std::uint64_t b, std::uint64_t n, std::uint64_t inverse) {
+#if defined(__SIZEOF_INT128__)
+  const unsigned __int128 t = static_cast<unsigned __int128>(a) * b;
+  const std::uint64_t m = static_cast<std::uint64_t>(t) * inverse;
+  const auto hi = static_cast<std::uint64_t>(t >> 64);
+  const auto mn = static_cast<std::uint64_t>((static_cast<unsigned __int128>(m) * n) >> 64);
+  return hi >= mn ? hi - mn : hi + (n - mn);
+#else
+  static_cast<void>(inverse);
+  return mulmod(a, b, n);
+#endif
+}
+
+// A nontrivial factor of an odd composite n (Pollard-Rho, Brent's cycle detection)
+std::uint64_t pollard_brent(std::uint64_t n) {
+  std::uint64_t inverse = n;  // Newton's iteration doubles the correct low bits
+  for (int i = 0; i < 5; i++) inverse *= 2 - n * inverse;
+  for (std::uint64_t c = 1;; c++) {
+    auto f = [n, c, inverse](std::uint64_t x) {
+      return addmod(montgomery_mul(x, x, n, inverse), c, n);
+    };
+    std::uint64_t x = 0, y = 2, ys = 2, q = 1, g = 1;
+    for (std::uint64_t r = 1; g == 1; r *= 2) {
+      x = y;
+      for (std::uint64_t i = 0; i < r; i++) y = f(y);
+      // Batch kBrentBatch differences into one product before each gcd
+      for (std::uint64_t k = 0; k < r && g == 1; k += kBrentBatch) {
+        ys = y;
+        for (std::uint64_t i = 0; i < std::min(kBrentBatch, r - k); i++) {
+          y = f(y);
+          q = montgomery_mul(q, x > y ? x - y : y - x, n, inverse);
+        }
+        g = std::gcd(q, n);
+      }
+    }
+    if (g == n) {
+      // The batch overshot: replay it one step at a time
+      do {
+        ys = f(ys);
+        g = std::gcd(x > ys ? x - ys : ys - x, n);
+      } while (g == 1);
+    }
+    if (g != n) return g;
+  }
+}
+
+void split(std::uint64_t n, std::vector<std::uint64_t>& factors) {
+  if (n == 1) return;
+  if (is_prime(n)) {
+    factors.push_back(n);
+    return;
+  }
+  const std::uint64_t d = pollard_brent(n);
+  split(d, factors);
+  split(n / d, factors);
+}
+
+// Residues mod 30 coprime to 2, 3 and 5
+constexpr std::uint64_t kWheel30[] = {1, 7, 11, 13, 17, 19, 23, 29};
+
+// Largest prime below 2^64
+constexpr std::uint64_t kLargestPrime = 18446744073709551557ull;
+
+// One pass over count indices given in increasing N by order; see nth_prime()
+void nth_prime_sorted(const std::uint64_t* N, const std::size_t* order, std::size_t count,
+                      std::uint64_t* out) {
+  const std::uint64_t hi = nth_prime_upper_bound(N[order[count - 1]]) + 1;
+
+  // One pass in increasing N: the sieve runs on from [x + 1, hi) and segments
+  // are only listed when an index lands in them
+  std::uint64_t x = 0;
+  std::uint64_t position = 0;  // largest prime answered so far
+  std::optional<SegmentedSieve> sieve(std::in_place, x + 1, hi);
+  std::uint64_t before = 0;    // primes below the current segment
+  std::uint64_t found = 0;     // primes in the current segment
+  bool listed = false;
+  std::vector<std::uint64_t> primes;
+
+  for (std::size_t k = 0; k < count; k++) {
+    const std::size_t i = order[k];
+    const std::uint64_t n = N[i];
+    if (n >= kPrimeCountThreshold) {
+      const std::uint64_t estimate = nth_prime_estimate(n);
+      const double gap = std::pow(static_cast<double>(estimate), kSeekExponent) / kSeekRatio;
+      if (estimate > position && static_cast<double>(estimate - position) > gap) {
+        x = seek_below(n, before, 1);
+        sieve.emplace(x + 1, hi);
+        found = 0;
+      }
+    }
+    while (before + found < n) {
+      before += found;
+      if (!sieve->next_segment()) throw std::logic_error("nth_prime upper bound too small");
+      found = sieve->count();
+      listed = false;
+    }
+    if (!listed) {
+      primes.clear();
+      sieve->append(primes);
+      listed = true;
+    }
+    out[i] = position = primes[n - before - 1];
+  }
+}
+
+}  // namespace
+
+bool is_prime(std::uint64_t value) {
+  if (value < 64) return kPrimesBelow64 >> value & 1;
+  for (std::uint64_t p : kTrialPrimes) {
+    if (value % p == 0) return false;
+  }
+  if (value < kTrialLimit) return true;
+
+  // Deterministic Miller-Rabin: {2, 7, 61} below 2^32, the 7-base set above
+  std::uint64_t d = value - 1;
+  int s = 0;
+  for (; d % 2 == 0; s++) d /= 2;
+  if (value < (std::uint64_t{1} << 32)) {
+    for (std::uint64_t base : {2, 7, 61}) {
+      if (!strong_probable_prime(value, base, d, s)) return false;
+    }
+    return true;
+  }
+  for (std::uint64_t base : {2, 325, 9375, 28178, 450775, 9780504, 1795265022}) {
+    if (!strong_probable_prime(value, base, d, s)) return false;
   }
   return true;
 }
 
-int nth_prime(int N) {
-  if (N <= 0) throw std::invalid_argument("N must be >= 1");
-  if (N == 1) return 2;
+void is_prime(const std::uint64_t* values, std::size_t count, bool* out, unsigned threads) {
+  parallel_for((count + kChunk - 1) / kChunk, threads, [&](std::size_t chunk) {
+    const std::size_t end = std::min(count, (chunk + 1) * kChunk);
+    for (std::size_t i = chunk * kChunk; i < end; i++) out[i] = is_prime(values[i]);
+  });
+}
 
-  int count = 1;
-  int candidate = 1;
+void is_prime(const std::int64_t* values, std::size_t count, bool* out, unsigned threads) {
+  parallel_for((count + kChunk - 1) / kChunk, threads, [&](std::size_t chunk) {
+    const std::size_t end = std::min(count, (chunk + 1) * kChunk);
+    for (std::size_t i = chunk * kChunk; i < end; i++) {
+      out[i] = values[i] >= 0 && is_prime(static_cast<std::uint64_t>(values[i]));
+    }
+  });
+}
 
-  while (count < N) {
-    candidate += 2;
-    if (is_prime(candidate)) {
-      count++;
+std::vector<std::uint64_t> factorize(std::uint64_t value) {
+  if (value == 0) throw std::invalid_argument("factorize requires value >= 1");
+  std::vector<std::uint64_t> factors;
+  for (std::uint64_t p : trial_factors()) {
+    if (p * p > value) break;
+    for (; value % p == 0; value /= p) factors.push_back(p);
+  }
+  if (value < kTrialFactorLimit * kTrialFactorLimit) {
+    if (value > 1) factors.push_back(value);
+    return factors;
+  }
+  const std::size_t first = factors.size();
+  split(value, factors);
+  std::sort(factors.begin() + first, factors.end());
+  return factors;
+}
+
+void factorize(const std::uint64_t* values, std::size_t count,
+               std::vector<std::uint64_t>& factors, std::vector<std::size_t>& offsets,
+               unsigned threads) {
+  // Factor chunks independently, then concatenate them in order
+  const std::size_t chunks = (count + kChunk - 1) / kChunk;
+  std::vector<std::vector<std::uint64_t>> chunk_factors(chunks);
+  std::vector<std::vector<std::size_t>> chunk_lengths(chunks);
+  parallel_for(chunks, threads, [&](std::size_t chunk) {
+    const std::size_t end = std::min(count, (chunk + 1) * kChunk);
+    for (std::size_t i = chunk * kChunk; i < end; i++) {
+      const std::vector<std::uint64_t> found = factorize(values[i]);
+      chunk_factors[chunk].insert(chunk_factors[chunk].end(), found.begin(), found.end());
+      chunk_lengths[chunk].push_back(found.size());
     }
+  });
+  factors.clear();
+  offsets.assign(1, 0);
+  for (std::size_t chunk = 0; chunk < chunks; chunk++) {
+    factors.insert(factors.end(), chunk_factors[chunk].begin(), chunk_factors[chunk].end());
+    for (std::size_t length : chunk_lengths[chunk]) offsets.push_back(offsets.back() + length);
+  }
+}
+
+std::uint64_t next_prime(std::uint64_t value) {
+  if (value < 61) {
+    while (!(kPrimesBelow64 >> ++value & 1)) {}
+    return value;
   }
-  return candidate;
+  if (value >= kLargestPrime) throw std::overflow_error("no 64-bit prime after value");
+
+  // Step through the values coprime to 30; is_prime trial-divides before Miller-Rabin
+  std::uint64_t base = value / 30 * 30;
+  std::size_t k = 0;
+  auto advance = [&] {
+    if (++k == 8) {
+      k = 0;
+      base += 30;
+    }
+  };
+  while (base + kWheel30[k] <= value) advance();
+  while (!is_prime(base + kWheel30[k])) advance();
+  return base + kWheel30[k];
+}
+
+std::uint64_t prev_prime(std::uint64_t value) {
+  if (value < 3) throw std::invalid_argument("no prime below value");
+  if (value <= 64) {
+    while (!(kPrimesBelow64 >> --value & 1)) {}
+    return value;
+  }
+
+  std::uint64_t base = (value - 1) / 30 * 30;
+  std::size_t k = 7;
+  auto retreat = [&] {
+    if (k-- == 0) {
+      k = 7;
+      base -= 30;
+    }
+  };
+  while (kWheel30[k] >= value - base) retreat();
+  while (!is_prime(base + kWheel30[k])) retreat();
+  return base + kWheel30[k];
+}
+
+void next_prime(const std::uint64_t* values, std::size_t count, std::uint64_t* out, unsigned threads) {
+  parallel_for((count + kChunk - 1) / kChunk, threads, [&](std::size_t chunk) {
+    const std::size_t end = std::min(count, (chunk + 1) * kChunk);
+    for (std::size_t i = chunk * kChunk; i < end; i++) out[i] = next_prime(values[i]);
+  });
+}
+
+void prev_prime(const std::uint64_t* values, std::size_t count, std::uint64_t* out, unsigned threads) {
+  parallel_for((count + kChunk - 1) / kChunk, threads, [&](std::size_t chunk) {
+    const std::size_t end = std::min(count, (chunk + 1) * kChunk);
+    for (std::size_t i = chunk * kChunk; i < end; i++) out[i] = prev_prime(values[i]);
+  });
+}
+
+std::uint64_t nth_prime(std::uint64_t N, unsigned threads) {
+  if (N == 0) throw std::invalid_argument("N must be >= 1");
+
+  // Find x and count = pi(x) < N, then sieve forward one window at a time
+  std::uint64_t x = 0;
+  std::uint64_t count = 0;
+  std::uint64_t window = nth_prime_upper_bound(N);
+  if (N >= kPrimeCountThreshold) {
+    x = seek_below(N, count, threads);
+    window = sieve_window(x);
+  }
+
+  for (;; x += window) {
+    // Count the pieces in parallel, then walk only the piece that holds p_N
+    const std::vector<std::uint64_t> bounds = split_range(x + 1, x + window + 1, threads);
+    std::vector<std::uint64_t> counts(bounds.size() - 1, 0);
+    if (counts.size() > 1) {
+      parallel_for(counts.size(), threads, [&](std::size_t part) {
+        counts[part] = count_primes(bounds[part], bounds[part + 1]);
+      });
+    }
+    for (std::size_t part = 0; part < counts.size(); part++) {
+      if (counts.size() > 1 && count + counts[part] < N) {
+        count += counts[part];
+        continue;
+      }
+      const std::uint64_t prime = walk_to_nth(bounds[part], bounds[part + 1], N, count);
+      if (prime) return prime;
+    }
+  }
+}
+
+void nth_prime(const std::uint64_t* N, std::size_t count, std::uint64_t* out, unsigned threads) {
+  if (count == 0) return;
+  std::vector<std::size_t> order(count);
+  std::iota(order.begin(), order.end(), std::size_t{0});
+  std::sort(order.begin(), order.end(), [N](std::size_t a, std::size_t b) { return N[a] < N[b]; });
+  if (N[order.front()] == 0) throw std::invalid_argument("N must be >= 1");
+
+  // Each thread takes a contiguous run of the sorted indices and makes its own
+  // pass, jumping to the start of its run with prime_count like the scalar call
+  const std::size_t runs = std::min<std::size_t>(resolve_threads(threads), count);
+  parallel_for(runs, threads, [&](std::size_t run) {
+    const std::size_t begin = count * run / runs;
+    const std::size_t end = count * (run + 1) / runs;
+    nth_prime_sorted(N, order.data() + begin, end - begin, out);
+  });
 }
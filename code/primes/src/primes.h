@@ -5,23 +5,125 @@
  * @brief Prime number utility functions (pure C++)
  */
 
+#include <cstddef>
+#include <cstdint>
+#include <vector>
+
 /**
  * @brief Return true if the given value is prime
  *
+ * Values below 64^2 are settled by a bitmask and trial division; larger ones
+ * by deterministic Miller-Rabin (bases 2, 325, 9375, 28178, 450775, 9780504,
+ * 1795265022, exact for all 64-bit inputs) with 128-bit modular products.
+ *
  * @param value Integer to test
  * @return true if prime, false otherwise
  */
-bool is_prime(int value);
+bool is_prime(std::uint64_t value);
+
+/**
+ * @brief Test count values at once, writing out[i] = is_prime(values[i])
+ *
+ * @param threads Split the values over this many threads (0: one per core)
+ */
+void is_prime(const std::uint64_t* values, std::size_t count, bool* out, unsigned threads = 1);
+
+/**
+ * @brief Signed variant; negative values are not prime
+ */
+void is_prime(const std::int64_t* values, std::size_t count, bool* out, unsigned threads = 1);
+
+/**
+ * @brief Return the prime factors of value, with multiplicity, in increasing order
+ *
+ * Trial division by the primes below 2^12, then Miller-Rabin and Pollard-Rho
+ * with Brent's cycle detection on whatever remains. factorize(1) is empty.
+ *
+ * @throws std::invalid_argument if value == 0
+ */
+std::vector<std::uint64_t> factorize(std::uint64_t value);
+
+/**
+ * @brief Factor count values; the factors of values[i] are factors[offsets[i], offsets[i + 1])
+ */
+void factorize(const std::uint64_t* values, std::size_t count,
+               std::vector<std::uint64_t>& factors, std::vector<std::size_t>& offsets,
+               unsigned threads = 1);
+
+/**
+ * @brief Return the smallest prime > value
+ *
+ * Candidates step through the residues coprime to 30 and go to is_prime,
+ * whose trial division by the primes below 64 screens most of them before
+ * Miller-Rabin.
+ *
+ * @throws std::overflow_error if no such prime fits in 64 bits
+ */
+std::uint64_t next_prime(std::uint64_t value);
+
+/**
+ * @brief Return the largest prime < value
+ *
+ * @throws std::invalid_argument if value <= 2
+ */
+std::uint64_t prev_prime(std::uint64_t value);
+
+/**
+ * @brief Write out[i] = next_prime(values[i]) for count values
+ */
+void next_prime(const std::uint64_t* values, std::size_t count, std::uint64_t* out,
+                unsigned threads = 1);
+
+/**
+ * @brief Write out[i] = prev_prime(values[i]) for count values
+ */
+void prev_prime(const std::uint64_t* values, std::size_t count, std::uint64_t* out,
+                unsigned threads = 1);
+
+/**
+ * @brief Return pi(x), the number of primes <= x
+ *
+ * Legendre-Meissel combinatorial count (prime_count.cpp): phi(x, a) for the
+ * primes up to x^(1/4) by dynamic programming over the O(sqrt(x)) distinct
+ * quotients x / n, then Meissel's correction for products of two larger
+ * primes. O(x^(3/4) / log x) time; pi(10^13) takes about a second.
+ *
+ * @param x Upper limit (inclusive)
+ * @param threads Split the phi update and the P2 sum over this many threads (0: one per core)
+ * @return Number of primes p <= x
+ */
+std::uint64_t prime_count(std::uint64_t x, unsigned threads = 1);
 
 /**
  * @brief Return the Nth prime number (1-based indexing)
  *
+ * Small N count with the segmented sieve (sieve.h) up to Rosser's upper
+ * bound N (ln N + ln ln N). Larger N start from Cipolla's asymptotic estimate
+ * x of p_N, take pi(x) from prime_count and sieve only the short stretch
+ * between x and p_N.
+ *
  * Example:
  *   nth_prime(1) == 2
  *   nth_prime(2) == 3
  *
  * @param N Index of the prime to return (must be >= 1)
+ * @param threads Sieve on this many threads (0: one per core)
  * @return The Nth prime
  * @throws std::invalid_argument if N < 1
  */
-int nth_prime(int N);
+std::uint64_t nth_prime(std::uint64_t N, unsigned threads = 1);
+
+/**
+ * @brief Write out[i] = nth_prime(N[i]) for count indices in one pass
+ *
+ * The indices are visited in increasing order along a single segmented sieve
+ * up to the bound for the largest N; only segments that hold an answer are
+ * listed. Where the next index lies so far ahead that sieving to it would cost
+ * more than prime_count, the pass jumps there as the scalar nth_prime does.
+ *
+ * @param threads Split the sorted indices into this many runs, each its own
+ *                pass on its own thread (0: one per core)
+ * @throws std::invalid_argument if any N[i] < 1
+ */
+void nth_prime(const std::uint64_t* N, std::size_t count, std::uint64_t* out,
+               unsigned threads = 1);
@@ -0,0 +1,215 @@
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <vector>
+
+#include "parallel.h"
+#include "sieve.h"
+
+namespace {
+
+// Segments of 32 KiB (L1) or, once the sieving primes outgrow one, 256 KiB (L2)
+constexpr std::size_t kL1Words = 32 * 1024 / 8;
+constexpr std::size_t kL2Words = 256 * 1024 / 8;
+
+// Wheel of 3 * 5 * 7 * 11 * 13 = 15015 odd values, repeated 64 times to be word aligned
+constexpr std::size_t kWheelWords = 15015;
+constexpr std::uint64_t kSmallPrimes[] = {2, 3, 5, 7, 11, 13};
+constexpr std::uint64_t kFirstSievingPrime = 17;
+constexpr std::uint64_t kMinRangePerThread = std::uint64_t{1} << 22;
+constexpr std::uint64_t kFirstStreamSpan = std::uint64_t{1} << 24;
+
+int popcount64(std::uint64_t word) {
+#if defined(__GNUC__) || defined(__clang__)
+  return __builtin_popcountll(word);
+#else
+  int count = 0;
+  for (; word; word &= word - 1) count++;
+  return count;
+#endif
+}
+
+int ctz64(std::uint64_t word) {
+#if defined(__GNUC__) || defined(__clang__)
+  return __builtin_ctzll(word);
+#else
+  int bit = 0;
+  while (!(word >> bit & 1)) bit++;
+  return bit;
+#endif
+}
+
+// Bit i (value 2i + 1) is set when the value is coprime to 3, 5, 7, 11 and 13
+const std::vector<std::uint64_t>& wheel_pattern() {
+  static const std::vector<std::uint64_t> pattern = [] {
+    std::vector<std::uint64_t> words(kWheelWords, ~std::uint64_t{0});
+    for (std::uint64_t p : {3, 5, 7, 11, 13}) {
+      for (std::uint64_t bit = (p - 1) / 2; bit < 64 * kWheelWords; bit += p) {
+        words[bit / 64] &= ~(std::uint64_t{1} << (bit % 64));
+      }
+    }
+    return words;
+  }();
+  return pattern;
+}
+
+}  // namespace
+
+std::uint64_t isqrt(std::uint64_t n) {
+  std::uint64_t r = static_cast<std::uint64_t>(std::sqrt(static_cast<double>(n)));
+  while (r > 0 && r > n / r) r--;
+  while (r + 1 <= n / (r + 1)) r++;
+  return r;
+}
+
+std::vector<std::uint64_t> split_range(std::uint64_t lo, std::uint64_t hi, unsigned threads) {
+  // Below a few L1 segments per thread the start-up cost outweighs the split
+  std::uint64_t parts = 1;
+  if (hi > lo) {
+    parts = std::clamp<std::uint64_t>((hi - lo) / kMinRangePerThread, 1, resolve_threads(threads));
+  }
+  const std::uint64_t step = hi > lo ? (hi - lo) / parts : 0;
+  std::vector<std::uint64_t> bounds;
+  for (std::uint64_t part = 0; part < parts; part++) bounds.push_back(lo + part * step);
+  bounds.push_back(hi);
+  return bounds;
+}
+
+SegmentedSieve::SegmentedSieve(std::uint64_t lo, std::uint64_t hi)
+    : lo_bit_(lo / 2), hi_bit_(hi / 2), next_bit_(lo / 2 & ~std::uint64_t{63}) {
+  if (hi <= lo) {
+    hi_bit_ = next_bit_;
+    return;
+  }
+  for (std::uint64_t p : kSmallPrimes) {
+    if (lo <= p && p < hi) small_.push_back(p);
+  }
+
+  // Odd multiples p (2k + 1) of a sieving prime sit at bits p k + (p - 1) / 2
+  const std::uint64_t root = isqrt(hi - 1);
+  if (root >= kFirstSievingPrime) {
+    SegmentedSieve base(kFirstSievingPrime, root + 1);
+    std::vector<std::uint64_t> primes;
+    while (base.next_segment()) {
+      primes.clear();
+      base.append(primes);
+      for (std::uint64_t p : primes) {
+        const std::uint64_t offset = (p - 1) / 2;
+        std::uint64_t bit = (p * p - 1) / 2;
+        if (bit < next_bit_) bit = (next_bit_ - offset + p - 1) / p * p + offset;
+        sieving_.push_back(static_cast<std::uint32_t>(p));
+        multiple_.push_back(bit);
+      }
+    }
+  }
+
+  const std::size_t words = root < 128 * kL1Words ? kL1Words : kL2Words;
+  words_.resize(std::min<std::uint64_t>(words, (hi_bit_ - next_bit_ + 63) / 64));
+}
+
+bool SegmentedSieve::next_segment() {
+  if (segments_ > 0 && next_bit_ >= hi_bit_) return false;
+  segments_++;
+  segment_bit_ = next_bit_;
+  next_bit_ = segment_bit_ + 64 * words_.size();
+  const std::uint64_t end_bit = std::min(hi_bit_, next_bit_);
+  segment_words_ = (end_bit - segment_bit_ + 63) / 64;
+  if (segment_words_ == 0) return true;
+
+  // Presieve by copying the wheel, then cross off the remaining sieving primes
+  const std::vector<std::uint64_t>& wheel = wheel_pattern();
+  std::size_t offset = segment_bit_ / 64 % kWheelWords;
+  for (std::size_t w = 0; w < segment_words_;) {
+    const std::size_t n = std::min(segment_words_ - w, kWheelWords - offset);
+    std::copy_n(wheel.begin() + offset, n, words_.begin() + w);
+    w += n;
+    offset = 0;
+  }
+
+  for (std::size_t k = 0; k < sieving_.size(); k++) {
+    const std::uint64_t p = sieving_[k];
+    if ((p * p - 1) / 2 >= end_bit) break;
+    std::uint64_t bit = multiple_[k];
+    for (; bit < end_bit; bit += p) {
+      words_[(bit - segment_bit_) / 64] &= ~(std::uint64_t{1} << (bit % 64));
+    }
+    multiple_[k] = bit;
+  }
+
+  // 1 is not prime; drop the bits outside [lo, hi)
+  if (segment_bit_ == 0) words_[0] &= ~std::uint64_t{1};
+  if (lo_bit_ > segment_bit_) words_[0] &= ~std::uint64_t{0} << (lo_bit_ - segment_bit_);
+  if (end_bit % 64) words_[segment_words_ - 1] &= (std::uint64_t{1} << (end_bit % 64)) - 1;
+  return true;
+}
+
+std::uint64_t SegmentedSieve::count() const {
+  std::uint64_t count = segments_ == 1 ? small_.size() : 0;
+  for (std::size_t w = 0; w < segment_words_; w++) count += popcount64(words_[w]);
+  return count;
+}
+
+void SegmentedSieve::append(std::vector<std::uint64_t>& out) const {
+  if (segments_ == 1) out.insert(out.end(), small_.begin(), small_.end());
+  for (std::size_t w = 0; w < segment_words_; w++) {
+    const std::uint64_t base = segment_bit_ + 64 * w;
+    for (std::uint64_t word = words_[w]; word; word &= word - 1) {
+      out.push_back(2 * (base + ctz64(word)) + 1);
+    }
+  }
+}
+
+PrimeGenerator::PrimeGenerator(std::uint64_t start, std::uint64_t stop)
+    : next_lo_(start), stop_(stop) {}
+
+bool PrimeGenerator::next_chunk(std::vector<std::uint64_t>& out) {
+  for (;;) {
+    if (sieve_ && sieve_->next_segment()) {
+      out.clear();
+      sieve_->append(out);
+      if (!out.empty()) return true;
+      continue;
+    }
+    if (next_lo_ >= stop_) return false;
+    const std::uint64_t span = std::max(next_lo_, kFirstStreamSpan);
+    const std::uint64_t hi = stop_ - next_lo_ > span ? next_lo_ + span : stop_;
+    sieve_.emplace(next_lo_, hi);
+    next_lo_ = hi;
+  }
+}
+
+std::vector<std::uint64_t> primes_in_range(std::uint64_t lo, std::uint64_t hi, unsigned threads) {
+  const std::vector<std::uint64_t> bounds = split_range(lo, hi, threads);
+  std::vector<std::vector<std::uint64_t>> parts(bounds.size() - 1);
+  parallel_for(parts.size(), threads, [&](std::size_t part) {
+    SegmentedSieve sieve(bounds[part], bounds[part + 1]);
+    while (sieve.next_segment()) sieve.append(parts[part]);
+  });
+  if (parts.size() == 1) return std::move(parts[0]);
+
+  std::size_t total = 0;
+  for (const std::vector<std::uint64_t>& part : parts) total += part.size();
+  std::vector<std::uint64_t> primes;
+  primes.reserve(total);
+  for (const std::vector<std::uint64_t>& part : parts) {
+    primes.insert(primes.end(), part.begin(), part.end());
+  }
+  return primes;
+}
+
+std::vector<std::uint64_t> primes_up_to(std::uint64_t n, unsigned threads) {
+  // 2^64 - 1 = 3 * 5 * 17 * 257 * 641 * 65537 * 6700417 is not prime
+  return primes_in_range(0, n == UINT64_MAX ? n : n + 1, threads);
+}
+
+std::uint64_t count_primes(std::uint64_t lo, std::uint64_t hi, unsigned threads) {
+  const std::vector<std::uint64_t> bounds = split_range(lo, hi, threads);
+  std::vector<std::uint64_t> counts(bounds.size() - 1, 0);
+  parallel_for(counts.size(), threads, [&](std::size_t part) {
+    SegmentedSieve sieve(bounds[part], bounds[part + 1]);
+    while (sieve.next_segment()) counts[part] += sieve.count();
+  });
+  std::uint64_t total = 0;
+  for (std::uint64_t count : counts) total += count;
+  return total;
+}
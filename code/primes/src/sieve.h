@@ -0,0 +1,115 @@
+#pragma once
+
+/**
+ * @file sieve.h
+ * @brief Segmented, cache-blocked sieve of Eratosthenes (pure C++)
+ */
+
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <vector>
+
+/**
+ * @brief Walks the primes in [lo, hi) one cache-sized segment at a time
+ *
+ * Each segment is a bit-packed, odd-only window that starts from a
+ * precomputed wheel pattern (multiples of 3, 5, 7, 11 and 13 already
+ * removed) and is then crossed off by the sieving primes up to sqrt(hi).
+ * Memory is proportional to pi(sqrt(hi)) plus one segment.
+ *
+ * Example:
+ *   SegmentedSieve sieve(0, 100);
+ *   while (sieve.next_segment()) total += sieve.count();
+ */
+class SegmentedSieve {
+ public:
+  /**
+   * @param lo First value of the range (inclusive)
+   * @param hi End of the range (exclusive)
+   */
+  SegmentedSieve(std::uint64_t lo, std::uint64_t hi);
+
+  /**
+   * @brief Sieve the next segment
+   *
+   * @return false once the whole range has been consumed
+   */
+  bool next_segment();
+
+  /// Number of primes in the current segment
+  std::uint64_t count() const;
+
+  /// Append the primes of the current segment, in increasing order, to out
+  void append(std::vector<std::uint64_t>& out) const;
+
+ private:
+  std::uint64_t lo_bit_;   // index of the first odd value 2i + 1 >= lo
+  std::uint64_t hi_bit_;   // index one past the last odd value < hi
+  std::uint64_t next_bit_; // start of the segment to sieve next (multiple of 64)
+  std::uint64_t segment_bit_ = 0;
+  std::vector<std::uint64_t> words_;
+  std::vector<std::uint64_t> small_;     // primes below the wheel limit within [lo, hi)
+  std::vector<std::uint32_t> sieving_;   // primes p >= 17 with p * p < hi
+  std::vector<std::uint64_t> multiple_;  // next bit to cross off, per sieving prime
+  std::size_t segment_words_ = 0;
+  std::uint64_t segments_ = 0;
+};
+
+/**
+ * @brief Incremental, unbounded stream of primes in [start, stop), one segment at a time
+ *
+ * The stream is sieved in ranges [lo, 2 lo) (at least 2^24 values wide), each
+ * with its own SegmentedSieve, so memory stays at one segment plus the sieving
+ * primes up to sqrt of the current position however far iteration goes.
+ */
+class PrimeGenerator {
+ public:
+  /**
+   * @param start First value of the stream (inclusive)
+   * @param stop End of the stream (exclusive); 2^64 - 1 for unbounded
+   */
+  explicit PrimeGenerator(std::uint64_t start, std::uint64_t stop = UINT64_MAX);
+
+  /**
+   * @brief Replace out with the primes of the next non-empty segment
+   *
+   * @return false once the stream is exhausted
+   */
+  bool next_chunk(std::vector<std::uint64_t>& out);
+
+ private:
+  std::uint64_t next_lo_;
+  std::uint64_t stop_;
+  std::optional<SegmentedSieve> sieve_;
+};
+
+/**
+ * @brief Floor of the square root, exact for every 64-bit n
+ */
+std::uint64_t isqrt(std::uint64_t n);
+
+/**
+ * @brief Split [lo, hi) into at most `threads` contiguous pieces for parallel sieving
+ *
+ * @return The piece boundaries lo = b[0] < b[1] < ... < b[k] = hi
+ */
+std::vector<std::uint64_t> split_range(std::uint64_t lo, std::uint64_t hi, unsigned threads);
+
+/**
+ * @brief Return all primes p with lo <= p < hi, in increasing order
+ *
+ * @param threads Split the range over this many threads (0: one per core)
+ */
+std::vector<std::uint64_t> primes_in_range(std::uint64_t lo, std::uint64_t hi,
+                                           unsigned threads = 1);
+
+/**
+ * @brief Return all primes p <= n, in increasing order
+ */
+std::vector<std::uint64_t> primes_up_to(std::uint64_t n, unsigned threads = 1);
+
+/**
+ * @brief Return the number of primes p with lo <= p < hi
+ */
+std::uint64_t count_primes(std::uint64_t lo, std::uint64_t hi, unsigned threads = 1);
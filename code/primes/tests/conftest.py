@@ -0,0 +1,53 @@
+# =========================
+# tests/conftest.py
+# =========================
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def _eratosthenes(n: int) -> np.ndarray:
+    """Primes <= n by the plain sieve of Eratosthenes, independent of the package"""
+    flags = np.ones(n + 1, dtype=bool)
+    flags[:2] = False
+    for p in range(2, math.isqrt(n) + 1):
+        if flags[p]:
+            flags[p * p::p] = False
+    return np.flatnonzero(flags).astype(np.uint64)
+
+
+@pytest.fixture(scope="session")
+def sieve():
+    """sieve(lo, hi): the primes in [lo, hi) from a reference sieve (hi - lo up to ~10^7)"""
+
+    def primes_in(lo: int, hi: int) -> np.ndarray:
+        if hi <= lo:
+            return np.empty(0, dtype=np.uint64)
+        flags = np.ones(hi - lo, dtype=bool)
+        flags[:max(0, 2 - lo)] = False
+        for p in _eratosthenes(math.isqrt(hi - 1)).tolist():
+            start = max(p * p, (lo + p - 1) // p * p)
+            flags[start - lo::p] = False
+        return (np.flatnonzero(flags) + lo).astype(np.uint64)
+
+    return primes_in
+
+
+@pytest.fixture(scope="session")
+def reference(sieve) -> np.ndarray:
+    """Every prime below 2 * 10^6"""
+    return sieve(0, 2 * 10**6)
+
+
+@pytest.fixture(params=primes.available_backends())
+def backend(request):
+    """Run a test once per backend that imports here; restores the previous backend"""
+    previous = primes.get_backend()
+    primes.set_backend(request.param)
+    yield request.param
+    primes.set_backend(previous)
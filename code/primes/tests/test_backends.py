@@ -0,0 +1,74 @@
+# =========================
+# tests/test_backends.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import primes
+from primes import backend as backends
+
+KERNELS = [
+    "factorize",
+    "is_prime",
+    "next_prime",
+    "nth_prime",
+    "prev_prime",
+    "prime_count",
+    "primes_in_range",
+    "primes_up_to",
+]
+
+
+def _inputs():
+    rng = np.random.default_rng(7)
+    small = rng.integers(2, 10**6, size=64, dtype=np.uint64)
+    wide = rng.integers(2**32, 2**63, size=64, dtype=np.uint64)
+    semiprimes = rng.choice(primes.primes_in_range(2**31, 2**31 + 10**4), size=(16, 2)).prod(axis=1)
+    return {
+        "factorize": [np.concatenate([small[:16], wide[:16], semiprimes]), 600851475143],
+        "is_prime": [np.concatenate([small, wide, semiprimes]), 2**61 - 1],
+        "next_prime": [np.concatenate([small, wide[:16]]), 10**15],
+        "nth_prime": [rng.integers(1, 10**6, size=(8, 8)), 123_457],
+        "prev_prime": [np.concatenate([small, wide[:16]]), 10**15],
+        "prime_count": [10**8 + 1, 7],
+        "primes_in_range": [(2**40, 2**40 + 10**6), (0, 10**5)],
+        "primes_up_to": [10**6 + 1, 2],
+    }
+
+
+def test_backends_are_listed():
+    names = primes.available_backends()
+    assert names and set(names) <= {"cpp", "numpy"}
+    assert primes.get_backend() in names
+    with pytest.raises(ValueError):
+        primes.set_backend("fortran")
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_every_backend_exports_every_kernel(backend, kernel):
+    assert callable(getattr(backends.current(), kernel))
+    assert getattr(primes, kernel) is getattr(backends.current(), kernel)
+
+
+@pytest.mark.parametrize("kernel", KERNELS)
+def test_parity(backend, kernel):
+    # Every backend must agree element for element with the first one listed
+    previous = primes.get_backend()
+    primes.set_backend(primes.available_backends()[0])
+    try:
+        expected = [_call(kernel, argument) for argument in _inputs()[kernel]]
+    finally:
+        primes.set_backend(previous)
+
+    for argument, want in zip(_inputs()[kernel], expected):
+        got = _call(kernel, argument)
+        assert np.asarray(got).dtype == np.asarray(want).dtype
+        assert np.array_equal(got, want)
+
+
+def _call(kernel, argument):
+    if isinstance(argument, tuple):
+        return getattr(primes, kernel)(*argument)
+    return getattr(primes, kernel)(argument)
@@ -0,0 +1,112 @@
+# =========================
+# tests/test_cache.py
+# =========================
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def test_queries_match_reference(backend, reference):
+    cache = primes.PrimeCache(block=10**5)
+    rng = np.random.default_rng(6)
+    for N in rng.integers(1, reference.size + 1, size=50).tolist():
+        assert cache.nth_prime(N) == reference[N - 1]
+    for x in rng.integers(0, 2 * 10**6, size=50).tolist():
+        assert cache.prime_count(x) == np.searchsorted(reference, x, side="right")
+    for x in [*reference[::997].tolist(), *(reference[::997] + 1).tolist()]:
+        assert cache.is_prime(x) == (x == 2 or x % 2 == 1)
+    window = cache.primes_in_range(12_345, 1_234_567)
+    assert np.array_equal(window, reference[(reference >= 12_345) & (reference < 1_234_567)])
+
+
+def test_evicts_least_recently_used(backend):
+    block = 10**5
+    # Room for about two blocks of ~9000 primes (8 bytes each)
+    cache = primes.PrimeCache(max_bytes=2 * 10_000 * 8, block=block)
+    for index in range(6):
+        cache.primes_in_range(index * block, index * block + 1)
+        assert cache.nbytes <= cache.max_bytes
+    assert cache.nbytes > 0
+    # Answers stay right after the blocks they came from were evicted
+    assert cache.nth_prime(1) == 2
+    assert cache.prime_count(10**5) == 9592
+    assert cache.prime_count(6 * 10**5 - 1) == primes.prime_count(6 * 10**5 - 1)
+
+    cache.clear()
+    assert cache.nbytes == 0
+
+
+def test_keeps_one_block_when_over_budget(backend):
+    cache = primes.PrimeCache(max_bytes=0, block=10**4)
+    assert cache.nth_prime(5000) == primes.nth_prime(5000)
+    assert cache.nbytes > 0
+    assert cache.nth_prime(5001) == primes.nth_prime(5001)
+
+
+def test_shared_across_threads(backend):
+    cache = primes.PrimeCache(max_bytes=4 * 10**5, block=10**5)
+    N = np.random.default_rng(12).integers(1, 2 * 10**5, size=400).tolist()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(cache.nth_prime, N))
+
+    assert results == [primes.nth_prime(n) for n in N]
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_save_and_load(backend, tmp_path, reference):
+    primes.PrimeCache().save(tmp_path / "table", 10**6)
+
+    cache = primes.PrimeCache.load(tmp_path / "table")
+
+    assert cache.limit == 10**6
+    assert cache.nbytes == 0
+    assert cache.nth_prime(78498) == 999983
+    assert cache.prime_count(999_999) == 78498
+    assert cache.is_prime(999983) and not cache.is_prime(999981)
+    window = cache.primes_in_range(500_000, 600_000)
+    assert not window.flags.writeable
+    assert np.array_equal(window, reference[(reference >= 500_000) & (reference < 600_000)])
+    # Past the table the cache sieves as usual
+    assert cache.nth_prime(78499) == 1000003
+    assert cache.prime_count(1_500_000) == np.searchsorted(reference, 1_500_000, side="right")
+
+
+def test_load_in_memory_is_read_only(backend, tmp_path):
+    primes.PrimeCache().save(tmp_path / "table.npy", 1000)
+    cache = primes.PrimeCache.load(tmp_path / "table", mmap_mode=None)
+    view = cache.primes_in_range(0, 1000)
+    assert view.size == 168
+    with pytest.raises(ValueError):
+        view[0] = 0
+
+
+def test_load_rejects_mismatched_table(tmp_path):
+    primes.PrimeCache().save(tmp_path / "table", 1000)
+    (tmp_path / "table.json").write_text('{"limit": 1000, "count": 200}')
+    with pytest.raises(ValueError, match="expected 200 uint64 primes"):
+        primes.PrimeCache.load(tmp_path / "table")
+
+
+def test_validation():
+    with pytest.raises(ValueError, match="max_bytes must be"):
+        primes.PrimeCache(max_bytes=-1)
+    with pytest.raises(ValueError, match="block must be"):
+        primes.PrimeCache(block=0)
+    with pytest.raises(ValueError, match="N must be"):
+        primes.PrimeCache().nth_prime(0)
+
+
+def test_default_cache():
+    previous = primes.default_cache()
+    try:
+        cache = primes.PrimeCache(max_bytes=0)
+        primes.set_default_cache(cache)
+        assert primes.default_cache() is cache
+    finally:
+        primes.set_default_cache(previous)
@@ -0,0 +1,55 @@
+# =========================
+# tests/test_compare.py
+# =========================
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import pytest
+
+COMPARE = Path(__file__).resolve().parents[1] / "benchmarks" / "compare.py"
+
+
+def _run(backend="cpp", machine="x86_64", cpu_count=8, median=1.0, iqr=0.01):
+    return {
+        "meta": {"backend": backend, "machine": machine, "cpu_count": cpu_count, "commit": "abc"},
+        "results": [
+            {"kernel": "nth_prime", "n": 10**6, "threads": 1, "median": median, "iqr": iqr}
+        ],
+    }
+
+
+def _compare(tmp_path, baseline, new):
+    (tmp_path / "baseline.json").write_text(json.dumps(baseline))
+    (tmp_path / "new.json").write_text(json.dumps(new))
+    return subprocess.run(
+        [sys.executable, str(COMPARE), str(tmp_path / "baseline.json"), str(tmp_path / "new.json")],
+        capture_output=True,
+        text=True,
+    )
+
+
+@pytest.mark.parametrize(
+    "median, status",
+    [(1.0, 0), (1.05, 0), (0.5, 0), (1.5, 1)],
+)
+def test_exit_status(tmp_path, median, status):
+    assert _compare(tmp_path, _run(), _run(median=median)).returncode == status
+
+
+def test_noise_is_not_a_regression(tmp_path):
+    assert _compare(tmp_path, _run(iqr=0.6), _run(median=1.5)).returncode == 0
+
+
+@pytest.mark.parametrize(
+    "field, value",
+    [("backend", "numpy"), ("machine", "arm64"), ("cpu_count", 4)],
+)
+def test_refuses_mismatched_runs(tmp_path, field, value):
+    result = _compare(tmp_path, _run(), _run(**{field: value}))
+    assert result.returncode == 2
+    assert "not comparable" in result.stderr and field in result.stderr
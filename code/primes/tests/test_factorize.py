@@ -0,0 +1,53 @@
+# =========================
+# tests/test_factorize.py
+# =========================
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+import primes
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (1, []),
+        (2, [2]),
+        (12, [2, 2, 3]),
+        (2**63, [2] * 63),
+        (18446744073709551557, [18446744073709551557]),
+        ((2**31 - 1) * (2**31 - 1), [2**31 - 1, 2**31 - 1]),
+        (3825123056546413051, [149491, 747451, 34233211]),
+    ],
+)
+def test_known_factorizations(backend, value, expected):
+    assert list(primes.factorize(value)) == expected
+
+
+def test_random_values(backend):
+    values = np.random.default_rng(4).integers(1, 2**63, size=100, dtype=np.uint64)
+    for value in values.tolist():
+        factors = [int(f) for f in primes.factorize(value)]
+        assert math.prod(factors) == value
+        assert factors == sorted(factors)
+        assert all(primes.is_prime(f) for f in factors)
+
+
+def test_array_is_zero_padded(backend):
+    result = primes.factorize(np.array([[12, 7], [1, 1024]]))
+    assert result.shape == (2, 2, 10)
+    assert result[0, 0, :3].tolist() == [2, 2, 3]
+    assert result[0, 1, :1].tolist() == [7]
+    assert not result[1, 0].any()
+    assert result[1, 1].tolist() == [2] * 10
+    assert not result[0, 0, 3:].any()
+
+
+def test_rejects_zero(backend):
+    with pytest.raises(ValueError, match="factorize requires value >= 1"):
+        primes.factorize(0)
+    with pytest.raises(ValueError, match="factorize requires value >= 1"):
+        primes.factorize(np.array([0, 3]))
@@ -0,0 +1,46 @@
+# =========================
+# tests/test_is_prime.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def test_matches_reference(backend, reference):
+    values = np.arange(100_000, dtype=np.uint64)
+    expected = np.isin(values, reference)
+    assert np.array_equal(primes.is_prime(values), expected)
+    assert [primes.is_prime(int(v)) for v in values[:500]] == expected[:500].tolist()
+
+
+def test_window_above_32_bits(backend, sieve):
+    lo = 2**40
+    values = np.arange(lo, lo + 20_000, dtype=np.uint64)
+    assert np.array_equal(primes.is_prime(values), np.isin(values, sieve(lo, lo + 20_000)))
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (2**61 - 1, True),  # Mersenne prime
+        (18446744073709551557, True),  # largest 64-bit prime
+        (2**64 - 1, False),
+        (561, False),  # Carmichael number
+        (3215031751, False),  # strong pseudoprime to bases 2, 3, 5, 7
+        (3825123056546413051, False),  # strong pseudoprime to bases 2 .. 23
+        ((2**31 - 1) * (2**31 - 1), False),
+    ],
+)
+def test_hard_cases(backend, value, expected):
+    assert primes.is_prime(value) is expected
+    assert primes.is_prime(np.array([value], dtype=np.uint64))[0] == expected
+
+
+def test_array_shape_and_signed_input(backend):
+    values = np.array([[-7, -2, 0], [2, 3, 4]], dtype=np.int64)
+    result = primes.is_prime(values)
+    assert result.dtype == bool
+    assert np.array_equal(result, [[False, False, False], [True, True, False]])
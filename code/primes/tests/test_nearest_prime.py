@@ -0,0 +1,50 @@
+# =========================
+# tests/test_nearest_prime.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def test_next_prime_matches_reference(backend, reference):
+    values = np.random.default_rng(2).integers(0, 10**6, size=300).astype(np.uint64)
+    expected = reference[np.searchsorted(reference, values, side="right")]
+    assert np.array_equal(primes.next_prime(values), expected)
+    assert [primes.next_prime(int(v)) for v in values[:50]] == expected[:50].tolist()
+
+
+def test_prev_prime_matches_reference(backend, reference):
+    values = np.random.default_rng(3).integers(3, 10**6, size=300).astype(np.uint64)
+    expected = reference[np.searchsorted(reference, values, side="left") - 1]
+    assert np.array_equal(primes.prev_prime(values), expected)
+    assert [primes.prev_prime(int(v)) for v in values[:50]] == expected[:50].tolist()
+
+
+def test_strictly_beyond_value(backend):
+    assert primes.next_prime(0) == 2
+    assert primes.next_prime(2) == 3
+    assert primes.prev_prime(3) == 2
+    assert primes.next_prime(10**12) == 1000000000039
+    assert primes.prev_prime(10**12) == 999999999989
+
+
+def test_large_gap(backend):
+    # 1693182318746371 is followed by the first prime gap of 1132
+    p = 1693182318746371
+    assert primes.next_prime(p) == p + 1132
+    assert primes.prev_prime(p + 1132) == p
+    assert primes.next_prime(np.array([[p, p + 1]], dtype=np.uint64)).tolist() == [[p + 1132] * 2]
+
+
+def test_errors(backend):
+    with pytest.raises(ValueError, match="no prime below value"):
+        primes.prev_prime(2)
+    with pytest.raises(ValueError, match="no prime below value"):
+        primes.prev_prime(np.array([2, 5]))
+    with pytest.raises(OverflowError, match="no 64-bit prime after value"):
+        primes.next_prime(18446744073709551557)
+    with pytest.raises(ValueError, match="values must be >= 0"):
+        primes.next_prime(np.array([-1]))
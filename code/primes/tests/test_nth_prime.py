@@ -0,0 +1,57 @@
+# =========================
+# tests/test_nth_prime.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def test_scalar_matches_reference(backend, reference):
+    for n in [1, 2, 3, 5, 6, 10, 1000, reference.size]:
+        assert primes.nth_prime(n) == reference[n - 1]
+
+
+@pytest.mark.parametrize(
+    "n, expected",
+    [(10**6, 15485863), (10**7, 179424673), (10**9, 22801763489)],
+)
+def test_known_values(backend, n, expected):
+    assert primes.nth_prime(n) == expected
+
+
+@pytest.mark.parametrize("shape", [(0,), (37,), (4, 5), (2, 3, 2)])
+def test_array_keeps_shape_and_order(backend, reference, shape):
+    rng = np.random.default_rng(5)
+    N = rng.integers(1, reference.size + 1, size=shape)
+
+    result = primes.nth_prime(N)
+
+    assert result.dtype == np.uint64
+    assert result.shape == shape
+    assert np.array_equal(result, reference[N - 1])
+
+
+def test_array_with_repeats_and_unsorted_input(backend, reference):
+    N = np.array([5000, 1, 5000, 2, 100_000, 1], dtype=np.uint64)
+    assert np.array_equal(primes.nth_prime(N), reference[N.astype(np.int64) - 1])
+
+
+def test_array_of_sparse_large_indices(backend):
+    N = np.array([10**7, 3, 10**6])
+    assert primes.nth_prime(N).tolist() == [179424673, 5, 15485863]
+
+
+@pytest.mark.parametrize("threads", [2, 3, 0, 64])
+def test_array_threads_do_not_change_results(backend, threads):
+    N = np.random.default_rng(8).integers(1, 5 * 10**6, size=200)
+    assert np.array_equal(primes.nth_prime(N, threads=threads), primes.nth_prime(N))
+
+
+def test_rejects_zero(backend):
+    with pytest.raises(ValueError, match="N must be >= 1"):
+        primes.nth_prime(0)
+    with pytest.raises(ValueError, match="N must be >= 1"):
+        primes.nth_prime(np.array([0, 3]))
@@ -0,0 +1,35 @@
+# =========================
+# tests/test_prime_count.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def test_matches_reference(backend, reference):
+    rng = np.random.default_rng(1)
+    for x in [0, 1, 2, 3, 4, 100, 1_999_999, *rng.integers(0, 2 * 10**6, size=50).tolist()]:
+        assert primes.prime_count(x) == np.searchsorted(reference, x, side="right")
+
+
+@pytest.mark.parametrize(
+    "x, expected",
+    [(10**6, 78498), (10**7, 664579), (10**8, 5761455), (10**9, 50847534)],
+)
+def test_known_values(backend, x, expected):
+    assert primes.prime_count(x) == expected
+
+
+def test_agrees_with_sieve(backend, sieve):
+    x = 10**9 + 10**6
+    assert primes.prime_count(x) == 50847534 + sieve(10**9 + 1, x + 1).size
+
+
+@pytest.mark.parametrize("threads", [2, 3, 0])
+def test_threads_do_not_change_results(backend, threads):
+    # Large enough that the rough list splits into several chunks per sieving prime
+    x = 2 * 10**10 + 7
+    assert primes.prime_count(x, threads=threads) == primes.prime_count(x)
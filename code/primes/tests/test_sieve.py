@@ -0,0 +1,44 @@
+# =========================
+# tests/test_sieve.py
+# =========================
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+import primes
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 10, 97, 100, 65_536, 1_999_999])
+def test_primes_up_to(backend, reference, n):
+    result = primes.primes_up_to(n)
+    assert result.dtype == np.uint64
+    assert np.array_equal(result, reference[reference <= n])
+
+
+@pytest.mark.parametrize(
+    "lo, hi",
+    [
+        (0, 0),
+        (10, 5),
+        (0, 2),
+        (2, 3),
+        (1_000, 1_000_000),
+        (999_983, 999_984),  # a window holding exactly one prime
+        (10**12, 10**12 + 10**6),
+        (2**32 - 10**5, 2**32 + 10**5),  # across the 32-bit boundary
+        (2**48, 2**48 + 5 * 10**4),
+    ],
+)
+def test_primes_in_range(backend, sieve, lo, hi):
+    assert np.array_equal(primes.primes_in_range(lo, hi), sieve(lo, hi))
+
+
+def test_primes_in_range_spans_segments(backend, sieve):
+    # Long enough to cover several cache-sized segments of the segmented sieve
+    lo = 10**10 + 3
+    assert np.array_equal(primes.primes_in_range(lo, lo + 4 * 10**6), sieve(lo, lo + 4 * 10**6))
+
+
+def test_known_window(backend):
+    assert primes.primes_in_range(10**12, 10**12 + 10**6).size == 36249
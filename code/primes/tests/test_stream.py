@@ -0,0 +1,54 @@
+# =========================
+# tests/test_stream.py
+# =========================
+from __future__ import annotations
+
+import itertools
+import threading
+
+import numpy as np
+
+import primes
+
+
+def test_iter_primes_unbounded(backend, reference):
+    first = list(itertools.islice(primes.iter_primes(), 100_000))
+    assert first == reference[:100_000].tolist()
+
+
+def test_iter_primes_window(backend, sieve):
+    lo = 10**12 - 10**5
+    assert list(primes.iter_primes(lo, lo + 2 * 10**5)) == sieve(lo, lo + 2 * 10**5).tolist()
+
+
+def test_chunks_concatenate_to_range(backend, sieve):
+    lo, hi = 3 * 10**9 + 1, 3 * 10**9 + 5 * 10**6
+    chunks = list(primes.iter_prime_chunks(lo, hi))
+    assert len(chunks) > 1
+    assert max(chunk.size for chunk in chunks) < 10**5  # one cache-sized segment each
+    assert all(chunk.dtype == np.uint64 for chunk in chunks)
+    assert np.array_equal(np.concatenate(chunks), sieve(lo, hi))
+
+
+def test_empty_range(backend):
+    assert list(primes.iter_primes(100, 100)) == []
+    assert list(primes.iter_primes(24, 29)) == []
+
+
+def test_shared_iterator_across_threads(backend):
+    # Every prime is handed out exactly once when threads pull from one iterator
+    generator = primes.iter_prime_chunks(0, 2 * 10**7)
+    collected: list[list[np.ndarray]] = [[] for _ in range(4)]
+
+    def drain(i):
+        for chunk in generator:
+            collected[i].append(chunk)
+
+    threads = [threading.Thread(target=drain, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    result = np.sort(np.concatenate([c for part in collected for c in part]))
+    assert np.array_equal(result, primes.primes_up_to(2 * 10**7 - 1))
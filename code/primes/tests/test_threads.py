@@ -0,0 +1,51 @@
+# =========================
+# tests/test_threads.py
+# =========================
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import primes
+
+
+def test_concurrent_calls(backend):
+    # The compiled kernels release the GIL; overlapping calls must not interfere
+    windows = [(10**12 + i * 10**5, 10**12 + (i + 1) * 10**5) for i in range(16)]
+    expected = [primes.primes_in_range(lo, hi) for lo, hi in windows]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda window: primes.primes_in_range(*window), windows))
+        counts = list(pool.map(primes.prime_count, [10**7] * 8))
+
+    assert all(np.array_equal(a, b) for a, b in zip(results, expected))
+    assert counts == [664579] * 8
+
+
+def test_concurrent_array_calls(backend):
+    values = np.random.default_rng(10).integers(2, 2**62, size=(8, 200), dtype=np.uint64)
+    expected = [primes.is_prime(row) for row in values]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(primes.is_prime, values))
+
+    assert all(np.array_equal(a, b) for a, b in zip(results, expected))
+
+
+@pytest.mark.parametrize(
+    "kernel, arguments",
+    [
+        ("nth_prime", (3 * 10**6,)),
+        ("prime_count", (5 * 10**7,)),
+        ("primes_up_to", (5 * 10**6,)),
+        ("primes_in_range", (10**11, 10**11 + 3 * 10**6)),
+        ("is_prime", (np.arange(10**12, 10**12 + 2 * 10**5, dtype=np.uint64),)),
+    ],
+)
+def test_threads_argument(backend, kernel, arguments):
+    function = getattr(primes, kernel)
+    expected = function(*arguments)
+    for threads in (1, 2, 4, 0):
+        assert np.array_equal(function(*arguments, threads=threads), expected)